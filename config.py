@@ -30,6 +30,22 @@ class Settings(BaseSettings):
     redis_url: str
     user_session_string: str
 
+    # Статистика
+    statistics_max_concurrency: int = 5  # одновременных запросов к Supabase
+    statistics_refresh_debounce_seconds: int = 30  # не чаще одного обновления сообщения
+    statistics_range_cache_ttl_seconds: int = 300  # кэш /stats по периоду
+
+    # Очистка группы
+    purge_rate_per_second: float = 20  # ban/unban в секунду на весь бот
+    purge_concurrency: int = 8  # одновременных запросов
+
+    # Video Chat
+    attendance_flush_interval_seconds: float = 0.5  # как часто писать посещения пачкой
+    attendance_batch_size: int = 200  # событий в одной пачке
+    video_chat_reconcile_interval_seconds: int = 60  # сверка со списком участниц звонка
+    video_chat_dashboard_edit_interval_seconds: float = 5  # не чаще одной правки живого сообщения
+    raw_update_record_path: str | None = None  # писать updates звонка в файл (scripts/benchmarks/video_chat_replay.py)
+
     class Config:
         env_file = BASE_DIR / ".env"
         case_sensitive = False
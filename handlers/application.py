@@ -18,6 +18,7 @@ from keyboards.application import (
 from repositories.application_repository import ApplicationRepository
 from repositories.invite_link_repository import InviteLinkRepository
 from repositories.member_repository import MemberRepository
+from services.statistics_counter_service import StatisticsCounterService
 from states import ApplicationStates
 from templates import (
     ApplicationInstructionsTemplates,
@@ -40,6 +41,7 @@ from utils.validators import (
     is_valid_weight,
     is_valid_cesarean,
 )
+from utils.time import get_tashkent_now
 
 logger = logging.getLogger(__name__)
 router = Router()
@@ -272,6 +274,7 @@ async def on_age_received(
         message: Message,
         state: FSMContext,
         application_repository: ApplicationRepository,
+        statistics_counter_service: StatisticsCounterService,
 ) -> None:
     """Девушка ввела возраст."""
 
@@ -284,14 +287,18 @@ async def on_age_received(
     if error == "too_young":
         await message.answer(AgeTemplates.age_too_young())
         await state.update_data(age=age)
-        await save_rejected_application(state, application_repository, f"age={age}")
+        await save_rejected_application(
+            state, application_repository, statistics_counter_service, f"age={age}"
+        )
         await state.clear()
         return
 
     if error == "too_old":
         await message.answer(AgeTemplates.age_too_old())
         await state.update_data(age=age)
-        await save_rejected_application(state, application_repository, f"age={age}")
+        await save_rejected_application(
+            state, application_repository, statistics_counter_service, f"age={age}"
+        )
         await state.clear()
         return
 
@@ -386,6 +393,7 @@ async def on_children_selected(
         callback: CallbackQuery,
         state: FSMContext,
         application_repository: ApplicationRepository,
+        statistics_counter_service: StatisticsCounterService,
 ) -> None:
     """Девушка выбрала количество детей."""
 
@@ -398,7 +406,9 @@ async def on_children_selected(
     if value == "0":
         await callback.message.answer(ChildrenTemplates.no_children_rejected())
         await state.update_data(children="0")
-        await save_rejected_application(state, application_repository, "no_children")
+        await save_rejected_application(
+            state, application_repository, statistics_counter_service, "no_children"
+        )
         await state.clear()
         return
 
@@ -434,6 +444,7 @@ async def on_cesarean_selected(
         callback: CallbackQuery,
         state: FSMContext,
         application_repository: ApplicationRepository,
+        statistics_counter_service: StatisticsCounterService,
 ) -> None:
     """Девушка выбрала количество кесаревых."""
 
@@ -447,7 +458,9 @@ async def on_cesarean_selected(
     if error == "too_many":
         await callback.message.answer(CesareanTemplates.cesarean_too_many())
         await state.update_data(cesarean=cesarean)
-        await save_rejected_application(state, application_repository, f"cesarean={cesarean}")
+        await save_rejected_application(
+            state, application_repository, statistics_counter_service, f"cesarean={cesarean}"
+        )
         await state.clear()
         return
 
@@ -508,6 +521,7 @@ async def on_application_confirmed(
         callback: CallbackQuery,
         state: FSMContext,
         application_repository: ApplicationRepository,
+        statistics_counter_service: StatisticsCounterService,
 ) -> None:
     """Девушка подтвердила анкету."""
 
@@ -548,6 +562,12 @@ async def on_application_confirmed(
         status="completed",
     )
 
+    await statistics_counter_service.record_application(
+        manager_id=data["manager_id"],
+        status="completed",
+        created_at=get_tashkent_now()
+    )
+
     logger.info(f"Application saved: member_id={data['member_id']}")
 
     await callback.message.answer(ConfirmationTemplates.application_saved())
@@ -721,6 +741,7 @@ async def resume_application(
 async def save_rejected_application(
         state: FSMContext,
         application_repository: ApplicationRepository,
+        statistics_counter_service: StatisticsCounterService,
         reason: str,
 ) -> None:
     """Сохраняет rejected анкету с теми данными, которые успели ввести."""
@@ -743,4 +764,12 @@ async def save_rejected_application(
         status="rejected",
     )
 
+    # FSM могли сбросить до того, как стал известен менеджер
+    if data.get("manager_id") is not None:
+        await statistics_counter_service.record_application(
+            manager_id=data["manager_id"],
+            status="rejected",
+            created_at=get_tashkent_now()
+        )
+
     logger.info(f"Application rejected ({reason}): member_id={data.get('member_id')}")
@@ -2,10 +2,14 @@
 import logging
 from aiogram import Router, F
 from aiogram.types import ChatMemberUpdated
+from redis.asyncio import Redis
 
 from config import get_settings
 from repositories.member_repository import MemberRepository
 from services.invite_link_service import InviteLinkService
+from services.member_lookup_service import MemberLookupService
+from services.statistics_counter_service import StatisticsCounterService
+from utils.time import get_week_start
 
 logger = logging.getLogger(__name__)
 router = Router()
@@ -20,7 +24,9 @@ settings = get_settings()
 async def on_member_joined(
         event: ChatMemberUpdated,
         invite_link_service: InviteLinkService,
-        member_repository: MemberRepository
+        member_repository: MemberRepository,
+        redis: Redis,
+        statistics_counter_service: StatisticsCounterService
 ) -> None:
     """Девушка вошла в группу по invite-ссылке."""
 
@@ -42,7 +48,19 @@ async def on_member_joined(
         first_name=user.first_name,
         last_name=user.last_name,
         username=user.username,
-        invite_link_id=invite_link.id
+        invite_link_id=invite_link.id,
+        cohort_week=get_week_start(event.date)
+    )
+
+    # 4. Сбросить в кэше consumer'а Video Chat (там могла быть
+    # отрицательная запись)
+    await MemberLookupService.publish_invalidation(redis, member.telegram_id)
+
+    # 5. Обновить счётчики статистики
+    await statistics_counter_service.record_member_joined(
+        member_id=member.id,
+        manager_id=invite_link.manager_id,
+        joined_at=member.joined_at
     )
 
     logger.info(f"New member joined: {user.first_name} (id={member.id})")
\ No newline at end of file
@@ -0,0 +1,52 @@
+from aiogram import Router
+from aiogram.filters import Command, CommandObject, StateFilter
+from aiogram.types import Message
+
+from config import get_settings
+from services.meeting_timeline_service import MeetingTimelineService
+from services.statistics_range_service import StatisticsRangeService
+from templates import StatisticsTemplates
+from utils.time import get_tashkent_now, parse_meeting_date, parse_period
+
+router = Router()
+settings = get_settings()
+
+
+@router.message(Command("stats"), StateFilter("*"))
+async def stats_command(
+        message: Message,
+        command: CommandObject,
+        statistics_range_service: StatisticsRangeService
+) -> Message | None:
+    """Статистика за период: /stats [week|month|YYYY-MM-DD..YYYY-MM-DD]"""
+
+    if message.message_thread_id != settings.commands_thread_id:
+        return None
+
+    period = parse_period(command.args, get_tashkent_now())
+    if period is None:
+        return await message.reply(StatisticsTemplates.period_usage())
+
+    stats = await statistics_range_service.get_stats(*period)
+
+    return await message.reply(StatisticsTemplates.format_period_stats(stats))
+
+
+@router.message(Command("timeline"), StateFilter("*"))
+async def timeline_command(
+        message: Message,
+        command: CommandObject,
+        meeting_timeline_service: MeetingTimelineService
+) -> Message | None:
+    """Посещаемость встречи по минутам: /timeline [YYYY-MM-DD]"""
+
+    if message.message_thread_id != settings.commands_thread_id:
+        return None
+
+    meeting_date = parse_meeting_date(command.args, get_tashkent_now())
+    if meeting_date is None:
+        return await message.reply(StatisticsTemplates.timeline_usage())
+
+    timeline = await meeting_timeline_service.get(meeting_date)
+
+    return await message.reply(StatisticsTemplates.format_timeline(meeting_date, timeline))
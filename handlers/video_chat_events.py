@@ -1,79 +1,76 @@
 """Handler для отслеживания участников Video Chat."""
-import json
 import logging
 
-from pyrogram import ContinuePropagation
+from pyrogram import utils
 from pyrogram.raw.types import (
+    GroupCallDiscarded,
+    UpdateGroupCall,
     UpdateGroupCallParticipants,
 )
-from redis.asyncio import Redis
+from redis.exceptions import RedisError
 
-from repositories.member_repository import MemberRepository
-from repositories.video_chat_attendance_repository import VideoChatAttendanceRepository
-from services.video_chat_service import VideoChatService
+from services.active_video_chat import ActiveVideoChatTracker
+from services.video_chat_event_queue import PARTICIPANTS, VideoChatEvent, VideoChatEventQueue
+from services.video_chat_monitor import VideoChatMonitor
 from utils.time import get_tashkent_now
 
 logger = logging.getLogger(__name__)
 
 
-async def on_video_chat_participant(
-        update: UpdateGroupCallParticipants,
-        redis: Redis,
-        member_repository: MemberRepository,
-        attendance_repository: VideoChatAttendanceRepository
+async def on_group_call(
+        update: UpdateGroupCall,
+        group_id: int,
+        video_chat_monitor: VideoChatMonitor
 ) -> None:
-    """Обработка событий join/left в Video Chat."""
+    """Звонок в группе создан, изменился или завершён.
 
-    # DEBUG: Логируем ВСЕ raw updates
-    logger.info(f"Raw update received: {type(update).__name__}")
+    Создан/изменился — consumer прогреет кэш участниц. Приходит и когда
+    worker запланировал звонок, поэтому к началу встречи участницы уже
+    в памяти. Завершён — consumer закроет все открытые сессии.
+    """
+    if update.peer and utils.get_peer_id(update.peer) != group_id:
+        return
 
-    # 1. Это нужный тип события?
-    if not isinstance(update, UpdateGroupCallParticipants):
-        raise ContinuePropagation
+    if isinstance(update.call, GroupCallDiscarded):
+        await video_chat_monitor.announce_end(update.call.id)
+        return
 
-    logger.info(f"Video chat event: {update}")
+    await video_chat_monitor.announce_call(update.call.id)
 
-    # 2. Есть активный Video Chat в Redis?
-    video_chat_data = await redis.get(VideoChatService.REDIS_KEY)
-    if not video_chat_data:
-        raise ContinuePropagation
 
-    # 3. Это наш Video Chat?
-    parsed = json.loads(video_chat_data)
-    if update.call.id != parsed.get("call_id"):  # type: ignore[union-attr]
-        raise ContinuePropagation
+async def on_video_chat_participant(
+        update: UpdateGroupCallParticipants,
+        active_video_chat: ActiveVideoChatTracker,
+        video_chat_event_queue: VideoChatEventQueue
+) -> None:
+    """События join/left в Video Chat — в очередь для consumer'а.
 
-    # 4. Обрабатываем каждого участника
-    now = get_tashkent_now()
-    today = now.date()
+    Вызывается через RawUpdateDispatcher только для
+    UpdateGroupCallParticipants. В БД не ходит: участниц ищет и
+    сессии пишет workers/video_chat_consumer.py. Сам update не
+    логируется: бот работает с DEBUG, и repr сотен участниц строился бы
+    на каждом событии — в лог идут только счётчики join/left.
+    """
 
-    for participant in update.participants:  # type: ignore[union-attr]
-        # Получаем telegram_id из peer
-        telegram_id = participant.peer.user_id  # type: ignore[union-attr]
+    # 1. Это наш активный Video Chat? (звонок хранится в памяти)
+    if not active_video_chat.is_active(update.call.id):  # type: ignore[union-attr]
+        return
 
-        # Ищем member в БД
-        member = await member_repository.get_by_telegram_id(telegram_id)
-        if not member:
-            # Не наша участница (возможно админ) — игнорируем
-            logger.debug(f"Unknown user {telegram_id}, skipping")
-            continue
-
-        # Join
+    # 2. Только Telegram ID и время приёма
+    event = VideoChatEvent(kind=PARTICIPANTS, call_id=update.call.id, at=get_tashkent_now())  # type: ignore[union-attr]
+    for participant in update.participants:  # type: ignore[union-attr]
         if participant.just_joined:  # type: ignore[union-attr]
-            await attendance_repository.create(
-                member_id=member.id,
-                meeting_date=today,
-                joined_at=now
-            )
-            logger.debug(f"Member {member.id} joined video chat")
-
-        # Left
+            event.joined.append(participant.peer.user_id)  # type: ignore[union-attr]
         elif participant.left:  # type: ignore[union-attr]
-            await attendance_repository.update_left_at(
-                member_id=member.id,
-                meeting_date=today,
-                left_at=now
-            )
-            logger.debug(f"Member {member.id} left video chat")
-
-    raise ContinuePropagation
\ No newline at end of file
+            event.left.append(participant.peer.user_id)  # type: ignore[union-attr]
+
+    if not (event.joined or event.left):
+        return
+
+    logger.debug("Video chat event: %d joined, %d left", len(event.joined), len(event.left))
+
+    # 3. В очередь — одна запись на update
+    try:
+        await video_chat_event_queue.publish(event)
+    except RedisError as e:
+        logger.error("Failed to queue video chat event: %s", e)
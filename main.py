@@ -2,15 +2,16 @@ import asyncio
 import logging
 import colorlog
 from contextlib import asynccontextmanager
+from functools import partial
 
 from aiogram import Bot, Dispatcher
 from supabase import acreate_client, AsyncClient
 from pyrogram import Client
+from pyrogram.raw.types import UpdateGroupCall, UpdateGroupCallParticipants
 from redis.asyncio import from_url as redis_from_url
 
 from middlewares.commands import CommandsMiddleware
-from repositories.video_chat_attendance_repository import VideoChatAttendanceRepository
-from handlers.video_chat_events import on_video_chat_participant
+from handlers.video_chat_events import on_group_call, on_video_chat_participant
 from config import get_settings
 from repositories.command_message_repository import CommandMessageRepository
 from repositories.invite_link_repository import InviteLinkRepository
@@ -22,8 +23,23 @@ from handlers.application import router as application_router
 from handlers.member_joined import router as member_joined_router
 from handlers.clear import router as clear_router
 from handlers.add import router as add_router
+from handlers.stats import router as stats_router
 from handlers.service_messages import router as service_messages_router
+from services.active_video_chat import ActiveVideoChatTracker
 from services.invite_link_service import InviteLinkService
+from services.live_sessions import LiveSessionStore
+from services.meeting_timeline_service import MeetingTimelineService
+from services.redis_listener import RedisChannelListener
+from services.statistics_counter_service import StatisticsCounterService
+from services.statistics_range_service import StatisticsRangeService
+from services.statistics_service import StatisticsService
+from services.video_chat_event_queue import VideoChatEventQueue
+from services.video_chat_monitor import VideoChatMonitor
+from services.video_chat_service import VideoChatService
+from repositories.statistics_repository import StatisticsRepository
+from repositories.video_chat_attendance_repository import VideoChatAttendanceRepository
+from utils.raw_update_recorder import RawUpdateRecorder
+from utils.raw_updates import RawUpdateDispatcher
 
 handler = colorlog.StreamHandler()
 handler.setFormatter(colorlog.ColoredFormatter(
@@ -106,10 +122,13 @@ async def main():
         member_repository = MemberRepository(
             supabase=supabase,
         )
-        video_chat_attendance_repository = VideoChatAttendanceRepository(
+        application_repository = ApplicationRepository(
             supabase=supabase
         )
-        application_repository = ApplicationRepository(
+        statistics_repository = StatisticsRepository(
+            supabase=supabase
+        )
+        video_chat_attendance_repository = VideoChatAttendanceRepository(
             supabase=supabase
         )
 
@@ -125,24 +144,82 @@ async def main():
             invite_link_repository=invite_link_repository,
             group_id=settings.meeting_group_id
         )
+        statistics_counter_service = StatisticsCounterService(
+            redis=redis
+        )
+        active_video_chat = ActiveVideoChatTracker(
+            redis=redis
+        )
+        # События Video Chat: бот только кладёт их в очередь,
+        # обрабатывает workers/video_chat_consumer.py
+        video_chat_event_queue = VideoChatEventQueue(
+            redis=redis
+        )
+        video_chat_monitor = VideoChatMonitor(
+            client=userbot,
+            active_video_chat=active_video_chat,
+            event_queue=video_chat_event_queue,
+            interval=settings.video_chat_reconcile_interval_seconds
+        )
 
-        # Регистрируем handler для Video Chat событий
-        @userbot.on_raw_update()
-        async def video_chat_handler(client, update, users, chats):
-            logger.debug(f"RAW UPDATE: {type(update).__name__}")
-            await on_video_chat_participant(
-                update=update,
-                redis=redis,
-                member_repository=member_repository,
-                attendance_repository=video_chat_attendance_repository
+        # Worker сообщает о новом звонке (schedule_video_chat)
+        redis_listener = RedisChannelListener(redis=redis)
+        redis_listener.subscribe(
+            VideoChatService.CHANNEL,
+            active_video_chat.handle_update,
+            resync=active_video_chat.load
+        )
+        statistics_range_service = StatisticsRangeService(
+            redis=redis,
+            statistics_service=StatisticsService(
+                repository=statistics_repository,
+                max_concurrency=settings.statistics_max_concurrency
+            ),
+            ttl=settings.statistics_range_cache_ttl_seconds
+        )
+        meeting_timeline_service = MeetingTimelineService(
+            redis=redis,
+            repository=video_chat_attendance_repository,
+            live_sessions=LiveSessionStore(redis=redis)
+        )
+
+        # Регистрируем handler для Video Chat событий:
+        # остальные raw updates отбрасываются по типу, без логов
+        raw_update_dispatcher = RawUpdateDispatcher()
+        # Запись встречи для нагрузочных прогонов — до handler'ов
+        raw_update_recorder = None
+        if settings.raw_update_record_path:
+            raw_update_recorder = RawUpdateRecorder(settings.raw_update_record_path)
+            raw_update_dispatcher.route(UpdateGroupCall, raw_update_recorder.record)
+            raw_update_dispatcher.route(UpdateGroupCallParticipants, raw_update_recorder.record)
+        raw_update_dispatcher.route(
+            UpdateGroupCall,
+            partial(
+                on_group_call,
+                group_id=settings.meeting_group_id,
+                video_chat_monitor=video_chat_monitor
+            )
+        )
+        raw_update_dispatcher.route(
+            UpdateGroupCallParticipants,
+            partial(
+                on_video_chat_participant,
+                active_video_chat=active_video_chat,
+                video_chat_event_queue=video_chat_event_queue
             )
+        )
+        userbot.on_raw_update()(raw_update_dispatcher.dispatch)
 
         # 3. Передаём в dispatcher
         dp["command_message_service"] = command_message_service
         dp["invite_link_service"] = invite_link_service
         dp["member_repository"] = member_repository
+        dp["redis"] = redis
         dp["application_repository"] = application_repository
         dp["invite_link_repository"] = invite_link_repository
+        dp["statistics_counter_service"] = statistics_counter_service
+        dp["statistics_range_service"] = statistics_range_service
+        dp["meeting_timeline_service"] = meeting_timeline_service
 
         # 4. Подключаем middleware
         dp.message.outer_middleware(CommandsMiddleware(
@@ -154,16 +231,25 @@ async def main():
         dp.include_router(service_messages_router)
         dp.include_router(clear_router)
         dp.include_router(add_router)
+        dp.include_router(stats_router)
         dp.include_router(member_joined_router)
         dp.include_router(application_router)
 
         # 6. Запускаем polling
         logger.info("Bot is running. Press Ctrl+C to stop.")
         await userbot.start()
+        redis_listener.start()
+        video_chat_monitor.start()
         try:
             await dp.start_polling(bot, allowed_updates=["message", "chat_member", "callback_query"])
         finally:
+            await redis_listener.stop()
+            # Монитор опрашивает звонок через userbot — останавливаем до него
+            await video_chat_monitor.stop()
             await userbot.stop()
+            raw_update_dispatcher.log_stats()
+            if raw_update_recorder:
+                raw_update_recorder.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,89 @@
+-- Статистика по всем активным менеджерам за период одним запросом.
+--
+-- Возвращает по строке на менеджера:
+--   members_count          — сколько участниц привела за период
+--   video_count            — сколько из них было на видео (distinct)
+--   sessions_count         — количество завершённых сессий с длительностью > 0
+--   total_duration_seconds — суммарная длительность этих сессий
+--   completed_count / rejected_count — анкеты по статусу
+--
+-- p_start/p_end ограничивают joined_at участниц и created_at анкет,
+-- p_meeting_start/p_meeting_end — meeting_date посещений (даты по Ташкенту).
+
+create or replace function meeting.get_weekly_statistics(
+    p_start timestamptz,
+    p_end timestamptz,
+    p_meeting_start date,
+    p_meeting_end date
+)
+returns table (
+    manager_id bigint,
+    manager_name text,
+    members_count bigint,
+    video_count bigint,
+    sessions_count bigint,
+    total_duration_seconds double precision,
+    completed_count bigint,
+    rejected_count bigint
+)
+language sql
+stable
+as $$
+    with period_members as (
+        select mb.id, il.manager_id
+        from meeting.members mb
+        join meeting.invite_links il on il.id = mb.invite_link_id
+        where mb.joined_at between p_start and p_end
+    ),
+    sessions as (
+        select
+            pm.manager_id,
+            a.member_id,
+            extract(epoch from (a.left_at - a.joined_at)) as duration_seconds
+        from meeting.video_chat_attendance a
+        join period_members pm on pm.id = a.member_id
+        where a.meeting_date between p_meeting_start and p_meeting_end
+    ),
+    members_agg as (
+        select pm.manager_id, count(*) as members_count
+        from period_members pm
+        group by pm.manager_id
+    ),
+    video_agg as (
+        select
+            s.manager_id,
+            count(distinct s.member_id) as video_count,
+            count(*) filter (where s.duration_seconds > 0) as sessions_count,
+            coalesce(sum(s.duration_seconds) filter (where s.duration_seconds > 0), 0)
+                as total_duration_seconds
+        from sessions s
+        group by s.manager_id
+    ),
+    applications_agg as (
+        select
+            ap.manager_id,
+            count(*) filter (where ap.status = 'completed') as completed_count,
+            count(*) filter (where ap.status = 'rejected') as rejected_count
+        from meeting.applications ap
+        where ap.created_at between p_start and p_end
+        group by ap.manager_id
+    )
+    select
+        m.id as manager_id,
+        m.name as manager_name,
+        coalesce(ma.members_count, 0) as members_count,
+        coalesce(va.video_count, 0) as video_count,
+        coalesce(va.sessions_count, 0) as sessions_count,
+        coalesce(va.total_duration_seconds, 0) as total_duration_seconds,
+        coalesce(aa.completed_count, 0) as completed_count,
+        coalesce(aa.rejected_count, 0) as rejected_count
+    from public.managers m
+    left join members_agg ma on ma.manager_id = m.id
+    left join video_agg va on va.manager_id = m.id
+    left join applications_agg aa on aa.manager_id = m.id
+    where m.is_active
+    order by m.id;
+$$;
+
+grant execute on function meeting.get_weekly_statistics(timestamptz, timestamptz, date, date)
+    to anon, authenticated, service_role;
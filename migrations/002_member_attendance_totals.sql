@@ -0,0 +1,131 @@
+-- Время на видео считается по участницам, а не по сессиям.
+--
+-- Переподключения одной участницы (пересекающиеся и смежные интервалы)
+-- склеиваются в одно присутствие. Вместо sessions_count функция теперь
+-- возвращает timed_members_count — сколько участниц провели на видео > 0,
+-- а total_duration_seconds — сумму склеенного времени этих участниц.
+--
+-- Тип результата поменялся, поэтому функция пересоздаётся.
+
+drop function if exists meeting.get_weekly_statistics(timestamptz, timestamptz, date, date);
+
+create function meeting.get_weekly_statistics(
+    p_start timestamptz,
+    p_end timestamptz,
+    p_meeting_start date,
+    p_meeting_end date
+)
+returns table (
+    manager_id bigint,
+    manager_name text,
+    members_count bigint,
+    video_count bigint,
+    timed_members_count bigint,
+    total_duration_seconds double precision,
+    completed_count bigint,
+    rejected_count bigint
+)
+language sql
+stable
+as $$
+    with period_members as (
+        select mb.id, il.manager_id
+        from meeting.members mb
+        join meeting.invite_links il on il.id = mb.invite_link_id
+        where mb.joined_at between p_start and p_end
+    ),
+    attendance as (
+        select pm.manager_id, a.member_id, a.joined_at, a.left_at
+        from meeting.video_chat_attendance a
+        join period_members pm on pm.id = a.member_id
+        where a.meeting_date between p_meeting_start and p_meeting_end
+    ),
+    -- Докуда участница уже «досидела» до начала текущей сессии
+    closed_sessions as (
+        select
+            att.manager_id,
+            att.member_id,
+            att.joined_at,
+            att.left_at,
+            max(att.left_at) over (
+                partition by att.member_id
+                order by att.joined_at, att.left_at
+                rows between unbounded preceding and 1 preceding
+            ) as prev_reach
+        from attendance att
+        where att.left_at > att.joined_at
+    ),
+    -- Новый остров — если сессия начинается после всех предыдущих
+    islands as (
+        select
+            cs.*,
+            count(*) filter (
+                where cs.prev_reach is null or cs.joined_at > cs.prev_reach
+            ) over (
+                partition by cs.member_id
+                order by cs.joined_at, cs.left_at
+            ) as island
+        from closed_sessions cs
+    ),
+    member_totals as (
+        select
+            m.manager_id,
+            m.member_id,
+            sum(m.duration_seconds) as duration_seconds
+        from (
+            select
+                i.manager_id,
+                i.member_id,
+                extract(epoch from (max(i.left_at) - min(i.joined_at))) as duration_seconds
+            from islands i
+            group by i.manager_id, i.member_id, i.island
+        ) m
+        group by m.manager_id, m.member_id
+    ),
+    members_agg as (
+        select pm.manager_id, count(*) as members_count
+        from period_members pm
+        group by pm.manager_id
+    ),
+    video_agg as (
+        select att.manager_id, count(distinct att.member_id) as video_count
+        from attendance att
+        group by att.manager_id
+    ),
+    duration_agg as (
+        select
+            mt.manager_id,
+            count(*) as timed_members_count,
+            sum(mt.duration_seconds)::double precision as total_duration_seconds
+        from member_totals mt
+        group by mt.manager_id
+    ),
+    applications_agg as (
+        select
+            ap.manager_id,
+            count(*) filter (where ap.status = 'completed') as completed_count,
+            count(*) filter (where ap.status = 'rejected') as rejected_count
+        from meeting.applications ap
+        where ap.created_at between p_start and p_end
+        group by ap.manager_id
+    )
+    select
+        m.id as manager_id,
+        m.name as manager_name,
+        coalesce(ma.members_count, 0) as members_count,
+        coalesce(va.video_count, 0) as video_count,
+        coalesce(da.timed_members_count, 0) as timed_members_count,
+        coalesce(da.total_duration_seconds, 0) as total_duration_seconds,
+        coalesce(aa.completed_count, 0) as completed_count,
+        coalesce(aa.rejected_count, 0) as rejected_count
+    from public.managers m
+    left join members_agg ma on ma.manager_id = m.id
+    left join video_agg va on va.manager_id = m.id
+    left join duration_agg da on da.manager_id = m.id
+    left join applications_agg aa on aa.manager_id = m.id
+    where m.is_active
+    order by m.id;
+$$;
+
+grant execute on function meeting.get_weekly_statistics(timestamptz, timestamptz, date, date)
+    to anon, authenticated, service_role;
@@ -0,0 +1,210 @@
+-- Дневные агрегаты статистики по менеджерам.
+--
+-- Одна строка на (день, менеджер), день — дата по Ташкенту:
+--   members_count          — участницы, пришедшие в группу в этот день
+--   video_count            — сколько из них было на видео в неделю прихода
+--   timed_members_count    — сколько из них провели на видео > 0
+--   total_duration_seconds — их склеенное время на видео (см. 002)
+--   completed_count / rejected_count — анкеты, созданные в этот день
+--
+-- Видео привязано к дню прихода участницы (когорте), поэтому строки
+-- можно просто суммировать за любой период: неделя, месяц, год.
+-- Для недели Пн-Вс сумма совпадает с meeting.get_weekly_statistics.
+--
+-- Таблицу поддерживает задача refresh_statistics_rollups,
+-- историю можно досчитать scripts/backfill_statistics_rollups.py.
+
+create table if not exists meeting.statistics_daily_rollups (
+    day date not null,
+    manager_id bigint not null,
+    members_count integer not null default 0,
+    video_count integer not null default 0,
+    timed_members_count integer not null default 0,
+    total_duration_seconds double precision not null default 0,
+    completed_count integer not null default 0,
+    rejected_count integer not null default 0,
+    refreshed_at timestamptz not null default now(),
+    primary key (day, manager_id)
+);
+
+
+-- Пересчитать дни p_from..p_to из сырых таблиц.
+create or replace function meeting.refresh_statistics_rollups(
+    p_from date,
+    p_to date
+)
+returns integer
+language plpgsql
+as $$
+declare
+    v_rows integer;
+begin
+    delete from meeting.statistics_daily_rollups
+    where day between p_from and p_to;
+
+    insert into meeting.statistics_daily_rollups (
+        day,
+        manager_id,
+        members_count,
+        video_count,
+        timed_members_count,
+        total_duration_seconds,
+        completed_count,
+        rejected_count
+    )
+    with period_members as (
+        select
+            mb.id,
+            il.manager_id,
+            (mb.joined_at at time zone 'Asia/Tashkent')::date as day
+        from meeting.members mb
+        join meeting.invite_links il on il.id = mb.invite_link_id
+        where mb.joined_at >= p_from::timestamp at time zone 'Asia/Tashkent'
+          and mb.joined_at < (p_to + 1)::timestamp at time zone 'Asia/Tashkent'
+    ),
+    -- Видео считается только в неделю прихода участницы
+    attendance as (
+        select pm.manager_id, pm.day, a.member_id, a.joined_at, a.left_at
+        from meeting.video_chat_attendance a
+        join period_members pm on pm.id = a.member_id
+        where a.meeting_date between date_trunc('week', pm.day)::date
+                                 and date_trunc('week', pm.day)::date + 6
+    ),
+    closed_sessions as (
+        select
+            att.*,
+            max(att.left_at) over (
+                partition by att.member_id
+                order by att.joined_at, att.left_at
+                rows between unbounded preceding and 1 preceding
+            ) as prev_reach
+        from attendance att
+        where att.left_at > att.joined_at
+    ),
+    islands as (
+        select
+            cs.*,
+            count(*) filter (
+                where cs.prev_reach is null or cs.joined_at > cs.prev_reach
+            ) over (
+                partition by cs.member_id
+                order by cs.joined_at, cs.left_at
+            ) as island
+        from closed_sessions cs
+    ),
+    member_totals as (
+        select
+            m.day,
+            m.manager_id,
+            m.member_id,
+            sum(m.duration_seconds) as duration_seconds
+        from (
+            select
+                i.day,
+                i.manager_id,
+                i.member_id,
+                extract(epoch from (max(i.left_at) - min(i.joined_at))) as duration_seconds
+            from islands i
+            group by i.day, i.manager_id, i.member_id, i.island
+        ) m
+        group by m.day, m.manager_id, m.member_id
+    ),
+    members_agg as (
+        select pm.day, pm.manager_id, count(*) as members_count
+        from period_members pm
+        group by pm.day, pm.manager_id
+    ),
+    video_agg as (
+        select att.day, att.manager_id, count(distinct att.member_id) as video_count
+        from attendance att
+        group by att.day, att.manager_id
+    ),
+    duration_agg as (
+        select
+            mt.day,
+            mt.manager_id,
+            count(*) as timed_members_count,
+            sum(mt.duration_seconds)::double precision as total_duration_seconds
+        from member_totals mt
+        group by mt.day, mt.manager_id
+    ),
+    applications_agg as (
+        select
+            (ap.created_at at time zone 'Asia/Tashkent')::date as day,
+            ap.manager_id,
+            count(*) filter (where ap.status = 'completed') as completed_count,
+            count(*) filter (where ap.status = 'rejected') as rejected_count
+        from meeting.applications ap
+        where ap.created_at >= p_from::timestamp at time zone 'Asia/Tashkent'
+          and ap.created_at < (p_to + 1)::timestamp at time zone 'Asia/Tashkent'
+        group by 1, 2
+    ),
+    keys as (
+        select day, manager_id from members_agg
+        union
+        select day, manager_id from applications_agg
+    )
+    select
+        k.day,
+        k.manager_id,
+        coalesce(ma.members_count, 0),
+        coalesce(va.video_count, 0),
+        coalesce(da.timed_members_count, 0),
+        coalesce(da.total_duration_seconds, 0),
+        coalesce(aa.completed_count, 0),
+        coalesce(aa.rejected_count, 0)
+    from keys k
+    left join members_agg ma on ma.day = k.day and ma.manager_id = k.manager_id
+    left join video_agg va on va.day = k.day and va.manager_id = k.manager_id
+    left join duration_agg da on da.day = k.day and da.manager_id = k.manager_id
+    left join applications_agg aa on aa.day = k.day and aa.manager_id = k.manager_id;
+
+    get diagnostics v_rows = row_count;
+    return v_rows;
+end;
+$$;
+
+
+-- Статистика по активным менеджерам за любой период из дневных агрегатов.
+-- Результат в том же формате, что и meeting.get_weekly_statistics.
+create or replace function meeting.get_rollup_statistics(
+    p_from date,
+    p_to date
+)
+returns table (
+    manager_id bigint,
+    manager_name text,
+    members_count bigint,
+    video_count bigint,
+    timed_members_count bigint,
+    total_duration_seconds double precision,
+    completed_count bigint,
+    rejected_count bigint
+)
+language sql
+stable
+as $$
+    select
+        m.id as manager_id,
+        m.name as manager_name,
+        coalesce(sum(r.members_count), 0) as members_count,
+        coalesce(sum(r.video_count), 0) as video_count,
+        coalesce(sum(r.timed_members_count), 0) as timed_members_count,
+        coalesce(sum(r.total_duration_seconds), 0) as total_duration_seconds,
+        coalesce(sum(r.completed_count), 0) as completed_count,
+        coalesce(sum(r.rejected_count), 0) as rejected_count
+    from public.managers m
+    left join meeting.statistics_daily_rollups r
+        on r.manager_id = m.id and r.day between p_from and p_to
+    where m.is_active
+    group by m.id, m.name
+    order by m.id;
+$$;
+
+grant select on meeting.statistics_daily_rollups to service_role;
+
+grant execute on function meeting.refresh_statistics_rollups(date, date)
+    to service_role;
+
+grant execute on function meeting.get_rollup_statistics(date, date)
+    to anon, authenticated, service_role;
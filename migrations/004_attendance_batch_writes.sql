@@ -0,0 +1,40 @@
+-- Пакетная запись посещений Video Chat.
+--
+-- AttendanceWriteBuffer копит события join/left и сбрасывает их
+-- одним вызовом на пачку:
+--   p_joins  — [{member_id, meeting_date, joined_at}, ...] → insert
+--   p_leaves — [{member_id, meeting_date, left_at}, ...]   → закрыть
+--              открытые записи (как update_left_at)
+--
+-- Сначала вставляются входы, потом закрываются выходы — поэтому
+-- join и left одной участницы можно слать в одной пачке. Пачки, где
+-- у участницы left идёт раньше join (переподключение), буфер
+-- разрезает сам. Возвращает число закрытых записей.
+
+create or replace function meeting.record_attendance_batch(
+    p_joins jsonb,
+    p_leaves jsonb
+)
+returns integer
+language plpgsql
+as $$
+declare
+    v_closed integer;
+begin
+    insert into meeting.video_chat_attendance (member_id, meeting_date, joined_at)
+    select j.member_id, j.meeting_date, j.joined_at
+    from jsonb_to_recordset(p_joins)
+        as j(member_id bigint, meeting_date date, joined_at timestamptz);
+
+    update meeting.video_chat_attendance a
+    set left_at = l.left_at
+    from jsonb_to_recordset(p_leaves)
+        as l(member_id bigint, meeting_date date, left_at timestamptz)
+    where a.member_id = l.member_id
+      and a.meeting_date = l.meeting_date
+      and a.left_at is null;
+
+    get diagnostics v_closed = row_count;
+    return v_closed;
+end;
+$$;
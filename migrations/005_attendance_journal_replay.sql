@@ -0,0 +1,47 @@
+-- Идемпотентная запись посещений из журнала (AttendanceJournal).
+--
+-- События Video Chat сначала попадают в Redis Stream и подтверждаются
+-- только после записи. Если бот упал между записью и подтверждением,
+-- пачка придёт повторно:
+--   join  — вставляется с event_id (ID записи в stream), повтор
+--           отбрасывается уникальным индексом
+--   left  — закрывает только открытые записи, начатые не позже выхода,
+--           поэтому повтор ничего не меняет
+--
+-- Записи без журнала (event_id is null) индекс не ограничивает.
+
+alter table meeting.video_chat_attendance
+    add column if not exists event_id text;
+
+create unique index if not exists video_chat_attendance_event_id_key
+    on meeting.video_chat_attendance (event_id);
+
+create or replace function meeting.record_attendance_batch(
+    p_joins jsonb,
+    p_leaves jsonb
+)
+returns integer
+language plpgsql
+as $$
+declare
+    v_closed integer;
+begin
+    insert into meeting.video_chat_attendance (member_id, meeting_date, joined_at, event_id)
+    select j.member_id, j.meeting_date, j.joined_at, j.event_id
+    from jsonb_to_recordset(p_joins)
+        as j(member_id bigint, meeting_date date, joined_at timestamptz, event_id text)
+    on conflict (event_id) do nothing;
+
+    update meeting.video_chat_attendance a
+    set left_at = l.left_at
+    from jsonb_to_recordset(p_leaves)
+        as l(member_id bigint, meeting_date date, left_at timestamptz)
+    where a.member_id = l.member_id
+      and a.meeting_date = l.meeting_date
+      and a.left_at is null
+      and a.joined_at <= l.left_at;
+
+    get diagnostics v_closed = row_count;
+    return v_closed;
+end;
+$$;
@@ -0,0 +1,36 @@
+-- Запись посещений Video Chat готовыми сессиями.
+--
+-- Пока звонок идёт, открытые сессии живут в Redis (LiveSessionStore):
+-- вход и выход — операции над hash, в БД ничего не пишется. Выход
+-- превращает сессию в готовую строку (joined_at, left_at), которая
+-- через журнал приходит сюда пачкой:
+--   p_sessions — [{member_id, meeting_date, joined_at, left_at, event_id}, ...]
+--
+-- UPDATE с поиском открытой записи больше не нужен. Повтор пачки
+-- после рестарта отбрасывается уникальным индексом по event_id (005).
+-- Возвращает число вставленных сессий.
+
+create or replace function meeting.record_attendance_sessions(
+    p_sessions jsonb
+)
+returns integer
+language plpgsql
+as $$
+declare
+    v_inserted integer;
+begin
+    insert into meeting.video_chat_attendance
+        (member_id, meeting_date, joined_at, left_at, event_id)
+    select s.member_id, s.meeting_date, s.joined_at, s.left_at, s.event_id
+    from jsonb_to_recordset(p_sessions)
+        as s(member_id bigint, meeting_date date, joined_at timestamptz,
+             left_at timestamptz, event_id text)
+    on conflict (event_id) do nothing;
+
+    get diagnostics v_inserted = row_count;
+    return v_inserted;
+end;
+$$;
+
+-- Заменена record_attendance_sessions
+drop function if exists meeting.record_attendance_batch(jsonb, jsonb);
@@ -0,0 +1,31 @@
+-- Когорта и присутствие в группе для meeting.members.
+--
+-- Строки участниц не удаляются, поэтому cleanup_group по get_all()
+-- с каждой неделей кикал всё больше давно ушедших людей. Теперь:
+--   cohort_week — понедельник недели входа (по Ташкенту)
+--   in_group    — участница сейчас в группе: true при входе,
+--                 false после kick
+-- Очистка выбирает только in_group = true, и её стоимость равна
+-- размеру текущей когорты, а не всей истории.
+
+alter table meeting.members
+    add column if not exists cohort_week date,
+    add column if not exists in_group boolean not null default true;
+
+update meeting.members
+set cohort_week = (
+    date_trunc('week', joined_at at time zone 'Asia/Tashkent')
+)::date
+where cohort_week is null;
+
+-- Все, кто вошёл до текущей недели, уже удалены прошлыми очистками
+update meeting.members
+set in_group = false
+where cohort_week < date_trunc('week', now() at time zone 'Asia/Tashkent')::date;
+
+alter table meeting.members
+    alter column cohort_week set not null;
+
+create index if not exists members_in_group_idx
+    on meeting.members (id)
+    where in_group;
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from datetime import datetime
+from datetime import date, datetime
 
 class Member(BaseModel):
     id: int
@@ -8,4 +8,6 @@ class Member(BaseModel):
     last_name: str | None
     username: str | None
     invite_link_id: int  # FK → invite_links.id
-    joined_at: datetime
\ No newline at end of file
+    joined_at: datetime
+    cohort_week: date | None = None  # понедельник недели входа
+    in_group: bool = True  # false после kick
\ No newline at end of file
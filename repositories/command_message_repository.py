@@ -1,11 +1,15 @@
+from collections.abc import AsyncIterator
+
 from supabase import AsyncClient
 from models.command_message import CommandMessage
+from utils.pagination import DEFAULT_PAGE_SIZE, iter_keyset_pages
 
 
 class CommandMessageRepository:
     """Repository для работы с таблицей public.commands_messages"""
 
     TABLE_NAME = "commands_messages"
+    DELETE_CHUNK_SIZE = 500  # message_id в одном in_() — ограничение длины URL
 
     def __init__(self, supabase: AsyncClient, bot_type: str):
         self.supabase = supabase
@@ -20,8 +24,28 @@ class CommandMessageRepository:
 
     async def get_all_messages(self) -> list[CommandMessage]:
         """Получить все сообщения для этого бота"""
-        response = await self.supabase.table(self.TABLE_NAME).select("*").eq("bot_type", self.bot_type).execute()
-        return [CommandMessage(**row) for row in response.data]
+        return [message async for page in self.iter_messages() for message in page]
+
+    async def iter_messages(
+            self,
+            page_size: int = DEFAULT_PAGE_SIZE,
+            prefetch: bool = False
+    ) -> AsyncIterator[list[CommandMessage]]:
+        """Сообщения этого бота страницами по id"""
+        pages = iter_keyset_pages(
+            lambda: self.supabase.table(self.TABLE_NAME).select("*").eq("bot_type", self.bot_type),
+            page_size=page_size,
+            prefetch=prefetch
+        )
+        async for rows in pages:
+            yield [CommandMessage(**row) for row in rows]
+
+    async def delete_by_message_ids(self, message_ids: list[int]) -> None:
+        """Удалить сообщения этого бота по message_id"""
+        for start in range(0, len(message_ids), self.DELETE_CHUNK_SIZE):
+            await self.supabase.table(self.TABLE_NAME).delete().eq("bot_type", self.bot_type).in_(
+                "message_id", message_ids[start:start + self.DELETE_CHUNK_SIZE]
+            ).execute()
 
     async def delete_all_messages(self) -> None:
         """Удалить все сообщения для этого бота"""
@@ -43,6 +43,17 @@ class InviteLinkRepository:
 
         return InviteLink(**response.data[0])
 
+    async def get_manager_ids(self, link_ids: list[int]) -> dict[int, int]:
+        """Менеджеры ссылок одним запросом: link_id → manager_id."""
+        if not link_ids:
+            return {}
+
+        response = await self.supabase.schema(self.SCHEMA).table(self.TABLE_NAME).select(
+            "id, manager_id"
+        ).in_("id", link_ids).execute()
+
+        return {row["id"]: row["manager_id"] for row in response.data}
+
     async def mark_as_used(self, link_id: int) -> None:
         """Пометить ссылку как использованную"""
         await self.supabase.schema(self.SCHEMA).table(self.TABLE_NAME).update({
@@ -1,6 +1,10 @@
+from collections.abc import AsyncIterator
+from datetime import date
+
 from supabase import AsyncClient
 
 from models.member import Member
+from utils.pagination import DEFAULT_PAGE_SIZE, iter_keyset_pages
 
 
 class MemberRepository:
@@ -8,6 +12,7 @@ class MemberRepository:
 
     TABLE_NAME = "members"
     SCHEMA = "meeting"
+    UPDATE_CHUNK_SIZE = 500  # telegram_id в одном in_() — ограничение длины URL
 
     def __init__(self, supabase: AsyncClient):
         self.supabase = supabase
@@ -18,23 +23,69 @@ class MemberRepository:
             first_name: str,
             last_name: str | None,
             username: str | None,
-            invite_link_id: int
+            invite_link_id: int,
+            cohort_week: date
     ) -> Member:
-        """Сохранить нового участника"""
+        """Сохранить нового участника (он сейчас в группе)."""
         response = await self.supabase.schema(self.SCHEMA).table(self.TABLE_NAME).insert({
             "telegram_id": telegram_id,
             "first_name": first_name,
             "last_name": last_name,
             "username": username,
             "invite_link_id": invite_link_id,
+            "cohort_week": cohort_week.isoformat(),
+            "in_group": True,
         }).execute()
 
         return Member(**response.data[0])
 
     async def get_all(self) -> list[Member]:
         """Получить всех участниц."""
-        response = await self.supabase.schema(self.SCHEMA).table(self.TABLE_NAME).select("*").execute()
-        return [Member(**row) for row in response.data]
+        return [member async for page in self.iter_all() for member in page]
+
+    async def iter_all(
+            self,
+            page_size: int = DEFAULT_PAGE_SIZE,
+            prefetch: bool = False
+    ) -> AsyncIterator[list[Member]]:
+        """Все участницы страницами по id."""
+        pages = iter_keyset_pages(
+            lambda: self.supabase.schema(self.SCHEMA).table(self.TABLE_NAME).select("*"),
+            page_size=page_size,
+            prefetch=prefetch
+        )
+        async for rows in pages:
+            yield [Member(**row) for row in rows]
+
+    async def get_in_group(self) -> list[Member]:
+        """Получить участниц, которые сейчас в группе."""
+        return [member async for page in self.iter_in_group() for member in page]
+
+    async def iter_in_group(
+            self,
+            page_size: int = DEFAULT_PAGE_SIZE,
+            prefetch: bool = False
+    ) -> AsyncIterator[list[Member]]:
+        """Участницы в группе страницами по id.
+
+        Keyset: снятие in_group с уже прочитанных страниц не сдвигает
+        следующие (с offset строки бы пропускались).
+        """
+        pages = iter_keyset_pages(
+            lambda: self.supabase.schema(self.SCHEMA).table(self.TABLE_NAME).select("*").eq("in_group", True),
+            page_size=page_size,
+            prefetch=prefetch
+        )
+        async for rows in pages:
+            yield [Member(**row) for row in rows]
+
+    async def mark_left_group(self, telegram_ids: list[int]) -> None:
+        """Снять in_group после kick."""
+        for start in range(0, len(telegram_ids), self.UPDATE_CHUNK_SIZE):
+            chunk = telegram_ids[start:start + self.UPDATE_CHUNK_SIZE]
+            await self.supabase.schema(self.SCHEMA).table(self.TABLE_NAME).update(
+                {"in_group": False}
+            ).in_("telegram_id", chunk).execute()
 
     async def get_by_telegram_id(self, telegram_id: int) -> Member | None:
         """Найти участницу по Telegram ID."""
@@ -46,3 +97,14 @@ class MemberRepository:
             return None
 
         return Member(**response.data[0])
+
+    async def get_by_ids(self, member_ids: list[int]) -> list[Member]:
+        """Найти участниц по ID одним запросом."""
+        if not member_ids:
+            return []
+
+        response = await self.supabase.schema(self.SCHEMA).table(self.TABLE_NAME).select(
+            "*"
+        ).in_("id", member_ids).execute()
+
+        return [Member(**row) for row in response.data]
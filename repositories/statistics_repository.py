@@ -1,9 +1,11 @@
 """Репозиторий для статистики."""
-from datetime import datetime
+from datetime import date, datetime
 
 from postgrest import CountMethod
 from supabase import AsyncClient
 
+from utils.pagination import iter_keyset_pages
+
 
 class StatisticsRepository:
     """Репозиторий для получения данных статистики."""
@@ -26,19 +28,21 @@ class StatisticsRepository:
         end_date: datetime
     ) -> list[dict]:
         """Получить участниц менеджера за период."""
-        response = await self.supabase.schema("meeting").table(
-            "members"
-        ).select(
-            "id, joined_at, invite_links!inner(manager_id)"
-        ).eq(
-            "invite_links.manager_id", manager_id
-        ).gte(
-            "joined_at", start_date.isoformat()
-        ).lte(
-            "joined_at", end_date.isoformat()
-        ).execute()
+        pages = iter_keyset_pages(
+            lambda: self.supabase.schema("meeting").table(
+                "members"
+            ).select(
+                "id, joined_at, invite_links!inner(manager_id)"
+            ).eq(
+                "invite_links.manager_id", manager_id
+            ).gte(
+                "joined_at", start_date.isoformat()
+            ).lte(
+                "joined_at", end_date.isoformat()
+            )
+        )
 
-        return response.data
+        return [row async for page in pages for row in page]
 
     async def get_video_attendance_by_members(
         self,
@@ -50,19 +54,22 @@ class StatisticsRepository:
         if not member_ids:
             return []
 
-        response = await self.supabase.schema("meeting").table(
-            "video_chat_attendance"
-        ).select(
-            "member_id, joined_at, left_at"
-        ).in_(
-            "member_id", member_ids
-        ).gte(
-            "meeting_date", start_date.date().isoformat()
-        ).lte(
-            "meeting_date", end_date.date().isoformat()
-        ).execute()
+        pages = iter_keyset_pages(
+            lambda: self.supabase.schema("meeting").table(
+                "video_chat_attendance"
+            ).select(
+                "id, member_id, joined_at, left_at"
+            ).in_(
+                "member_id", member_ids
+            ).gte(
+                "meeting_date", start_date.date().isoformat()
+            ).lte(
+                "meeting_date", end_date.date().isoformat()
+            ),
+            prefetch=True
+        )
 
-        return response.data
+        return [row async for page in pages for row in page]
 
     async def get_applications_count_by_status(
         self,
@@ -86,4 +93,68 @@ class StatisticsRepository:
             "created_at", end_date.isoformat()
         ).execute()
 
-        return response.count or 0
\ No newline at end of file
+        return response.count or 0
+
+    async def get_weekly_aggregates(
+        self,
+        start_date: datetime,
+        end_date: datetime
+    ) -> list[dict]:
+        """Получить агрегаты по всем активным менеджерам за период одним запросом.
+
+        Считается SQL-функцией meeting.get_weekly_statistics
+        (migrations/001_weekly_statistics.sql).
+        """
+        response = await self.supabase.schema("meeting").rpc(
+            "get_weekly_statistics",
+            {
+                "p_start": start_date.isoformat(),
+                "p_end": end_date.isoformat(),
+                "p_meeting_start": start_date.date().isoformat(),
+                "p_meeting_end": end_date.date().isoformat(),
+            }
+        ).execute()
+
+        return response.data
+
+    async def refresh_daily_rollups(
+        self,
+        start_day: date,
+        end_day: date
+    ) -> int:
+        """Пересчитать дневные агрегаты за дни start_day..end_day.
+
+        Считается SQL-функцией meeting.refresh_statistics_rollups
+        (migrations/003_statistics_daily_rollups.sql).
+
+        Returns:
+            Сколько строк агрегатов записано
+        """
+        response = await self.supabase.schema("meeting").rpc(
+            "refresh_statistics_rollups",
+            {
+                "p_from": start_day.isoformat(),
+                "p_to": end_day.isoformat(),
+            }
+        ).execute()
+
+        return response.data or 0
+
+    async def get_rollup_aggregates(
+        self,
+        start_day: date,
+        end_day: date
+    ) -> list[dict]:
+        """Агрегаты по активным менеджерам за дни start_day..end_day.
+
+        Суммирует дневные агрегаты, формат строк как у get_weekly_aggregates.
+        """
+        response = await self.supabase.schema("meeting").rpc(
+            "get_rollup_statistics",
+            {
+                "p_from": start_day.isoformat(),
+                "p_to": end_day.isoformat(),
+            }
+        ).execute()
+
+        return response.data
@@ -4,6 +4,7 @@ from datetime import date, datetime
 from supabase import AsyncClient
 
 from models.video_chat_attendance import VideoChatAttendance
+from utils.pagination import DEFAULT_PAGE_SIZE, iter_keyset_pages
 
 logger = logging.getLogger(__name__)
 
@@ -11,6 +12,7 @@ logger = logging.getLogger(__name__)
 class VideoChatAttendanceRepository:
     TABLE_NAME = "video_chat_attendance"
     SCHEMA = "meeting"
+    PAGE_SIZE = DEFAULT_PAGE_SIZE
 
     def __init__(self, supabase: AsyncClient):
         self.supabase = supabase
@@ -39,3 +41,31 @@ class VideoChatAttendanceRepository:
         ).execute()
 
         logger.debug(f"Updated left_at for member_id={member_id}")
+
+    async def insert_sessions(self, sessions: list[dict]) -> int:
+        """Вставить завершённые сессии одним запросом.
+
+        Args:
+            sessions: [{"member_id", "meeting_date", "joined_at", "left_at", "event_id"?}, ...]
+
+        Returns:
+            Сколько сессий вставлено (повторы по event_id пропускаются)
+        """
+        response = await self.supabase.schema(self.SCHEMA).rpc(
+            "record_attendance_sessions",
+            {"p_sessions": sessions}
+        ).execute()
+
+        logger.debug(f"Inserted {len(sessions)} attendance sessions")
+        return response.data or 0
+
+    async def get_sessions_by_date(self, meeting_date: date) -> list[dict]:
+        """Все сессии одной встречи (постранично — PostgREST отдаёт не больше 1000 строк)."""
+        pages = iter_keyset_pages(
+            lambda: self.supabase.schema(self.SCHEMA).table(self.TABLE_NAME).select(
+                "id, member_id, joined_at, left_at"
+            ).eq("meeting_date", meeting_date.isoformat()),
+            page_size=self.PAGE_SIZE,
+            prefetch=True
+        )
+        return [session async for page in pages for session in page]
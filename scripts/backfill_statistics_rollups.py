@@ -0,0 +1,51 @@
+"""Досчитать дневные агрегаты статистики за период.
+
+Запуск:
+    python scripts/backfill_statistics_rollups.py YYYY-MM-DD [YYYY-MM-DD]
+
+Вторая дата по умолчанию — сегодня. Период пересчитывается
+помесячно, чтобы не упираться в таймаут запроса.
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import asyncio
+from datetime import date, timedelta
+
+from supabase import acreate_client
+
+from config import get_settings
+from repositories.statistics_repository import StatisticsRepository
+from utils.time import get_tashkent_now
+
+settings = get_settings()
+
+CHUNK_DAYS = 31
+
+
+async def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+
+    start_day = date.fromisoformat(sys.argv[1])
+    end_day = date.fromisoformat(sys.argv[2]) if len(sys.argv) > 2 else get_tashkent_now().date()
+
+    supabase = await acreate_client(settings.supabase_url, settings.supabase_key)
+    repository = StatisticsRepository(supabase=supabase)
+
+    total = 0
+    chunk_start = start_day
+    while chunk_start <= end_day:
+        chunk_end = min(chunk_start + timedelta(days=CHUNK_DAYS - 1), end_day)
+        rows = await repository.refresh_daily_rollups(chunk_start, chunk_end)
+        total += rows
+        print(f"{chunk_start:%d.%m.%Y} — {chunk_end:%d.%m.%Y}: {rows}")
+        chunk_start = chunk_end + timedelta(days=1)
+
+    print(f"✅ Агрегаты пересчитаны, строк: {total}")
+
+
+asyncio.run(main())
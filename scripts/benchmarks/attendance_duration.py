@@ -0,0 +1,130 @@
+"""Бенчмарк: среднее время на видео циклом по строкам и на NumPy.
+
+Запуск:
+    python -m scripts.benchmarks.attendance_duration [sessions] [members]
+
+Сессии генерируются с переподключениями, как в реальных звонках.
+Старый цикл усредняет сырые сессии, движок — склеенное время на
+участницу. Для сравнения при одинаковом смысле есть и цикл со
+склейкой на чистом Python.
+"""
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+from services.attendance_analytics import (
+    load_sessions,
+    member_totals,
+    merge_intervals,
+    summarize_durations,
+)
+
+
+def generate_sessions(sessions_count: int, members_count: int, seed: int = 42) -> list[dict]:
+    """Сессии в формате ответа Supabase."""
+    rnd = random.Random(seed)
+    call_start = datetime(2025, 1, 17, 9, 0, tzinfo=timezone.utc)
+
+    video_data = []
+    for _ in range(sessions_count):
+        joined = call_start + timedelta(seconds=rnd.randint(0, 7200))
+        left = joined + timedelta(seconds=rnd.randint(-60, 3600))
+        video_data.append({
+            "member_id": rnd.randint(1, members_count),
+            "joined_at": joined.isoformat(),
+            "left_at": left.isoformat() if rnd.random() > 0.05 else None,
+        })
+
+    return video_data
+
+
+def legacy_avg_duration(video_data: list[dict]) -> int | None:
+    """Прежний StatisticsService._calculate_avg_duration."""
+    durations = []
+
+    for v in video_data:
+        if v["left_at"] and v["joined_at"]:
+            joined = datetime.fromisoformat(v["joined_at"].replace("Z", "+00:00"))
+            left = datetime.fromisoformat(v["left_at"].replace("Z", "+00:00"))
+            duration = (left - joined).total_seconds() / 60
+            if duration > 0:
+                durations.append(duration)
+
+    if not durations:
+        return None
+
+    return round(sum(durations) / len(durations))
+
+
+def python_member_totals(video_data: list[dict]) -> dict[int, float]:
+    """Склейка интервалов по участницам обычным циклом."""
+    sessions: dict[int, list[tuple[float, float]]] = {}
+
+    for v in video_data:
+        if v["left_at"] and v["joined_at"]:
+            joined = datetime.fromisoformat(v["joined_at"].replace("Z", "+00:00")).timestamp()
+            left = datetime.fromisoformat(v["left_at"].replace("Z", "+00:00")).timestamp()
+            if left > joined:
+                sessions.setdefault(v["member_id"], []).append((joined, left))
+
+    totals = {}
+    for member_id, intervals in sessions.items():
+        intervals.sort()
+        total = 0.0
+        start, end = intervals[0]
+        for joined, left in intervals[1:]:
+            if joined > end:
+                total += end - start
+                start, end = joined, left
+            else:
+                end = max(end, left)
+        totals[member_id] = total + end - start
+
+    return totals
+
+
+def best_of(func, *args, repeat: int = 5) -> float:
+    """Лучшее время из нескольких прогонов, секунды."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    sessions_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    members_count = int(sys.argv[2]) if len(sys.argv) > 2 else sessions_count // 5
+
+    video_data = generate_sessions(sessions_count, members_count)
+    print(f"sessions={sessions_count}, members={members_count}")
+
+    arrays = load_sessions(video_data)
+    timings = [
+        ("legacy loop (raw sessions)", best_of(legacy_avg_duration, video_data)),
+        ("python loop + merge", best_of(python_member_totals, video_data)),
+        ("numpy: load_sessions", best_of(load_sessions, video_data)),
+        ("numpy: merge_intervals", best_of(merge_intervals, *arrays)),
+        ("numpy: member_totals", best_of(member_totals, video_data)),
+        ("numpy: summarize_durations", best_of(summarize_durations, video_data)),
+    ]
+
+    baseline = timings[0][1]
+    print(f"{'implementation':>28} {'best, ms':>10} {'vs legacy':>10}")
+    for name, elapsed in timings:
+        print(f"{name:>28} {elapsed * 1000:>10.1f} {baseline / elapsed:>9.1f}x")
+
+    summary = summarize_durations(video_data)
+    print()
+    print(f"legacy avg per session: {legacy_avg_duration(video_data)} min")
+    print(
+        f"avg per member: {round(summary.mean_seconds / 60)} min, "
+        f"p50={summary.percentiles[50] / 60:.0f} min, "
+        f"p90={summary.percentiles[90] / 60:.0f} min"
+    )
+
+
+if __name__ == "__main__":
+    main()
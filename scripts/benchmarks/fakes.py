@@ -0,0 +1,276 @@
+"""In-memory подмены repositories и Redis-сервисов для бенчмарков."""
+import asyncio
+import time as clock
+from collections import defaultdict
+from collections.abc import AsyncIterator
+from datetime import date, datetime, time
+
+from models.member import Member
+from scripts.benchmarks.generator import StatisticsDataset
+from services.attendance_analytics import member_totals
+from services.live_sessions import ClosedSession
+from services.video_chat_event_queue import VideoChatEvent
+from utils.pagination import DEFAULT_PAGE_SIZE
+from utils.time import TASHKENT_TZ
+
+
+class InMemoryStatisticsRepository:
+    """StatisticsRepository поверх StatisticsDataset.
+
+    Отвечает так же, как Supabase (те же поля и фильтры), по желанию —
+    с сетевой задержкой на каждый запрос. Считает запросы и пиковое
+    число одновременных запросов.
+    """
+
+    def __init__(self, dataset: StatisticsDataset, latency: float = 0):
+        self.dataset = dataset
+        self.latency = latency
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+        self._members_by_manager: dict[int, list[dict]] = defaultdict(list)
+        for member in dataset.members:
+            self._members_by_manager[member["manager_id"]].append(member)
+
+        self._attendance_by_member: dict[int, list[dict]] = defaultdict(list)
+        for row in dataset.attendance:
+            self._attendance_by_member[row["member_id"]].append(row)
+
+        self._applications_by_manager: dict[int, list[dict]] = defaultdict(list)
+        for application in dataset.applications:
+            self._applications_by_manager[application["manager_id"]].append(application)
+
+    async def _request(self) -> None:
+        self.requests += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+
+    # ============================================
+    # МЕТОДЫ StatisticsRepository
+    # ============================================
+
+    async def get_active_managers(self) -> list[dict]:
+        await self._request()
+        return [{"id": m["id"], "name": m["name"]} for m in self.dataset.managers]
+
+    async def get_members_by_manager(
+            self,
+            manager_id: int,
+            start_date: datetime,
+            end_date: datetime
+    ) -> list[dict]:
+        await self._request()
+        return [
+            {
+                "id": m["id"],
+                "joined_at": m["joined_at"].isoformat(),
+                "invite_links": {"manager_id": manager_id},
+            }
+            for m in self._members_by_manager[manager_id]
+            if start_date <= m["joined_at"] <= end_date
+        ]
+
+    async def get_video_attendance_by_members(
+            self,
+            member_ids: list[int],
+            start_date: datetime,
+            end_date: datetime
+    ) -> list[dict]:
+        await self._request()
+        return self._attendance(member_ids, start_date.date(), end_date.date())
+
+    async def get_applications_count_by_status(
+            self,
+            manager_id: int,
+            status: str,
+            start_date: datetime,
+            end_date: datetime
+    ) -> int:
+        await self._request()
+        return sum(
+            1 for a in self._applications_by_manager[manager_id]
+            if a["status"] == status and start_date <= a["created_at"] <= end_date
+        )
+
+    async def get_weekly_aggregates(
+            self,
+            start_date: datetime,
+            end_date: datetime
+    ) -> list[dict]:
+        """То же, что meeting.get_weekly_statistics, на Python."""
+        await self._request()
+        return self._aggregate(start_date, end_date)
+
+    async def get_rollup_aggregates(self, start_day: date, end_day: date) -> list[dict]:
+        """То же, что meeting.get_rollup_statistics (в пределах одной недели)."""
+        await self._request()
+        return self._aggregate(
+            datetime.combine(start_day, time.min, tzinfo=TASHKENT_TZ),
+            datetime.combine(end_day, time.max, tzinfo=TASHKENT_TZ),
+        )
+
+    # ============================================
+    # АГРЕГАЦИЯ
+    # ============================================
+
+    def _attendance(self, member_ids: list[int], start_day: date, end_day: date) -> list[dict]:
+        return [
+            {"member_id": row["member_id"], "joined_at": row["joined_at"], "left_at": row["left_at"]}
+            for member_id in member_ids
+            for row in self._attendance_by_member.get(member_id, [])
+            if start_day <= row["meeting_date"] <= end_day
+        ]
+
+    def _aggregate(self, start_date: datetime, end_date: datetime) -> list[dict]:
+        rows = []
+        for manager in self.dataset.managers:
+            member_ids = [
+                m["id"] for m in self._members_by_manager[manager["id"]]
+                if start_date <= m["joined_at"] <= end_date
+            ]
+            attendance = self._attendance(member_ids, start_date.date(), end_date.date())
+            _, totals = member_totals(attendance)
+            statuses = [
+                a["status"] for a in self._applications_by_manager[manager["id"]]
+                if start_date <= a["created_at"] <= end_date
+            ]
+
+            rows.append({
+                "manager_id": manager["id"],
+                "manager_name": manager["name"],
+                "members_count": len(member_ids),
+                "video_count": len({a["member_id"] for a in attendance}),
+                "timed_members_count": len(totals),
+                "total_duration_seconds": float(totals.sum()),
+                "completed_count": statuses.count("completed"),
+                "rejected_count": statuses.count("rejected"),
+            })
+
+        return rows
+
+
+class _Requests:
+    """Счётчик запросов с искусственной задержкой сети."""
+
+    def __init__(self, latency: float = 0):
+        self.latency = latency
+        self.requests = 0
+
+    async def _request(self) -> None:
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+
+class InMemoryMemberRepository(_Requests):
+    """MemberRepository поверх списка участниц."""
+
+    def __init__(self, members: list[Member], latency: float = 0):
+        super().__init__(latency)
+        self._by_id = {m.id: m for m in members}
+        self._by_telegram_id = {m.telegram_id: m for m in members}
+
+    async def get_by_telegram_id(self, telegram_id: int) -> Member | None:
+        await self._request()
+        return self._by_telegram_id.get(telegram_id)
+
+    async def get_by_ids(self, member_ids: list[int]) -> list[Member]:
+        await self._request()
+        return [self._by_id[m] for m in member_ids if m in self._by_id]
+
+    async def get_all(self) -> list[Member]:
+        await self._request()
+        return list(self._by_id.values())
+
+    async def iter_in_group(
+            self,
+            page_size: int = DEFAULT_PAGE_SIZE,
+            prefetch: bool = False
+    ) -> AsyncIterator[list[Member]]:
+        members = [m for _, m in sorted(self._by_id.items()) if m.in_group]
+        for start in range(0, len(members), page_size):
+            await self._request()
+            yield members[start:start + page_size]
+
+
+class InMemoryLiveSessionStore(_Requests):
+    """LiveSessionStore без Redis: завершённые сессии копятся в closed."""
+
+    def __init__(self, latency: float = 0):
+        super().__init__(latency)
+        self._open: dict[int, datetime] = {}
+        self.closed: list[tuple[int, datetime, datetime]] = []
+
+    async def open(self, member_id: int, joined_at: datetime) -> bool:
+        await self._request()
+        if member_id in self._open:
+            return False
+        self._open[member_id] = joined_at
+        return True
+
+    async def close(self, member_id: int, left_at: datetime) -> ClosedSession | None:
+        await self._request()
+        joined_at = self._open.pop(member_id, None)
+        if joined_at is None:
+            return None
+        self.closed.append((member_id, joined_at, left_at))
+        return ClosedSession(member_id, joined_at, left_at, event_id=f"{len(self.closed)}-0")
+
+    async def close_all(self, left_at: datetime) -> list[ClosedSession]:
+        await self._request()
+        sessions = [ClosedSession(member_id, joined_at, left_at) for member_id, joined_at in self._open.items()]
+        self.closed.extend((session.member_id, session.joined_at, left_at) for session in sessions)
+        self._open.clear()
+        return sessions
+
+    async def get_member_ids(self) -> set[int]:
+        await self._request()
+        return set(self._open)
+
+    async def count(self) -> int:
+        return len(self._open)
+
+
+class InMemoryStatisticsCounterService(_Requests):
+    """StatisticsCounterService без Redis: только считает события."""
+
+    def __init__(self, latency: float = 0):
+        super().__init__(latency)
+        self.video_joined = 0
+        self.video_left = 0
+
+    async def record_video_joined(self, member_id: int, member_joined_at: datetime, at: datetime) -> None:
+        await self._request()
+        self.video_joined += 1
+
+    async def record_video_left(
+            self,
+            member_id: int,
+            member_joined_at: datetime,
+            video_joined_at: datetime,
+            at: datetime
+    ) -> None:
+        await self._request()
+        self.video_left += 1
+
+
+class InMemoryVideoChatEventQueue:
+    """VideoChatEventQueue на asyncio.Queue.
+
+    Событие проходит через to_fields/from_fields, как через Redis
+    Stream, и помечается временем публикации — для задержки consumer'а.
+    """
+
+    def __init__(self):
+        self.queue: asyncio.Queue[tuple[float, VideoChatEvent]] = asyncio.Queue()
+        self.published = 0
+
+    async def publish(self, event: VideoChatEvent) -> None:
+        fields = {key: str(value) for key, value in event.to_fields().items()}
+        self.queue.put_nowait((clock.perf_counter(), VideoChatEvent.from_fields(fields)))
+        self.published += 1
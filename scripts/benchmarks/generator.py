@@ -0,0 +1,94 @@
+"""Синтетические данные статистики с фиксированным seed.
+
+Менеджеры, участницы, посещения видео (с переподключениями) и анкеты
+за одну неделю — в том же виде, в каком их отдаёт Supabase.
+"""
+import random
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta, timezone
+
+from utils.time import TASHKENT_TZ
+
+MANAGER_NAMES = ["Айнура", "Акмарал", "Гульнара", "Динара", "Жанна", "Камила", "Лейла", "Мадина"]
+
+
+@dataclass
+class StatisticsDataset:
+    """Данные за неделю week_start..week_start + 6."""
+    week_start: date
+    managers: list[dict] = field(default_factory=list)
+    members: list[dict] = field(default_factory=list)
+    attendance: list[dict] = field(default_factory=list)
+    applications: list[dict] = field(default_factory=list)
+
+    @property
+    def period(self) -> tuple[datetime, datetime]:
+        start = datetime.combine(self.week_start, time.min, tzinfo=TASHKENT_TZ)
+        return start, start + timedelta(days=6, hours=23, minutes=59, seconds=59)
+
+
+def generate_dataset(
+        members_count: int,
+        managers_count: int | None = None,
+        seed: int = 42,
+        week_start: date = date(2025, 1, 13),
+        video_share: float = 0.6,
+        max_reconnects: int = 4
+) -> StatisticsDataset:
+    """Сгенерировать неделю данных.
+
+    Args:
+        members_count: сколько участниц пришло за неделю
+        managers_count: по умолчанию — одна на 50 участниц, от 1 до 30
+        seed: одинаковый seed — одинаковые данные
+        video_share: доля участниц, бывших на видео
+        max_reconnects: максимум сессий одной участницы за звонок
+    """
+    rnd = random.Random(seed)
+    if managers_count is None:
+        managers_count = max(1, min(30, members_count // 50))
+
+    dataset = StatisticsDataset(week_start=week_start)
+    start, _ = dataset.period
+
+    for manager_id in range(1, managers_count + 1):
+        name = MANAGER_NAMES[(manager_id - 1) % len(MANAGER_NAMES)]
+        dataset.managers.append({"id": manager_id, "name": f"{name} {manager_id}"})
+
+    # Звонок — в пятницу, 14:00 по Ташкенту
+    call_start = start + timedelta(days=4, hours=14)
+
+    for member_id in range(1, members_count + 1):
+        manager_id = rnd.randint(1, managers_count)
+        joined_at = start + timedelta(seconds=rnd.randint(0, 6 * 86400))
+        dataset.members.append({
+            "id": member_id,
+            "manager_id": manager_id,
+            "joined_at": joined_at,
+        })
+
+        if rnd.random() < video_share:
+            session_start = call_start + timedelta(seconds=rnd.randint(0, 1800))
+            for _ in range(rnd.randint(1, max_reconnects)):
+                session_end = session_start + timedelta(seconds=rnd.randint(60, 2400))
+                dataset.attendance.append({
+                    "member_id": member_id,
+                    "joined_at": session_start.astimezone(timezone.utc).isoformat(),
+                    # Несколько процентов сессий не закрыты
+                    "left_at": (
+                        session_end.astimezone(timezone.utc).isoformat()
+                        if rnd.random() > 0.03 else None
+                    ),
+                    "meeting_date": session_start.date(),
+                })
+                session_start = session_end + timedelta(seconds=rnd.randint(0, 120))
+
+        roll = rnd.random()
+        if roll < 0.5:
+            dataset.applications.append({
+                "manager_id": manager_id,
+                "status": "completed" if roll < 0.3 else "rejected",
+                "created_at": joined_at + timedelta(hours=rnd.randint(1, 24)),
+            })
+
+    return dataset
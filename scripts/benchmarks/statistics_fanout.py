@@ -0,0 +1,46 @@
+"""Бенчмарк: последовательный и параллельный сбор статистики по менеджерам.
+
+Запуск:
+    python -m scripts.benchmarks.statistics_fanout [managers] [latency_ms]
+
+Репозиторий подменяется InMemoryStatisticsRepository с задержкой, как у Supabase.
+"""
+import asyncio
+import sys
+import time
+
+from scripts.benchmarks.fakes import InMemoryStatisticsRepository
+from scripts.benchmarks.generator import generate_dataset
+from services.statistics_service import StatisticsService
+
+
+async def measure(managers_count: int, latency: float, max_concurrency: int) -> tuple[float, int]:
+    """Время сбора статистики и пиковое число одновременных запросов."""
+    dataset = generate_dataset(members_count=managers_count * 5, managers_count=managers_count)
+    repository = InMemoryStatisticsRepository(dataset, latency=latency)
+    service = StatisticsService(repository=repository, max_concurrency=max_concurrency)
+
+    started = time.perf_counter()
+    await service._get_weekly_stats_per_manager(*dataset.period)
+    return time.perf_counter() - started, repository.max_in_flight
+
+
+async def main() -> None:
+    managers_count = int(sys.argv[1]) if len(sys.argv) > 1 else 15
+    latency_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    print(f"managers={managers_count}, latency={latency_ms:.0f} ms per request")
+    print(f"{'concurrency':>12} {'wall, s':>10} {'max in flight':>14} {'speedup':>8}")
+
+    baseline = None
+    for max_concurrency in (1, 5, 10, 20):
+        elapsed, max_in_flight = await measure(managers_count, latency_ms / 1000, max_concurrency)
+        baseline = baseline or elapsed
+        print(
+            f"{max_concurrency:>12} {elapsed:>10.3f} {max_in_flight:>14} "
+            f"{baseline / elapsed:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,182 @@
+"""Бенчмарк пути статистики на синтетических данных.
+
+Запуск:
+    python -m scripts.benchmarks.statistics_suite [--sizes 10,1000,100000]
+        [--repeat 3] [--seed 42] [--json results.json]
+        [--baseline results.json --tolerance 1.5]
+
+Для каждого размера (число участниц за неделю) генерируется неделя
+данных (generator.py), StatisticsService работает поверх
+InMemoryStatisticsRepository. По каждому этапу печатается лучшее время,
+пик памяти и число блоков, оставшихся живыми после этапа (tracemalloc).
+
+С --baseline этапы сравниваются с прошлым прогоном: если какой-то стал
+медленнее в tolerance раз, скрипт завершается с кодом 1.
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from scripts.benchmarks.fakes import InMemoryStatisticsRepository
+from scripts.benchmarks.generator import StatisticsDataset, generate_dataset
+from services.statistics_service import StatisticsService
+from services.statistics_snapshot_service import dump_weekly_stats, load_weekly_stats
+from templates import StatisticsTemplates
+
+DEFAULT_SIZES = (10, 100, 1000, 10000, 100000)
+
+# Медленнее этого этапы не сравниваются с baseline — там один шум
+MIN_COMPARABLE_SECONDS = 0.001
+
+
+def build_stages(dataset: StatisticsDataset) -> dict[str, Callable[[], Any]]:
+    """Этапы пути статистики: имя → функция без аргументов."""
+    start, end = dataset.period
+    repository = InMemoryStatisticsRepository(dataset)
+    service = StatisticsService(repository=repository)
+
+    # Ответ meeting.get_weekly_statistics считается один раз,
+    # замеряется только сборка статистики из него
+    aggregates = repository._aggregate(start, end)
+    stats = StatisticsService.build_weekly_stats(
+        start, end, [StatisticsService._build_manager_stats(row) for row in aggregates]
+    )
+    video_data = [
+        {"member_id": a["member_id"], "joined_at": a["joined_at"], "left_at": a["left_at"]}
+        for a in dataset.attendance
+    ]
+    raw = dump_weekly_stats(stats)
+
+    return {
+        "per_manager_queries": lambda: service._get_weekly_stats_per_manager(start, end),
+        "calculate_avg_duration": lambda: StatisticsService._calculate_avg_duration(video_data),
+        "build_from_aggregates": lambda: StatisticsService.build_weekly_stats(
+            start, end, [StatisticsService._build_manager_stats(row) for row in aggregates]
+        ),
+        "format_full_stats": lambda: StatisticsTemplates.format_full_stats(stats, stats),
+        "snapshot_round_trip": lambda: load_weekly_stats(dump_weekly_stats(stats)),
+        "snapshot_load": lambda: load_weekly_stats(raw),
+    }
+
+
+async def run_stage(func: Callable[[], Any]) -> Any:
+    result = func()
+    if isinstance(result, Awaitable):
+        result = await result
+    return result
+
+
+async def measure_stage(func: Callable[[], Any], repeat: int) -> dict[str, float]:
+    """Лучшее время из repeat прогонов и память одного прогона."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await run_stage(func)
+        timings.append(time.perf_counter() - started)
+
+    # Память — отдельным прогоном: tracemalloc сильно замедляет код
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = await run_stage(func)
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    del result
+
+    return {"seconds": min(timings), "peak_kib": peak / 1024, "blocks": blocks}
+
+
+async def run_suite(sizes: list[int], repeat: int, seed: int) -> dict[str, dict[str, dict]]:
+    results: dict[str, dict[str, dict]] = {}
+
+    for size in sizes:
+        started = time.perf_counter()
+        dataset = generate_dataset(members_count=size, seed=seed)
+        generated = time.perf_counter() - started
+
+        print(
+            f"\nmembers={size}, managers={len(dataset.managers)}, "
+            f"sessions={len(dataset.attendance)}, applications={len(dataset.applications)} "
+            f"(generated in {generated:.2f} s)"
+        )
+        print(f"{'stage':>24} {'best, ms':>10} {'peak, KiB':>10} {'blocks':>8}")
+
+        results[str(size)] = {}
+        for name, func in build_stages(dataset).items():
+            measured = await measure_stage(func, repeat)
+            results[str(size)][name] = measured
+            print(
+                f"{name:>24} {measured['seconds'] * 1000:>10.2f} "
+                f"{measured['peak_kib']:>10.1f} {measured['blocks']:>8}"
+            )
+
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Этапы, ставшие медленнее baseline больше чем в tolerance раз."""
+    regressions = []
+
+    for size, stages in results.items():
+        for name, measured in stages.items():
+            previous = baseline.get(size, {}).get(name)
+            if not previous or previous["seconds"] < MIN_COMPARABLE_SECONDS:
+                continue
+
+            ratio = measured["seconds"] / previous["seconds"]
+            if ratio > tolerance:
+                regressions.append(
+                    f"members={size} {name}: {previous['seconds'] * 1000:.2f} → "
+                    f"{measured['seconds'] * 1000:.2f} ms ({ratio:.1f}x)"
+                )
+
+    return regressions
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Statistics benchmark suite")
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in DEFAULT_SIZES),
+        help="число участниц через запятую"
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", help="сохранить результаты в файл")
+    parser.add_argument("--baseline", help="сравнить с сохранённым прогоном")
+    parser.add_argument("--tolerance", type=float, default=1.5)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    results = asyncio.run(run_suite(sizes, args.repeat, args.seed))
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print("\n❌ Regressions:")
+            print("\n".join(regressions))
+            sys.exit(1)
+
+        print("\n✅ No regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,320 @@
+"""Воспроизведение записанной встречи через путь Video Chat.
+
+Запуск:
+    python -m scripts.benchmarks.video_chat_replay meeting.jsonl
+        [--speed 1|10|0] [--latency 0.005] [--json results.json]
+    python -m scripts.benchmarks.video_chat_replay meeting.jsonl
+        --generate 500 [--seed 42]
+
+Запись делает бот (RAW_UPDATE_RECORD_PATH=meeting.jsonl), --generate
+пишет синтетическую встречу. Updates идут через RawUpdateDispatcher и
+handlers бота, события — через VideoChatEventProcessor consumer'а;
+repositories и Redis — in-memory (fakes.py), --latency добавляет
+задержку сети на каждый запрос.
+
+--speed: 1 — в реальном времени, 10 — в 10 раз быстрее, 0 — без пауз.
+Печатается events/sec и p50/p99: handler бота, обработка события
+consumer'ом и отставание consumer'а от бота.
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Any
+
+import numpy as np
+from pyrogram import utils
+from pyrogram.raw.types import (
+    GroupCall,
+    GroupCallDiscarded,
+    GroupCallParticipant,
+    InputGroupCall,
+    PeerChannel,
+    PeerUser,
+    UpdateGroupCall,
+    UpdateGroupCallParticipants,
+)
+
+from handlers.video_chat_events import on_group_call, on_video_chat_participant
+from models.member import Member
+from scripts.benchmarks.fakes import (
+    InMemoryLiveSessionStore,
+    InMemoryMemberRepository,
+    InMemoryStatisticsCounterService,
+    InMemoryVideoChatEventQueue,
+)
+from services.active_video_chat import ActiveVideoChat, ActiveVideoChatTracker
+from services.member_lookup_service import MemberLookupService
+from services.video_chat_event_processor import VideoChatEventProcessor
+from services.video_chat_monitor import VideoChatMonitor
+from services.video_chat_reconciler import VideoChatReconciler
+from utils.raw_update_recorder import RawUpdateRecorder, read_recording
+from utils.raw_updates import RawUpdateDispatcher
+from utils.time import TASHKENT_TZ
+
+CALL_ID = 555
+ACCESS_HASH = 777
+GROUP_CHANNEL_ID = 1234567890
+
+
+def generate_meeting(
+        path: str,
+        members_count: int,
+        seed: int = 42,
+        started_at: datetime = datetime(2025, 1, 17, 14, 0, tzinfo=TASHKENT_TZ),
+        max_reconnects: int = 3
+) -> int:
+    """Записать синтетическую встречу: наплыв в первые минуты,
+    переподключения, уходы до конца звонка.
+
+    Telegram складывает несколько участниц в один update — здесь так же:
+    события в пределах секунды склеиваются.
+
+    Returns:
+        Сколько updates записано
+    """
+    rnd = random.Random(seed)
+    start = started_at.timestamp()
+    duration = 90 * 60
+
+    # (секунда от начала, telegram_id, join?)
+    events: list[tuple[int, int, bool]] = []
+    for i in range(members_count):
+        telegram_id = 100000 + i
+        joined = int(rnd.expovariate(1 / 120))  # большинство — в первые минуты
+        for _ in range(rnd.randint(1, max_reconnects + 1)):
+            if joined >= duration:
+                break
+            left = joined + rnd.randint(60, duration)
+            events.append((joined, telegram_id, True))
+            if left < duration:
+                events.append((left, telegram_id, False))
+            joined = left + rnd.randint(5, 300)
+    events.sort()
+
+    recorder = RawUpdateRecorder(path)
+    call = InputGroupCall(id=CALL_ID, access_hash=ACCESS_HASH)
+    peer = PeerChannel(channel_id=GROUP_CHANNEL_ID)
+    recorder.write(
+        UpdateGroupCall(
+            call=GroupCall(
+                id=CALL_ID,
+                access_hash=ACCESS_HASH,
+                participants_count=0,
+                unmuted_video_limit=0,
+                version=1,
+            ),
+            peer=peer,
+        ),
+        at=start - 60,
+    )
+
+    version = 1
+    batch: list[GroupCallParticipant] = []
+    for index, (second, telegram_id, is_join) in enumerate(events):
+        batch.append(GroupCallParticipant(
+            peer=PeerUser(user_id=telegram_id),
+            date=int(start) + second,
+            source=telegram_id,
+            just_joined=is_join or None,
+            left=(not is_join) or None,
+        ))
+        if index + 1 == len(events) or events[index + 1][0] != second:
+            version += 1
+            recorder.write(
+                UpdateGroupCallParticipants(call=call, participants=batch, version=version),
+                at=start + second,
+            )
+            batch = []
+
+    recorder.write(
+        UpdateGroupCall(
+            call=GroupCallDiscarded(id=CALL_ID, access_hash=ACCESS_HASH, duration=duration),
+            peer=peer,
+        ),
+        at=start + duration,
+    )
+    recorder.close()
+    return recorder.recorded
+
+
+def _percentiles(values: list[float]) -> dict[str, float]:
+    if not values:
+        return {"p50_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+    p50, p99, top = np.percentile(np.array(values) * 1000, [50, 99, 100])
+    return {"p50_ms": float(p50), "p99_ms": float(p99), "max_ms": float(top)}
+
+
+async def replay(updates: list[tuple[float, Any]], speed: float = 0, latency: float = 0) -> dict[str, Any]:
+    """Прогнать updates через бот и consumer, вернуть метрики."""
+    # Участницы — все, кто есть в записи
+    telegram_ids = sorted({
+        participant.peer.user_id
+        for _, update in updates
+        if isinstance(update, UpdateGroupCallParticipants)
+        for participant in update.participants
+        if isinstance(participant.peer, PeerUser)
+    })
+    first_at = updates[0][0] if updates else time.time()
+    members = [
+        Member(
+            id=i,
+            telegram_id=telegram_id,
+            first_name="Участница",
+            last_name=None,
+            username=None,
+            invite_link_id=i,
+            joined_at=datetime.fromtimestamp(first_at, TASHKENT_TZ) - timedelta(days=1),
+        )
+        for i, telegram_id in enumerate(telegram_ids, start=1)
+    ]
+
+    # Звонок — из первого update с ним
+    call_id, access_hash, group_id = CALL_ID, ACCESS_HASH, 0
+    for _, update in updates:
+        if isinstance(update, (UpdateGroupCall, UpdateGroupCallParticipants)):
+            call_id, access_hash = update.call.id, update.call.access_hash
+            if isinstance(update, UpdateGroupCall) and update.peer:
+                group_id = utils.get_peer_id(update.peer)
+            break
+
+    # Бот
+    active_video_chat = ActiveVideoChatTracker(redis=None)
+    active_video_chat.set(ActiveVideoChat(
+        call_id=call_id,
+        access_hash=access_hash,
+        scheduled_for=datetime.fromtimestamp(first_at, TASHKENT_TZ),
+    ))
+    event_queue = InMemoryVideoChatEventQueue()
+    monitor = VideoChatMonitor(client=None, active_video_chat=active_video_chat, event_queue=event_queue)
+    dispatcher = RawUpdateDispatcher()
+    dispatcher.route(UpdateGroupCall, partial(on_group_call, group_id=group_id, video_chat_monitor=monitor))
+    dispatcher.route(UpdateGroupCallParticipants, partial(
+        on_video_chat_participant,
+        active_video_chat=active_video_chat,
+        video_chat_event_queue=event_queue,
+    ))
+
+    # Consumer
+    member_repository = InMemoryMemberRepository(members, latency=latency)
+    member_lookup_service = MemberLookupService(repository=member_repository)
+    live_sessions = InMemoryLiveSessionStore(latency=latency)
+    counters = InMemoryStatisticsCounterService(latency=latency)
+    reconciler = VideoChatReconciler(
+        member_repository=member_repository,
+        member_lookup_service=member_lookup_service,
+        live_sessions=live_sessions,
+        statistics_counter_service=counters,
+    )
+    processor = VideoChatEventProcessor(
+        member_lookup_service=member_lookup_service,
+        live_sessions=live_sessions,
+        statistics_counter_service=counters,
+        reconciler=reconciler,
+    )
+
+    handler_seconds: list[float] = []
+    process_seconds: list[float] = []
+    lag_seconds: list[float] = []
+    participant_events = 0
+
+    async def consume() -> None:
+        while True:
+            published_at, event = await event_queue.queue.get()
+            if event is None:
+                return
+            started = time.perf_counter()
+            await processor.process(event)
+            finished = time.perf_counter()
+            process_seconds.append(finished - started)
+            lag_seconds.append(finished - published_at)
+
+    consumer = asyncio.create_task(consume())
+    started = time.perf_counter()
+
+    for at, update in updates:
+        if speed:
+            delay = started + (at - first_at) / speed - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        else:
+            await asyncio.sleep(0)
+
+        if isinstance(update, UpdateGroupCallParticipants):
+            participant_events += len(update.participants)
+        handler_started = time.perf_counter()
+        await dispatcher.dispatch(None, update, {}, {})
+        handler_seconds.append(time.perf_counter() - handler_started)
+
+    event_queue.queue.put_nowait((time.perf_counter(), None))
+    await consumer
+    elapsed = time.perf_counter() - started
+
+    return {
+        "updates": len(updates),
+        "participant_events": participant_events,
+        "queue_events": event_queue.published,
+        "members": len(members),
+        "sessions_closed": len(live_sessions.closed),
+        "seconds": elapsed,
+        "events_per_second": participant_events / elapsed if elapsed else 0.0,
+        "handler": _percentiles(handler_seconds),
+        "process": _percentiles(process_seconds),
+        "lag": _percentiles(lag_seconds),
+        "repository_requests": member_repository.requests,
+        "cache_hits": member_lookup_service.hits,
+        "cache_misses": member_lookup_service.misses,
+    }
+
+
+def print_results(results: dict[str, Any]) -> None:
+    print(
+        f"\nupdates={results['updates']}, participant events={results['participant_events']}, "
+        f"members={results['members']}, sessions closed={results['sessions_closed']}"
+    )
+    print(f"{results['seconds']:.2f} s, {results['events_per_second']:.0f} events/s")
+    print(f"{'stage':>10} {'p50, ms':>10} {'p99, ms':>10} {'max, ms':>10}")
+    for stage in ("handler", "process", "lag"):
+        measured = results[stage]
+        print(
+            f"{stage:>10} {measured['p50_ms']:>10.3f} "
+            f"{measured['p99_ms']:>10.3f} {measured['max_ms']:>10.3f}"
+        )
+    print(
+        f"repository requests={results['repository_requests']}, "
+        f"cache hits={results['cache_hits']}, misses={results['cache_misses']}"
+    )
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Video chat replay")
+    parser.add_argument("recording", help="JSONL-запись updates")
+    parser.add_argument("--speed", type=float, default=0, help="1 — реальное время, 0 — без пауз")
+    parser.add_argument("--latency", type=float, default=0, help="задержка каждого запроса, секунд")
+    parser.add_argument("--generate", type=int, help="записать синтетическую встречу на N участниц")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", help="сохранить результаты в файл")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+
+    if args.generate:
+        recorded = generate_meeting(args.recording, args.generate, seed=args.seed)
+        print(f"Generated {recorded} updates for {args.generate} members → {args.recording}")
+
+    updates = list(read_recording(args.recording))
+    results = asyncio.run(replay(updates, speed=args.speed, latency=args.latency))
+    print_results(results)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Пересчитать снимок статистики за закрытую неделю.
+
+Запуск:
+    python scripts/recompute_statistics_snapshot.py [YYYY-MM-DD]
+
+Дата — любой день нужной недели. По умолчанию — прошлая неделя.
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import asyncio
+from datetime import datetime
+
+from redis.asyncio import from_url
+from supabase import acreate_client
+
+from config import get_settings
+from repositories.statistics_repository import StatisticsRepository
+from services.statistics_service import StatisticsService
+from services.statistics_snapshot_service import StatisticsSnapshotService
+from utils.time import TASHKENT_TZ
+
+settings = get_settings()
+
+
+async def main():
+    if len(sys.argv) > 1:
+        day = datetime.fromisoformat(sys.argv[1]).replace(tzinfo=TASHKENT_TZ)
+        start, end = StatisticsService.get_week_range(day)
+    else:
+        start, end = StatisticsService.get_previous_week_range()
+
+    supabase = await acreate_client(settings.supabase_url, settings.supabase_key)
+    redis = from_url(settings.redis_url)
+
+    service = StatisticsService(
+        repository=StatisticsRepository(supabase=supabase),
+        max_concurrency=settings.statistics_max_concurrency
+    )
+    snapshot_service = StatisticsSnapshotService(redis=redis)
+
+    await snapshot_service.delete(start.date())
+    stats = await snapshot_service.get_or_create(service, start, end)
+
+    print(f"✅ Снимок пересчитан: {start:%d.%m.%Y} — {end:%d.%m.%Y}")
+    print(f"Новых: {stats.total_members}, видео: {stats.total_video}")
+
+    await redis.close()
+
+
+asyncio.run(main())
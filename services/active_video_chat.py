@@ -0,0 +1,62 @@
+"""Активный Video Chat в памяти процесса бота."""
+import json
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+
+from redis.asyncio import Redis
+
+from services.video_chat_service import VideoChatService
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class ActiveVideoChat:
+    """Запланированный звонок (то, что VideoChatService пишет в Redis)."""
+    call_id: int
+    access_hash: int
+    scheduled_for: datetime
+
+    @classmethod
+    def from_json(cls, raw: str | bytes) -> "ActiveVideoChat":
+        data = json.loads(raw)
+        return cls(
+            call_id=data["call_id"],
+            access_hash=data["access_hash"],
+            scheduled_for=datetime.fromisoformat(data["scheduled_for"]),
+        )
+
+
+class ActiveVideoChatTracker:
+    """Держит активный звонок в памяти вместо Redis GET на каждый update.
+
+    Источник правды — VideoChatService.REDIS_KEY. Трекер читает его при
+    (пере)подключении к Redis pub/sub и обновляется по
+    VideoChatService.CHANNEL, когда worker планирует новый звонок.
+    Чужие звонки отсекаются одним сравнением call_id.
+    """
+
+    def __init__(self, redis: Redis):
+        self.redis = redis
+        self.current: ActiveVideoChat | None = None
+        # Отдельным полем — сравнение без обращения к dataclass
+        self.call_id: int | None = None
+
+    def is_active(self, call_id: int) -> bool:
+        return call_id == self.call_id
+
+    def set(self, video_chat: ActiveVideoChat | None) -> None:
+        self.current = video_chat
+        self.call_id = video_chat.call_id if video_chat else None
+
+    async def load(self) -> None:
+        """Прочитать активный звонок из Redis."""
+        raw = await self.redis.get(VideoChatService.REDIS_KEY)
+        self.set(ActiveVideoChat.from_json(raw) if raw else None)
+        logger.info(f"Active video chat loaded: {self.call_id}")
+
+    def handle_update(self, message: bytes | str) -> None:
+        """Обработать сообщение из VideoChatService.CHANNEL."""
+        self.set(ActiveVideoChat.from_json(message))
+        logger.info(f"Active video chat updated: {self.call_id}")
@@ -0,0 +1,238 @@
+"""Аналитика посещаемости Video Chat на NumPy.
+
+Сессии (member_id, joined_at, left_at) загружаются в int64-массивы
+(миллисекунды UTC). Пересекающиеся и смежные интервалы одной участницы
+склеиваются: пять переподключений — это одно присутствие, а не пять
+коротких сессий.
+"""
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from operator import itemgetter
+
+import numpy as np
+
+PERCENTILES = (50, 90)
+
+
+@dataclass
+class DurationSummary:
+    """Время на видео по участницам (в секундах)."""
+    members_count: int
+    total_seconds: float
+    mean_seconds: float | None
+    percentiles: dict[int, float]
+
+
+def parse_timestamps(values: Sequence[str]) -> np.ndarray:
+    """ISO-строки Supabase → int64 миллисекунды UTC.
+
+    Быстрый путь — все строки в UTC ("+00:00", так отдаёт PostgREST):
+    смещение срезается и строки парсит сам NumPy. Иначе каждая строка
+    приводится к UTC через datetime.fromisoformat.
+    """
+    # "+" в ISO-строке встречается только в смещении
+    if "\n".join(values).count("+00:00") == len(values):
+        naive = [value[:-6] for value in values]
+    else:
+        naive = [_to_naive_utc(value) for value in values]
+
+    return np.array(naive, dtype="datetime64[ms]").astype(np.int64)
+
+
+def _to_naive_utc(value: str) -> str:
+    moment = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    return moment.isoformat()
+
+
+def load_sessions(video_data: list[dict]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Завершённые сессии с длительностью > 0 как (member_ids, starts, ends)."""
+    closed = [v for v in video_data if v["joined_at"] and v["left_at"]]
+
+    member_ids = np.fromiter(
+        map(itemgetter("member_id"), closed), dtype=np.int64, count=len(closed)
+    )
+    # Начала и концы — одним вызовом парсера
+    values = list(map(itemgetter("joined_at"), closed))
+    values += map(itemgetter("left_at"), closed)
+    timestamps = parse_timestamps(values)
+    starts, ends = timestamps[:len(closed)], timestamps[len(closed):]
+
+    positive = ends > starts
+    return member_ids[positive], starts[positive], ends[positive]
+
+
+def merge_intervals(
+        member_ids: np.ndarray,
+        starts: np.ndarray,
+        ends: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Склеить пересекающиеся и смежные интервалы каждой участницы.
+
+    Returns:
+        (member_ids, starts, ends) склеенных интервалов,
+        отсортированные по участнице и началу
+    """
+    if not len(member_ids):
+        return member_ids, starts, ends
+
+    order = np.lexsort((starts, member_ids))
+    member_ids, starts, ends = member_ids[order], starts[order], ends[order]
+
+    # Номер участницы для каждой строки
+    member_changed = np.empty(len(member_ids), dtype=bool)
+    member_changed[0] = True
+    member_changed[1:] = member_ids[1:] != member_ids[:-1]
+    group = np.cumsum(member_changed) - 1
+
+    # Накопленный максимум конца внутри участницы: сдвигаем группы
+    # на непересекающиеся диапазоны и берём обычный cummax
+    offset = ends.min()
+    span = ends.max() - offset + 1
+    shifted = group * span + (ends - offset)
+    reach = np.maximum.accumulate(shifted) - group * span + offset
+
+    # Новый интервал — новая участница или разрыв после всех предыдущих
+    is_new = member_changed.copy()
+    is_new[1:] |= starts[1:] > reach[:-1]
+
+    idx = np.flatnonzero(is_new)
+    return member_ids[idx], starts[idx], np.maximum.reduceat(ends, idx)
+
+
+def merge_spans(spans: list[list[int]]) -> list[list[int]]:
+    """merge_intervals для одной участницы на списках: [[start, end], ...] в мс."""
+    merged: list[list[int]] = []
+    for start, end in sorted(spans):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return merged
+
+
+def member_totals(video_data: list[dict]) -> tuple[np.ndarray, np.ndarray]:
+    """Суммарное время на видео каждой участницы.
+
+    Returns:
+        (member_ids, total_seconds)
+    """
+    member_ids, starts, ends = merge_intervals(*load_sessions(video_data))
+    if not len(member_ids):
+        return member_ids, np.empty(0, dtype=np.float64)
+
+    first = np.flatnonzero(np.r_[True, member_ids[1:] != member_ids[:-1]])
+    totals = np.add.reduceat(ends - starts, first) / 1000
+
+    return member_ids[first], totals
+
+
+def summarize_durations(
+        video_data: list[dict],
+        percentiles: tuple[int, ...] = PERCENTILES
+) -> DurationSummary:
+    """Среднее и перцентили времени на видео по участницам."""
+    _, totals = member_totals(video_data)
+
+    if not len(totals):
+        return DurationSummary(
+            members_count=0,
+            total_seconds=0.0,
+            mean_seconds=None,
+            percentiles={},
+        )
+
+    values = np.percentile(totals, percentiles)
+    return DurationSummary(
+        members_count=len(totals),
+        total_seconds=float(totals.sum()),
+        mean_seconds=float(totals.mean()),
+        percentiles={p: float(v) for p, v in zip(percentiles, values)},
+    )
+
+
+@dataclass
+class MeetingTimeline:
+    """Посещаемость одной встречи по минутам (bucket_seconds).
+
+    concurrency[i] — максимум одновременно в звонке за i-ю минуту от
+    started_at; retention[k] — сколько участниц пробыли на видео
+    не меньше k минут; drop_offs[i] — сколько ушли окончательно в i-ю
+    минуту.
+    """
+    started_at: datetime | None
+    bucket_seconds: int
+    members_count: int
+    peak: int
+    peak_at: datetime | None
+    concurrency: list[int]
+    retention: list[int]
+    drop_offs: list[int]
+
+
+def build_timeline(video_data: list[dict], bucket_seconds: int = 60) -> MeetingTimeline:
+    """Один проход по отсортированным входам и выходам — O(n log n).
+
+    Переподключения склеиваются (merge_intervals), поэтому участница
+    в звонке считается один раз. При равном времени выход идёт раньше
+    входа: пересменка не завышает пик.
+    """
+    member_ids, starts, ends = merge_intervals(*load_sessions(video_data))
+    if not len(member_ids):
+        return MeetingTimeline(
+            started_at=None,
+            bucket_seconds=bucket_seconds,
+            members_count=0,
+            peak=0,
+            peak_at=None,
+            concurrency=[],
+            retention=[],
+            drop_offs=[],
+        )
+
+    bucket_ms = bucket_seconds * 1000
+    origin = starts.min() // bucket_ms * bucket_ms
+
+    # Вход +1, выход −1, по времени; при равном времени −1 раньше
+    times = np.concatenate((starts, ends))
+    deltas = np.concatenate((np.ones(len(starts), np.int64), -np.ones(len(ends), np.int64)))
+    order = np.lexsort((deltas, times))
+    times = times[order]
+    level = np.cumsum(deltas[order])
+
+    peak_index = int(level.argmax())
+
+    # По минутам: максимум внутри минуты и уровень, с которым она началась
+    buckets = (times - origin) // bucket_ms
+    buckets_count = int(buckets[-1]) + 1
+    concurrency = np.zeros(buckets_count, dtype=np.int64)
+    np.maximum.at(concurrency, buckets, level)
+    last_event = np.searchsorted(buckets, np.arange(buckets_count), side="right") - 1
+    level_at_end = np.where(last_event >= 0, level[last_event], 0)
+    concurrency[1:] = np.maximum(concurrency[1:], level_at_end[:-1])
+
+    # Время на видео каждой участницы и её окончательный уход
+    first = np.flatnonzero(np.r_[True, member_ids[1:] != member_ids[:-1]])
+    totals = np.sort(np.add.reduceat(ends - starts, first))
+    last_left = np.maximum.reduceat(ends, first)
+
+    thresholds = np.arange(int(totals[-1] // bucket_ms) + 1) * bucket_ms
+    retention = len(totals) - np.searchsorted(totals, thresholds, side="left")
+    drop_offs = np.bincount((last_left - origin) // bucket_ms, minlength=buckets_count)
+
+    return MeetingTimeline(
+        started_at=_from_ms(origin),
+        bucket_seconds=bucket_seconds,
+        members_count=len(first),
+        peak=int(level[peak_index]),
+        peak_at=_from_ms(times[peak_index]),
+        concurrency=concurrency.tolist(),
+        retention=retention.tolist(),
+        drop_offs=drop_offs.tolist(),
+    )
+
+
+def _from_ms(value: int) -> datetime:
+    return datetime.fromtimestamp(int(value) / 1000, timezone.utc)
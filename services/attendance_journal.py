@@ -0,0 +1,141 @@
+"""Журнал сессий Video Chat в Redis Stream."""
+import asyncio
+import logging
+from datetime import datetime
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError, ResponseError
+
+from services.attendance_write_buffer import AttendanceWriteBuffer
+
+logger = logging.getLogger(__name__)
+
+
+class AttendanceJournal:
+    """Append-only журнал завершённых сессий до записи в video_chat_attendance.
+
+    Сессии кладёт в Redis Stream (AOF, appendonly yes) LiveSessionStore,
+    когда участница выходит. Фоновый drain читает журнал через consumer
+    group, пишет пачками через AttendanceWriteBuffer и подтверждает
+    (XACK + XDEL) только записанное. Если Supabase лежит, сессии ждут
+    в журнале; после рестарта неподтверждённые читаются заново.
+
+    Повтор безопасен: сессия вставляется с event_id (ID записи в stream)
+    и повторно не создаётся.
+    """
+
+    STREAM_KEY = "meeting_bot:attendance:journal"
+    GROUP = "attendance_writer"
+    MAX_LEN = 100000  # страховка, если drain долго не работает
+    RECONNECT_DELAY = 5  # секунд
+
+    def __init__(
+            self,
+            redis: Redis,
+            consumer: str = "bot",
+            read_count: int = 200,
+            block_ms: int = 1000
+    ):
+        self.redis = redis
+        self.consumer = consumer
+        self.read_count = read_count
+        self.block_ms = block_ms
+        self._task: asyncio.Task | None = None
+
+    # ============================================
+    # ЧТЕНИЕ И ПОДТВЕРЖДЕНИЕ (drain)
+    # ============================================
+
+    async def ensure_group(self) -> None:
+        try:
+            await self.redis.xgroup_create(self.STREAM_KEY, self.GROUP, id="0", mkstream=True)
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def read(self, last_id: str = ">") -> list[tuple[str, dict]]:
+        """Прочитать события.
+
+        Args:
+            last_id: ">" — новые; иначе — свои неподтверждённые после last_id
+        """
+        response = await self.redis.xreadgroup(
+            self.GROUP,
+            self.consumer,
+            {self.STREAM_KEY: last_id},
+            count=self.read_count,
+            block=self.block_ms if last_id == ">" else None
+        )
+        if not response:
+            return []
+
+        _, entries = response[0]
+        return [(_decode(entry_id), _decode_fields(fields)) for entry_id, fields in entries]
+
+    async def ack(self, event_ids: list[str]) -> None:
+        """Подтвердить записанные события и убрать их из stream."""
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.xack(self.STREAM_KEY, self.GROUP, *event_ids)
+            pipe.xdel(self.STREAM_KEY, *event_ids)
+            await pipe.execute()
+
+    async def drain(self, buffer: AttendanceWriteBuffer) -> None:
+        """Перекладывать события из журнала в buffer (бесконечно)."""
+        while True:
+            try:
+                await self.ensure_group()
+                break
+            except RedisError as e:
+                logger.warning(f"Attendance journal is not available: {e}")
+                await asyncio.sleep(self.RECONNECT_DELAY)
+
+        # Сначала — то, что прочитали, но не подтвердили до рестарта
+        last_id = "0"
+        while True:
+            try:
+                entries = await self.read(last_id)
+            except RedisError as e:
+                logger.warning(f"Attendance journal read failed: {e}")
+                await asyncio.sleep(self.RECONNECT_DELAY)
+                continue
+
+            if last_id != ">":
+                if not entries:
+                    last_id = ">"
+                    continue
+                logger.info(f"Replaying {len(entries)} attendance events from journal")
+                last_id = entries[-1][0]
+
+            for event_id, fields in entries:
+                await self._feed(buffer, event_id, fields)
+
+    @staticmethod
+    async def _feed(buffer: AttendanceWriteBuffer, event_id: str, fields: dict) -> None:
+        # joined_at — время по Ташкенту, его дата и есть дата встречи
+        joined_at = datetime.fromisoformat(fields["joined_at"])
+        await buffer.add_session(
+            member_id=int(fields["member_id"]),
+            meeting_date=joined_at.date(),
+            joined_at=joined_at,
+            left_at=datetime.fromisoformat(fields["left_at"]),
+            event_id=event_id
+        )
+
+    def start(self, buffer: AttendanceWriteBuffer) -> None:
+        self._task = asyncio.create_task(self.drain(buffer))
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+
+def _decode(value: bytes | str) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def _decode_fields(fields: dict) -> dict[str, str]:
+    return {_decode(key): _decode(value) for key, value in fields.items()}
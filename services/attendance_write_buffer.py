@@ -0,0 +1,212 @@
+"""Отложенная пакетная запись посещений Video Chat."""
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import date, datetime
+
+from repositories.video_chat_attendance_repository import VideoChatAttendanceRepository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class _Batch:
+    """Пачка сессий для одного вызова record_attendance_sessions."""
+    sessions: list[dict] = field(default_factory=list)
+    # ID событий журнала — подтверждаются после записи
+    event_ids: list[str] = field(default_factory=list)
+    attempts: int = 0
+
+    def __len__(self) -> int:
+        return len(self.sessions)
+
+
+class AttendanceWriteBuffer:
+    """Копит завершённые сессии Video Chat и пишет их пачками.
+
+    Когда звонок заканчивается, сотни участниц выходят разом — вместо
+    HTTP запроса на каждую пачка уходит раз в flush_interval секунд или
+    при batch_size сессиях.
+
+    Гарантии:
+        - пачки пишутся строго по очереди
+        - stop() дописывает всё, что осталось
+        - при pending >= max_pending добавление ждёт записи (backpressure)
+        - неудачная пачка повторяется max_attempts раз, потом теряется
+          с ошибкой в логе (max_attempts=None — повторять, пока не запишется)
+        - между повторами — пауза flush_interval * attempts (не больше
+          MAX_BACKOFF), чтобы при недоступной БД не долбить её в цикле
+
+    С AttendanceJournal сессии приходят из Redis Stream с event_id,
+    а после записи пачки их ID передаются в on_flushed для подтверждения.
+    """
+
+    MAX_BACKOFF = 30  # секунд
+
+    def __init__(
+            self,
+            repository: VideoChatAttendanceRepository,
+            flush_interval: float = 0.5,
+            batch_size: int = 200,
+            max_pending: int = 5000,
+            max_attempts: int | None = 3,
+            on_flushed: Callable[[list[str]], Awaitable[None]] | None = None
+    ):
+        self.repository = repository
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        self.max_attempts = max_attempts
+        self.on_flushed = on_flushed
+
+        # Последняя пачка — открытая, в неё добавляются сессии
+        self._batches: deque[_Batch] = deque([_Batch()])
+        self._flush_lock = asyncio.Lock()
+        self._wake = asyncio.Event()
+        self._drained = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._retry_at = 0.0  # monotonic: раньше неудачную пачку не повторять
+
+        # Метрики
+        self.pending = 0
+        self.max_pending_seen = 0
+        self.flushes = 0
+        self.flushed_sessions = 0
+        self.backpressure_waits = 0
+        self.failed_flushes = 0
+        self.dropped_sessions = 0
+
+    # ============================================
+    # СЕССИИ
+    # ============================================
+
+    async def add_session(
+            self,
+            member_id: int,
+            meeting_date: date,
+            joined_at: datetime,
+            left_at: datetime,
+            event_id: str | None = None
+    ) -> None:
+        row = {
+            "member_id": member_id,
+            "meeting_date": meeting_date.isoformat(),
+            "joined_at": joined_at.isoformat(),
+            "left_at": left_at.isoformat(),
+        }
+        if event_id:
+            # По нему SQL не вставит повторно сессию, записанную до рестарта
+            row["event_id"] = event_id
+        await self._add(row, event_id)
+
+    async def _add(self, row: dict, event_id: str | None) -> None:
+        while self.pending >= self.max_pending:
+            self.backpressure_waits += 1
+            self._drained.clear()
+            self._wake.set()
+            await self._drained.wait()
+
+        batch = self._batches[-1]
+        if len(batch) >= self.batch_size:
+            batch = _Batch()
+            self._batches.append(batch)
+
+        batch.sessions.append(row)
+        if event_id:
+            batch.event_ids.append(event_id)
+
+        self.pending += 1
+        self.max_pending_seen = max(self.max_pending_seen, self.pending)
+        if len(batch) >= self.batch_size:
+            self._wake.set()
+
+    # ============================================
+    # ЗАПИСЬ
+    # ============================================
+
+    async def flush(self) -> None:
+        """Записать все накопленные пачки по порядку."""
+        async with self._flush_lock:
+            pending_before = self.pending
+            if self._batches[-1]:
+                # Закрываем открытую пачку — новые сессии пойдут в следующую
+                self._batches.append(_Batch())
+
+            while len(self._batches) > 1:
+                batch = self._batches[0]
+                if batch:
+                    try:
+                        await self.repository.insert_sessions(batch.sessions)
+                    except Exception as e:
+                        self.failed_flushes += 1
+                        batch.attempts += 1
+                        if self.max_attempts is None or batch.attempts < self.max_attempts:
+                            logger.warning(f"Attendance batch failed (attempt {batch.attempts}): {e}")
+                            backoff = min(self.flush_interval * batch.attempts, self.MAX_BACKOFF)
+                            self._retry_at = time.monotonic() + backoff
+                            break
+
+                        logger.error(f"Attendance batch dropped after {batch.attempts} attempts: {e}")
+                        self.dropped_sessions += len(batch)
+                    else:
+                        self.flushes += 1
+                        self.flushed_sessions += len(batch)
+                        await self._confirm(batch)
+
+                self._batches.popleft()
+                self.pending -= len(batch)
+
+            # Иначе _add, ждущий backpressure, сразу будит _run ещё раз
+            if self.pending < pending_before:
+                self._drained.set()
+
+    async def _confirm(self, batch: _Batch) -> None:
+        if not (self.on_flushed and batch.event_ids):
+            return
+
+        try:
+            await self.on_flushed(batch.event_ids)
+        except Exception as e:
+            # Пачка уже записана: повторная запись после рестарта идемпотентна
+            logger.warning(f"Failed to confirm attendance batch: {e}")
+
+    async def _run(self) -> None:
+        while True:
+            backoff = self._retry_at - time.monotonic()
+            if backoff > 0:
+                await asyncio.sleep(backoff)
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            await self.flush()
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Остановить фоновую запись и дописать остаток."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+        await self.flush()
+        logger.info(f"Attendance write buffer stopped: {self.stats()}")
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "pending": self.pending,
+            "max_pending_seen": self.max_pending_seen,
+            "flushes": self.flushes,
+            "flushed_sessions": self.flushed_sessions,
+            "backpressure_waits": self.backpressure_waits,
+            "failed_flushes": self.failed_flushes,
+            "dropped_sessions": self.dropped_sessions,
+        }
@@ -0,0 +1,130 @@
+"""Checkpoint еженедельной очистки группы в Redis."""
+import asyncio
+import logging
+import uuid
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import date, datetime, timedelta
+
+from redis.asyncio import Redis
+
+from utils.time import get_week_start
+
+logger = logging.getLogger(__name__)
+
+# Продлить lock, только если он всё ещё наш
+REFRESH_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('EXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class CleanupCheckpoint:
+    """Прогресс cleanup_group, чтобы прерванная очистка доделалась.
+
+    Cron срабатывает раз в неделю: если worker перезапустился посреди
+    очистки, следующей попытки не будет. Поэтому:
+        {week}:job        hash: started_at — очистка начата и не закончена
+        {week}:processed  set: telegram_id уже обработанных (пишется пачками)
+        LOCK_KEY          кто сейчас выполняет очистку; TTL продлевается,
+                          пока задача жива, и истекает после её падения
+    При старте worker проверяет job своей недели и ставит cleanup_group
+    в очередь, задача пропускает уже обработанных участниц. Недоделанная
+    очистка прошлой недели под ключ текущей не попадает: её участницы
+    уже не те, и processed от неё пропустил бы новую когорту.
+    """
+
+    KEY_PREFIX = "meeting_bot:cleanup"
+    LOCK_KEY = f"{KEY_PREFIX}:lock"
+    LOCK_TTL = 60  # секунд
+    TTL = 604800  # 7 дней
+
+    def __init__(self, redis: Redis, week: date):
+        self.redis = redis
+        self.job_key = f"{self.KEY_PREFIX}:{week.isoformat()}:job"
+        self.processed_key = f"{self.KEY_PREFIX}:{week.isoformat()}:processed"
+        self._refresh = redis.register_script(REFRESH_SCRIPT)
+        self._release = redis.register_script(RELEASE_SCRIPT)
+
+    @staticmethod
+    def week_of(moment: datetime) -> date:
+        """Неделя очистки, к которой относится moment.
+
+        Cron — воскресенье 23:59, продолжение после рестарта может
+        начаться уже в понедельник: сдвиг на день кладёт запуск и его
+        продолжение в одну неделю, а следующий запуск — в новую.
+        """
+        return get_week_start(moment + timedelta(days=1))
+
+    async def begin(self, started_at: str) -> bool:
+        """Начать очистку или продолжить прерванную.
+
+        Returns:
+            True если это продолжение
+        """
+        created = await self.redis.hsetnx(self.job_key, "started_at", started_at)
+        await self.redis.expire(self.job_key, self.TTL)
+        return not created
+
+    async def is_unfinished(self) -> bool:
+        return bool(await self.redis.exists(self.job_key))
+
+    async def get_processed(self) -> set[int]:
+        return {int(telegram_id) for telegram_id in await self.redis.smembers(self.processed_key)}
+
+    async def mark_processed(self, telegram_ids: list[int]) -> None:
+        if not telegram_ids:
+            return
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.sadd(self.processed_key, *(str(telegram_id) for telegram_id in telegram_ids))
+            pipe.expire(self.processed_key, self.TTL)
+            await pipe.execute()
+
+    async def finish(self) -> None:
+        await self.redis.delete(self.job_key, self.processed_key)
+
+    @asynccontextmanager
+    async def lock(self, wait: float = 0) -> AsyncIterator[bool]:
+        """Lock на время очистки (с heartbeat).
+
+        Args:
+            wait: сколько ждать, если lock занят (упавший worker
+                  отпускает его через LOCK_TTL)
+
+        Yields:
+            True если lock получен
+        """
+        token = uuid.uuid4().hex
+        deadline = asyncio.get_running_loop().time() + wait
+
+        while not await self.redis.set(self.LOCK_KEY, token, nx=True, ex=self.LOCK_TTL):
+            if asyncio.get_running_loop().time() >= deadline:
+                yield False
+                return
+            await asyncio.sleep(min(5, self.LOCK_TTL / 4))
+
+        async def heartbeat() -> None:
+            while True:
+                await asyncio.sleep(self.LOCK_TTL / 3)
+                await self._refresh(keys=[self.LOCK_KEY], args=[token, self.LOCK_TTL])
+
+        task = asyncio.create_task(heartbeat())
+        try:
+            yield True
+        finally:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            await self._release(keys=[self.LOCK_KEY], args=[token])
@@ -1,12 +1,35 @@
+import asyncio
 import logging
 from aiogram import Bot
-from aiogram.exceptions import TelegramBadRequest, TelegramForbiddenError
+from aiogram.exceptions import (
+    TelegramAPIError,
+    TelegramBadRequest,
+    TelegramForbiddenError,
+    TelegramRetryAfter,
+)
 from repositories.command_message_repository import CommandMessageRepository
 
 logger = logging.getLogger(__name__)
 
 
 class CommandMessageService:
+    """Удаление сообщений бота в топике команд.
+
+    Сообщения удаляются пачками через deleteMessages (до CHUNK_SIZE id
+    за запрос). Пачка, которую Telegram отклонил, удаляется по одному —
+    так видно, какие именно сообщения не удалились. Из БД убираются
+    удалённые и те, что не удалятся никогда (уже нет в чате, старше
+    48 часов); после Forbidden и временных ошибок строки остаются до
+    следующего /clear.
+    """
+
+    CHUNK_SIZE = 100  # лимит deleteMessages
+    # Ответы deleteMessage, после которых повторять бессмысленно
+    PERMANENT_ERRORS = (
+        "message to delete not found",
+        "message can't be deleted",
+        "message_id_invalid",
+    )
 
     def __init__(self, bot: Bot, repository: CommandMessageRepository, chat_id: int):
         self.bot = bot
@@ -14,21 +37,67 @@ class CommandMessageService:
         self.chat_id = chat_id
 
     async def clear_messages(self) -> int:
-        messages = await self.repository.get_all_messages()
+        found_count = 0
+        deleted_count = 0
 
-        logger.info(f"Found {len(messages)} messages to delete")
+        async for messages in self.repository.iter_messages():
+            found_count += len(messages)
+            message_ids = list(dict.fromkeys(message.message_id for message in messages))
 
-        deleted_count = 0
-        for message in messages:
+            removed: list[int] = []
+            for start in range(0, len(message_ids), self.CHUNK_SIZE):
+                chunk = message_ids[start:start + self.CHUNK_SIZE]
+                deleted, gone = await self._delete_chunk(chunk)
+                deleted_count += deleted
+                removed.extend(gone)
+
+            if removed:
+                await self.repository.delete_by_message_ids(removed)
+
+        logger.info(f"Deleted {deleted_count} of {found_count} messages")
+        return deleted_count
+
+    async def _delete_chunk(self, message_ids: list[int]) -> tuple[int, list[int]]:
+        """Returns:
+            (сколько удалено, id которые можно убрать из БД)
+        """
+        while True:
             try:
-                await self.bot.delete_message(chat_id=self.chat_id, message_id=message.message_id)
-                deleted_count += 1
-            except TelegramBadRequest as e:
-                logger.warning(f"Cannot delete message {message.message_id}: {e}")
+                await self.bot.delete_messages(chat_id=self.chat_id, message_ids=message_ids)
+                return len(message_ids), message_ids
+            except TelegramRetryAfter as e:
+                logger.warning(f"Flood wait {e.retry_after} s on deleteMessages")
+                await asyncio.sleep(e.retry_after)
             except TelegramForbiddenError as e:
-                logger.error(f"No permission to delete message {message.message_id}: {e}")
+                # Нет прав — по одному тоже не удалится
+                logger.error(f"No permission to delete {len(message_ids)} messages: {e}")
+                return 0, []
+            except TelegramBadRequest as e:
+                logger.warning(f"Cannot delete {len(message_ids)} messages at once, one by one: {e}")
+                break
 
-        await self.repository.delete_all_messages()
+        deleted_count = 0
+        gone: list[int] = []
+        for message_id in message_ids:
+            while True:
+                try:
+                    await self.bot.delete_message(chat_id=self.chat_id, message_id=message_id)
+                    deleted_count += 1
+                    gone.append(message_id)
+                except TelegramRetryAfter as e:
+                    # Иначе все остальные сообщения пачки упрутся в тот же flood wait
+                    logger.warning(f"Flood wait {e.retry_after} s on deleteMessage")
+                    await asyncio.sleep(e.retry_after)
+                    continue
+                except TelegramBadRequest as e:
+                    logger.warning(f"Cannot delete message {message_id}: {e}")
+                    if any(reason in e.message.lower() for reason in self.PERMANENT_ERRORS):
+                        gone.append(message_id)
+                except TelegramForbiddenError as e:
+                    logger.error(f"No permission to delete message {message_id}: {e}")
+                except TelegramAPIError as e:
+                    # Временная ошибка — строка останется до следующего /clear
+                    logger.warning(f"Failed to delete message {message_id}: {e}")
+                break
 
-        logger.info(f"Deleted {deleted_count} messages")
-        return deleted_count
\ No newline at end of file
+        return deleted_count, gone
@@ -0,0 +1,127 @@
+"""Открытые сессии Video Chat в Redis hash."""
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+
+from redis.asyncio import Redis
+
+from services.attendance_journal import AttendanceJournal
+
+logger = logging.getLogger(__name__)
+
+# Закрыть сессию: забрать joined_at из hash и положить готовую сессию
+# в журнал — атомарно, одним запросом. Возвращает {event_id, joined_at}
+CLOSE_SCRIPT = """
+local joined_at = redis.call('HGET', KEYS[1], ARGV[1])
+if not joined_at then
+    return false
+end
+redis.call('HDEL', KEYS[1], ARGV[1])
+local event_id = redis.call(
+    'XADD', KEYS[2], 'MAXLEN', '~', ARGV[3], '*',
+    'member_id', ARGV[1], 'joined_at', joined_at, 'left_at', ARGV[2]
+)
+return {event_id, joined_at}
+"""
+
+# Конец звонка: все открытые сессии — в журнал, hash — очистить.
+# Возвращает закрытые сессии: member_id, joined_at, member_id, ...
+CLOSE_ALL_SCRIPT = """
+local open = redis.call('HGETALL', KEYS[1])
+for i = 1, #open, 2 do
+    redis.call(
+        'XADD', KEYS[2], 'MAXLEN', '~', ARGV[2], '*',
+        'member_id', open[i], 'joined_at', open[i + 1], 'left_at', ARGV[1]
+    )
+end
+redis.call('DEL', KEYS[1])
+return open
+"""
+
+
+@dataclass(slots=True)
+class ClosedSession:
+    """Завершённая сессия, ушедшая в журнал."""
+    member_id: int
+    joined_at: datetime
+    left_at: datetime
+    event_id: str | None = None
+
+
+class LiveSessionStore:
+    """member_id → joined_at участниц, которые сейчас в звонке.
+
+    Пока звонок идёт, в БД ничего не пишется: вход — HSETNX, выход —
+    скрипт, который убирает участницу из hash и кладёт готовую сессию
+    (joined_at, left_at) в AttendanceJournal. Оттуда сессии пачками
+    вставляются в video_chat_attendance — без UPDATE с поиском открытой
+    записи. Число участниц в звонке — HLEN, без запросов к БД.
+    """
+
+    KEY = "meeting_bot:video_chat:live_sessions"
+
+    def __init__(self, redis: Redis):
+        self.redis = redis
+        self._close = redis.register_script(CLOSE_SCRIPT)
+        self._close_all = redis.register_script(CLOSE_ALL_SCRIPT)
+
+    async def open(self, member_id: int, joined_at: datetime) -> bool:
+        """Участница вошла.
+
+        Returns:
+            False если сессия уже открыта (повторный join не сдвигает начало)
+        """
+        return bool(await self.redis.hsetnx(self.KEY, str(member_id), joined_at.isoformat()))
+
+    async def close(self, member_id: int, left_at: datetime) -> ClosedSession | None:
+        """Участница вышла — сессия уходит в журнал.
+
+        Returns:
+            Закрытая сессия, None если открытой сессии не было
+        """
+        closed = await self._close(
+            keys=[self.KEY, AttendanceJournal.STREAM_KEY],
+            args=[str(member_id), left_at.isoformat(), AttendanceJournal.MAX_LEN]
+        )
+        if not closed:
+            logger.debug("No open session for member %s", member_id)
+            return None
+
+        event_id, joined_at = (_decode(value) for value in closed)
+        return ClosedSession(
+            member_id=member_id,
+            joined_at=datetime.fromisoformat(joined_at),
+            left_at=left_at,
+            event_id=event_id,
+        )
+
+    async def close_all(self, left_at: datetime) -> list[ClosedSession]:
+        """Звонок завершён — закрыть все сессии.
+
+        Returns:
+            Закрытые сессии
+        """
+        closed = await self._close_all(
+            keys=[self.KEY, AttendanceJournal.STREAM_KEY],
+            args=[left_at.isoformat(), AttendanceJournal.MAX_LEN]
+        )
+        return [
+            ClosedSession(
+                member_id=int(_decode(member_id)),
+                joined_at=datetime.fromisoformat(_decode(joined_at)),
+                left_at=left_at,
+            )
+            for member_id, joined_at in zip(closed[::2], closed[1::2])
+        ]
+
+    async def get_member_ids(self) -> set[int]:
+        """Кто сейчас в звонке."""
+        return {int(member_id) for member_id in await self.redis.hkeys(self.KEY)}
+
+    async def count(self) -> int:
+        """Сколько участниц сейчас в звонке."""
+        return await self.redis.hlen(self.KEY)
+
+
+def _decode(value: bytes | str) -> str:
+    return value.decode() if isinstance(value, bytes) else value
@@ -0,0 +1,99 @@
+"""Таймлайн посещаемости встречи с кэшем в Redis."""
+import json
+import logging
+from dataclasses import asdict
+from datetime import date, datetime
+
+from redis.asyncio import Redis
+
+from repositories.video_chat_attendance_repository import VideoChatAttendanceRepository
+from services.attendance_analytics import MeetingTimeline, build_timeline
+from services.attendance_journal import AttendanceJournal
+from services.live_sessions import LiveSessionStore
+from utils.time import get_tashkent_now
+
+logger = logging.getLogger(__name__)
+
+
+def dump_timeline(timeline: MeetingTimeline) -> str:
+    data = asdict(timeline)
+    for name in ("started_at", "peak_at"):
+        if data[name]:
+            data[name] = data[name].isoformat()
+    return json.dumps(data, separators=(",", ":"))
+
+
+def load_timeline(raw: str | bytes) -> MeetingTimeline:
+    data = json.loads(raw)
+    for name in ("started_at", "peak_at"):
+        if data[name]:
+            data[name] = datetime.fromisoformat(data[name])
+    return MeetingTimeline(**data)
+
+
+class MeetingTimelineService:
+    """Сколько было в звонке по минутам, пик и удержание — по meeting_date.
+
+    Таймлайн строится одним проходом по сессиям встречи
+    (build_timeline). Пока встреча идёт, он пересчитывается на каждый
+    запрос; когда закончилась — сохраняется в Redis навсегда, и
+    повторных чтений всех сессий больше нет.
+
+    Встреча закончилась, если она не сегодня или сегодня звонок
+    завершён (mark_ended по GroupCallDiscarded), а все сессии закрыты
+    (LiveSessionStore пуст) и записаны в БД (журнал пуст). Пустой звонок
+    в паузе между участницами законченной встречей не считается.
+    """
+
+    REDIS_KEY = "meeting_bot:meeting_timeline:{meeting_date}"
+    ENDED_KEY = "meeting_bot:meeting_timeline:{meeting_date}:ended"
+    ENDED_TTL = 172800  # 2 дня: дальше встреча и так в прошлом
+
+    def __init__(
+            self,
+            redis: Redis,
+            repository: VideoChatAttendanceRepository,
+            live_sessions: LiveSessionStore
+    ):
+        self.redis = redis
+        self.repository = repository
+        self.live_sessions = live_sessions
+
+    def _key(self, meeting_date: date) -> str:
+        return self.REDIS_KEY.format(meeting_date=meeting_date.isoformat())
+
+    def _ended_key(self, meeting_date: date) -> str:
+        return self.ENDED_KEY.format(meeting_date=meeting_date.isoformat())
+
+    async def mark_started(self, meeting_date: date) -> None:
+        """Звонок начался — таймлайн дня снова меняется."""
+        await self.redis.delete(self._ended_key(meeting_date), self._key(meeting_date))
+
+    async def mark_ended(self, meeting_date: date) -> None:
+        """Звонок завершён — таймлайн можно сохранить."""
+        await self.redis.set(self._ended_key(meeting_date), "1", ex=self.ENDED_TTL)
+
+    async def get(self, meeting_date: date) -> MeetingTimeline:
+        raw = await self.redis.get(self._key(meeting_date))
+        if raw:
+            return load_timeline(raw)
+
+        video_data = await self.repository.get_sessions_by_date(meeting_date)
+        timeline = build_timeline(video_data)
+
+        # Пустой таймлайн не кэшируем: встреча могла ещё не начаться
+        if timeline.members_count and await self._is_finished(meeting_date):
+            await self.redis.set(self._key(meeting_date), dump_timeline(timeline), nx=True)
+            logger.info(f"Saved meeting timeline for {meeting_date}")
+
+        return timeline
+
+    async def _is_finished(self, meeting_date: date) -> bool:
+        if meeting_date < get_tashkent_now().date():
+            return True
+
+        return (
+            bool(await self.redis.exists(self._ended_key(meeting_date)))
+            and await self.live_sessions.count() == 0
+            and await self.redis.xlen(AttendanceJournal.STREAM_KEY) == 0
+        )
@@ -0,0 +1,130 @@
+"""Кэш участниц по Telegram ID для Video Chat."""
+import logging
+import time
+from collections import OrderedDict
+
+from redis.asyncio import Redis
+
+from models.member import Member
+from repositories.member_repository import MemberRepository
+
+logger = logging.getLogger(__name__)
+
+
+class MemberLookupService:
+    """LRU/TTL кэш telegram_id → Member в памяти consumer'а Video Chat.
+
+    В пятницу в 14:00 за минуту заходят сотни участниц — без кэша это
+    по запросу в Supabase на каждую. Кэш прогревается целиком, когда
+    появляется звонок, а «не наши» (админы, чужие) кэшируются как None.
+
+    Инвалидация:
+        on_member_joined (бот) и cleanup_group (worker) — публикуют
+        в INVALIDATE_CHANNEL, consumer слушает канал и сбрасывает кэш
+    """
+
+    INVALIDATE_CHANNEL = "meeting_bot:member_lookup:invalidate"
+    INVALIDATE_ALL = "*"
+
+    def __init__(
+            self,
+            repository: MemberRepository,
+            max_size: int = 10000,
+            ttl: float = 172800,  # 48 часов: прогрев в четверг, звонок в пятницу
+            negative_ttl: float = 600
+    ):
+        self.repository = repository
+        self.max_size = max_size
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        # telegram_id → (expires_at, Member | None)
+        self._cache: OrderedDict[int, tuple[float, Member | None]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._warmed_call_id: int | None = None
+
+    async def get(self, telegram_id: int) -> Member | None:
+        """Участница по Telegram ID (None — не наша)."""
+        cached = self._cache.get(telegram_id)
+        if cached and cached[0] > time.monotonic():
+            self._cache.move_to_end(telegram_id)
+            self.hits += 1
+            return cached[1]
+
+        self.misses += 1
+        member = await self.repository.get_by_telegram_id(telegram_id)
+        if member:
+            self.put(member)
+        else:
+            self._set(telegram_id, None, self.negative_ttl)
+
+        return member
+
+    def put(self, member: Member) -> None:
+        """Положить участницу в кэш (заменяет и отрицательную запись)."""
+        self._set(member.telegram_id, member, self.ttl)
+
+    def invalidate(self, telegram_id: int | None = None) -> None:
+        """Сбросить одну запись или весь кэш."""
+        if telegram_id is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(telegram_id, None)
+
+    async def warm_up(self) -> int:
+        """Загрузить участниц, которые сейчас в группе, страницами.
+
+        Ушедшие из группы в звонок не попадут — им хватит промаха кэша.
+        Если участниц больше max_size, LRU оставит последние страницы.
+        """
+        self._cache.clear()
+        count = 0
+        async for members in self.repository.iter_in_group(prefetch=True):
+            for member in members:
+                self.put(member)
+            count += len(members)
+
+        logger.info(f"Member lookup cache warmed up: {count} members")
+        return count
+
+    async def warm_up_for_call(self, call_id: int) -> bool:
+        """Прогреть кэш один раз на звонок.
+
+        Returns:
+            True если кэш был прогрет сейчас
+        """
+        if self._warmed_call_id == call_id:
+            return False
+
+        # Запоминаем после успеха: упавший прогрев повторится с событием
+        await self.warm_up()
+        self._warmed_call_id = call_id
+        return True
+
+    def _set(self, telegram_id: int, member: Member | None, ttl: float) -> None:
+        self._cache[telegram_id] = (time.monotonic() + ttl, member)
+        self._cache.move_to_end(telegram_id)
+
+        while len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+
+    # ============================================
+    # ИНВАЛИДАЦИЯ МЕЖДУ ПРОЦЕССАМИ
+    # ============================================
+
+    @classmethod
+    async def publish_invalidation(cls, redis: Redis, telegram_id: int | None = None) -> None:
+        """Попросить consumer сбросить кэш (из бота или worker'а)."""
+        message = cls.INVALIDATE_ALL if telegram_id is None else str(telegram_id)
+        await redis.publish(cls.INVALIDATE_CHANNEL, message)
+
+    def handle_invalidation(self, message: bytes | str) -> None:
+        """Обработать сообщение из INVALIDATE_CHANNEL."""
+        if isinstance(message, bytes):
+            message = message.decode()
+
+        if message == self.INVALIDATE_ALL:
+            self.invalidate()
+            logger.debug("Member lookup cache cleared")
+        else:
+            self.invalidate(int(message))
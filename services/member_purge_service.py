@@ -0,0 +1,184 @@
+"""Удаление участниц из группы с учётом лимитов Bot API."""
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramBadRequest, TelegramForbiddenError, TelegramRetryAfter
+
+from utils.rate_limit import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+BAN = "ban"
+UNBAN = "unban"
+
+# on_processed(kicked, failed, permanent)
+ProcessedCallback = Callable[[list[int], list[int], list[int]], Awaitable[None]]
+
+
+@dataclass
+class PurgeResult:
+    """Итог очистки."""
+    kicked: int = 0
+    failed: list[int] = field(default_factory=list)
+    permanent: list[int] = field(default_factory=list)  # из failed: повтор не поможет
+    retried: int = 0
+    retry_after_waits: int = 0
+    requests: int = 0
+    seconds: float = 0
+
+
+@dataclass(slots=True)
+class _Task:
+    telegram_id: int
+    step: str = BAN
+    attempts: int = 0
+    permanent: bool = False
+
+
+class MemberPurgeService:
+    """Kick участниц: ban + unban, параллельно и без flood wait.
+
+    Все запросы проходят через один TokenBucket (rate в секунду),
+    выполняют их concurrency воркеров. TelegramRetryAfter — не ошибка:
+    лимитер встаёт на паузу retry_after для всех воркеров, запрос
+    повторяется. Прочие ошибки отправляют участницу в очередь повтора
+    с того же шага (ban уже прошёл — повторяется только unban), после
+    max_attempts она попадает в failed. TelegramBadRequest и
+    TelegramForbiddenError (нет такой участницы, админ, нет прав)
+    повтором не лечатся — сразу в failed и в permanent.
+
+    on_processed(kicked, failed, permanent) получает telegram_id
+    обработанных пачками по checkpoint_every — для checkpoint'а
+    прерванной очистки; permanent — часть failed.
+    """
+
+    PROGRESS_EVERY = 50  # участниц между строками прогресса в логе
+
+    def __init__(
+            self,
+            bot: Bot,
+            chat_id: int,
+            rate: float = 20,
+            concurrency: int = 8,
+            max_attempts: int = 3,
+            retry_delay: float = 1,
+            on_processed: ProcessedCallback | None = None,
+            checkpoint_every: int = 50
+    ):
+        self.bot = bot
+        self.chat_id = chat_id
+        self.limiter = TokenBucket(rate=rate)
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.on_processed = on_processed
+        self.checkpoint_every = checkpoint_every
+        self._kicked: list[int] = []
+        self._failed: list[int] = []
+        self._permanent: list[int] = []
+
+    async def purge(self, telegram_ids: list[int]) -> PurgeResult:
+        result = PurgeResult()
+        started = time.monotonic()
+        queue: asyncio.Queue[_Task] = asyncio.Queue()
+        retry_queue: list[_Task] = []
+
+        for telegram_id in telegram_ids:
+            queue.put_nowait(_Task(telegram_id))
+
+        async def worker() -> None:
+            while True:
+                try:
+                    task = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                kicked = await self._process(task, result, retry_queue)
+                if kicked is not None:
+                    (self._kicked if kicked else self._failed).append(task.telegram_id)
+                    if task.permanent:
+                        self._permanent.append(task.telegram_id)
+                    if len(self._kicked) + len(self._failed) >= self.checkpoint_every:
+                        await self._checkpoint()
+                done = result.kicked + len(result.failed)
+                if done and done % self.PROGRESS_EVERY == 0:
+                    self._log_progress(result, len(telegram_ids), started)
+
+        # Проход, затем очередь повтора — пока есть что повторять
+        while not queue.empty():
+            await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+            if retry_queue:
+                result.retried += len(retry_queue)
+                logger.info(f"Retrying {len(retry_queue)} members in {self.retry_delay} s")
+                await asyncio.sleep(self.retry_delay)
+                for task in retry_queue:
+                    queue.put_nowait(task)
+                retry_queue.clear()
+
+        await self._checkpoint()
+        result.seconds = time.monotonic() - started
+        self._log_progress(result, len(telegram_ids), started)
+        return result
+
+    async def _checkpoint(self) -> None:
+        if not self.on_processed or not (self._kicked or self._failed):
+            return
+
+        kicked, self._kicked = self._kicked, []
+        failed, self._failed = self._failed, []
+        permanent, self._permanent = self._permanent, []
+        try:
+            await self.on_processed(kicked, failed, permanent)
+        except Exception as e:
+            # Без checkpoint'а очистка всё равно идёт — при повторе их просто кикнут ещё раз
+            logger.warning(f"Failed to save purge checkpoint ({len(kicked) + len(failed)} members): {e}")
+
+    async def _process(self, task: _Task, result: PurgeResult, retry_queue: list[_Task]) -> bool | None:
+        """Returns:
+            True — kicked, False — failed, None — ушла на повтор
+        """
+        while True:
+            await self.limiter.acquire()
+            result.requests += 1
+            try:
+                if task.step == BAN:
+                    await self.bot.ban_chat_member(chat_id=self.chat_id, user_id=task.telegram_id)
+                    task.step = UNBAN
+                    continue
+
+                await self.bot.unban_chat_member(chat_id=self.chat_id, user_id=task.telegram_id)
+                result.kicked += 1
+                logger.debug(f"Kicked {task.telegram_id}")
+                return True
+            except TelegramRetryAfter as e:
+                # Flood wait: ждут все, этот же запрос — ещё раз
+                result.retry_after_waits += 1
+                logger.warning(f"Flood wait {e.retry_after} s on {task.step} {task.telegram_id}")
+                self.limiter.pause(e.retry_after)
+            except (TelegramBadRequest, TelegramForbiddenError) as e:
+                logger.error(f"Failed to {task.step} {task.telegram_id}: {e}")
+                result.failed.append(task.telegram_id)
+                result.permanent.append(task.telegram_id)
+                task.permanent = True
+                return False
+            except Exception as e:
+                task.attempts += 1
+                if task.attempts >= self.max_attempts:
+                    logger.error(f"Failed to {task.step} {task.telegram_id} after {task.attempts} attempts: {e}")
+                    result.failed.append(task.telegram_id)
+                    return False
+                logger.warning(f"Failed to {task.step} {task.telegram_id}, will retry: {e}")
+                retry_queue.append(task)
+                return None
+
+    def _log_progress(self, result: PurgeResult, total: int, started: float) -> None:
+        elapsed = time.monotonic() - started
+        done = result.kicked + len(result.failed)
+        logger.info(
+            f"Purge: {done}/{total} ({result.kicked} kicked, {len(result.failed)} failed), "
+            f"{result.requests} requests in {elapsed:.1f} s, "
+            f"{result.retry_after_waits} flood waits"
+        )
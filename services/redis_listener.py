@@ -0,0 +1,84 @@
+"""Подписка бота на Redis pub/sub каналы."""
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+ChannelCallback = Callable[[bytes], Awaitable[None] | None]
+ResyncCallback = Callable[[], Awaitable[None]]
+
+
+class RedisChannelListener:
+    """Один pub/sub коннект на все каналы бота.
+
+    Worker публикует события (сброс кэша, новый звонок), бот реагирует
+    в памяти процесса. При обрыве соединения подписка восстанавливается,
+    а состояние перечитывается через resync — пропущенные за время
+    обрыва сообщения не теряются.
+    """
+
+    RECONNECT_DELAY = 5  # секунд
+
+    def __init__(self, redis: Redis):
+        self.redis = redis
+        self._callbacks: dict[str, ChannelCallback] = {}
+        self._resyncs: list[ResyncCallback] = []
+        self._task: asyncio.Task | None = None
+
+    def subscribe(
+            self,
+            channel: str,
+            callback: ChannelCallback,
+            resync: ResyncCallback | None = None
+    ) -> None:
+        """Зарегистрировать обработчик канала (до start).
+
+        Args:
+            resync: вызывается после каждой (пере)подписки
+        """
+        self._callbacks[channel] = callback
+        if resync:
+            self._resyncs.append(resync)
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                async with self.redis.pubsub() as pubsub:
+                    await pubsub.subscribe(*self._callbacks)
+                    logger.info(f"Listening Redis channels: {', '.join(self._callbacks)}")
+
+                    for resync in self._resyncs:
+                        await resync()
+
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            await self._dispatch(message["channel"], message["data"])
+            except RedisError as e:
+                logger.warning(f"Redis listener disconnected: {e}")
+                await asyncio.sleep(self.RECONNECT_DELAY)
+
+    async def _dispatch(self, channel: bytes | str, data: bytes) -> None:
+        if isinstance(channel, bytes):
+            channel = channel.decode()
+
+        try:
+            result = self._callbacks[channel](data)
+            if isinstance(result, Awaitable):
+                await result
+        except Exception as e:
+            logger.error(f"Failed to handle message from {channel}: {e}")
@@ -0,0 +1,348 @@
+"""Счётчики статистики в Redis, обновляемые по событиям."""
+import asyncio
+import json
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from repositories.statistics_repository import StatisticsRepository
+from services.attendance_analytics import load_sessions, member_totals, merge_intervals, merge_spans
+from services.live_sessions import LiveSessionStore
+from utils.time import get_week_start
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ManagerCounters:
+    """Счётчики менеджера за неделю."""
+    members: int = 0
+    video: int = 0
+    duration_seconds: float = 0
+    timed_members: int = 0
+    completed: int = 0
+    rejected: int = 0
+
+
+class StatisticsCounterService:
+    """Недельные счётчики по менеджерам.
+
+    Handlers инкрементируют их по мере событий, StatisticsService читает
+    за O(менеджеров) вместо сканирования таблиц. Расхождения с БД
+    исправляет периодическая сверка (reconcile).
+
+    Ключи:
+        {prefix}:{week}:{manager_id}        hash: members, completed, rejected,
+                                                  duration_seconds
+        {prefix}:{week}:{manager_id}:video  set: member_id участниц на видео
+        {prefix}:{week}:{manager_id}:timed  set: member_id с завершённой сессией > 0
+        {prefix}:{week}:{manager_id}:spans  hash: member_id → склеенные интервалы на видео
+        {prefix}:{week}:ready               неделя хотя бы раз сверена с БД
+        {prefix}:{week}:member_managers     hash: member_id → manager_id участниц,
+                                                  пришедших на этой неделе
+        {prefix}:version                    растёт при каждом изменении счётчиков
+    """
+
+    KEY_PREFIX = "meeting_bot:stats_counters"
+    VERSION_KEY = f"{KEY_PREFIX}:version"
+    WEEK_TTL = 1209600  # 14 дней
+
+    def __init__(self, redis: Redis):
+        self.redis = redis
+
+    def _week_key(self, week_start: date, manager_id: int) -> str:
+        return f"{self.KEY_PREFIX}:{week_start.isoformat()}:{manager_id}"
+
+    def _video_key(self, week_start: date, manager_id: int) -> str:
+        return f"{self._week_key(week_start, manager_id)}:video"
+
+    def _timed_key(self, week_start: date, manager_id: int) -> str:
+        return f"{self._week_key(week_start, manager_id)}:timed"
+
+    def _spans_key(self, week_start: date, manager_id: int) -> str:
+        return f"{self._week_key(week_start, manager_id)}:spans"
+
+    def _ready_key(self, week_start: date) -> str:
+        return f"{self.KEY_PREFIX}:{week_start.isoformat()}:ready"
+
+    def _member_managers_key(self, week_start: date) -> str:
+        return f"{self.KEY_PREFIX}:{week_start.isoformat()}:member_managers"
+
+    # ============================================
+    # СОБЫТИЯ
+    # ============================================
+
+    async def record_member_joined(
+            self,
+            member_id: int,
+            manager_id: int,
+            joined_at: datetime
+    ) -> None:
+        """Участница вошла в группу."""
+        week_start = get_week_start(joined_at)
+        week_key = self._week_key(week_start, manager_id)
+        member_managers_key = self._member_managers_key(week_start)
+
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.hincrby(week_key, "members", 1)
+                pipe.expire(week_key, self.WEEK_TTL)
+                pipe.hset(member_managers_key, str(member_id), str(manager_id))
+                pipe.expire(member_managers_key, self.WEEK_TTL)
+                pipe.incr(self.VERSION_KEY)
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Failed to count member {member_id}: {e}")
+
+    async def record_video_joined(
+            self,
+            member_id: int,
+            member_joined_at: datetime,
+            at: datetime
+    ) -> None:
+        """Участница вошла в Video Chat."""
+        try:
+            week_start = get_week_start(at)
+            # Видео считается только для участниц, пришедших на этой же неделе
+            if get_week_start(member_joined_at) != week_start:
+                return
+
+            manager_id = await self._get_manager_id(member_id, week_start)
+            if manager_id is None:
+                return
+
+            video_key = self._video_key(week_start, manager_id)
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.sadd(video_key, str(member_id))
+                pipe.expire(video_key, self.WEEK_TTL)
+                pipe.incr(self.VERSION_KEY)
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Failed to count video join for member {member_id}: {e}")
+
+    async def record_video_left(
+            self,
+            member_id: int,
+            member_joined_at: datetime,
+            video_joined_at: datetime,
+            at: datetime
+    ) -> None:
+        """Участница вышла из Video Chat.
+
+        video_joined_at — начало сессии из LiveSessionStore.close.
+        Время считается как в reconcile (member_totals): сессия
+        склеивается с прошлыми сессиями участницы за неделю, и к
+        duration_seconds добавляется только прирост покрытого времени.
+        """
+        try:
+            start, end = _to_ms(video_joined_at), _to_ms(at)
+            week_start = get_week_start(at)
+            if end <= start or get_week_start(member_joined_at) != week_start:
+                return
+
+            manager_id = await self._get_manager_id(member_id, week_start)
+            if manager_id is None:
+                return
+
+            spans_key = self._spans_key(week_start, manager_id)
+            raw_spans = await self.redis.hget(spans_key, str(member_id))
+            spans = json.loads(raw_spans) if raw_spans else []
+            merged = merge_spans(spans + [[start, end]])
+            added = (_covered(merged) - _covered(spans)) / 1000
+
+            week_key = self._week_key(week_start, manager_id)
+            timed_key = self._timed_key(week_start, manager_id)
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.hset(spans_key, str(member_id), json.dumps(merged, separators=(",", ":")))
+                pipe.expire(spans_key, self.WEEK_TTL)
+                if added > 0:
+                    pipe.hincrbyfloat(week_key, "duration_seconds", added)
+                pipe.expire(week_key, self.WEEK_TTL)
+                # Среднее считается на участницу, а не на сессию
+                pipe.sadd(timed_key, str(member_id))
+                pipe.expire(timed_key, self.WEEK_TTL)
+                pipe.incr(self.VERSION_KEY)
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Failed to count video leave for member {member_id}: {e}")
+
+    async def record_application(
+            self,
+            manager_id: int | None,
+            status: str,
+            created_at: datetime
+    ) -> None:
+        """Сохранена анкета (completed / rejected).
+
+        Без менеджера не считается: такой ключ недели никто не читает.
+        """
+        if manager_id is None:
+            logger.debug(f"Skipping {status} application without manager")
+            return
+
+        week_key = self._week_key(get_week_start(created_at), manager_id)
+
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.hincrby(week_key, status, 1)
+                pipe.expire(week_key, self.WEEK_TTL)
+                pipe.incr(self.VERSION_KEY)
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Failed to count {status} application: {e}")
+
+    async def _get_manager_id(self, member_id: int, week_start: date) -> int | None:
+        manager_id = await self.redis.hget(self._member_managers_key(week_start), str(member_id))
+        if manager_id is None:
+            # Участница не из счётчиков — догонит сверка
+            logger.debug(f"No manager for member {member_id} in counters")
+            return None
+
+        return int(manager_id)
+
+    # ============================================
+    # ЧТЕНИЕ
+    # ============================================
+
+    async def get_version(self) -> int:
+        """Текущая версия счётчиков (меняется при каждом событии)."""
+        version = await self.redis.get(self.VERSION_KEY)
+        return int(version) if version else 0
+
+    async def get_week_counters(
+            self,
+            week_start: date,
+            manager_ids: list[int]
+    ) -> dict[int, ManagerCounters] | None:
+        """Счётчики менеджеров за неделю.
+
+        Returns:
+            None если неделя ещё ни разу не сверялась с БД
+        """
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.exists(self._ready_key(week_start))
+            for manager_id in manager_ids:
+                pipe.hgetall(self._week_key(week_start, manager_id))
+                pipe.scard(self._video_key(week_start, manager_id))
+                pipe.scard(self._timed_key(week_start, manager_id))
+            ready, *results = await pipe.execute()
+
+        if not ready:
+            return None
+
+        counters = {}
+        for i, manager_id in enumerate(manager_ids):
+            values = {k.decode(): v for k, v in results[i * 3].items()}
+            counters[manager_id] = ManagerCounters(
+                members=int(values.get("members", 0)),
+                video=results[i * 3 + 1],
+                duration_seconds=float(values.get("duration_seconds", 0)),
+                timed_members=results[i * 3 + 2],
+                completed=int(values.get("completed", 0)),
+                rejected=int(values.get("rejected", 0)),
+            )
+
+        return counters
+
+    # ============================================
+    # СВЕРКА С БД
+    # ============================================
+
+    async def reconcile(
+            self,
+            repository: StatisticsRepository,
+            start_date: datetime,
+            end_date: datetime
+    ) -> None:
+        """Пересобрать счётчики недели из БД."""
+        week_start = start_date.date()
+        managers = await repository.get_active_managers()
+
+        async def collect(manager_id: int) -> tuple[list[dict], list[dict], int, int]:
+            members = await repository.get_members_by_manager(manager_id, start_date, end_date)
+            return (
+                members,
+                *await asyncio.gather(
+                    repository.get_video_attendance_by_members(
+                        [m["id"] for m in members], start_date, end_date
+                    ),
+                    repository.get_applications_count_by_status(
+                        manager_id, "completed", start_date, end_date
+                    ),
+                    repository.get_applications_count_by_status(
+                        manager_id, "rejected", start_date, end_date
+                    ),
+                )
+            )
+
+        collected = await asyncio.gather(*(collect(m["id"]) for m in managers))
+        # Кто сейчас в звонке: их сессий ещё нет в БД
+        live_member_ids = {
+            int(member_id) for member_id in await self.redis.hkeys(LiveSessionStore.KEY)
+        }
+
+        member_managers_key = self._member_managers_key(week_start)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.delete(member_managers_key)
+            for manager, (members, video_data, completed, rejected) in zip(managers, collected):
+                week_key = self._week_key(week_start, manager["id"])
+                video_key = self._video_key(week_start, manager["id"])
+                timed_key = self._timed_key(week_start, manager["id"])
+                spans_key = self._spans_key(week_start, manager["id"])
+
+                timed_member_ids, totals = member_totals(video_data)
+
+                pipe.delete(week_key, video_key, timed_key, spans_key)
+                pipe.hset(week_key, mapping={
+                    "members": len(members),
+                    "completed": completed,
+                    "rejected": rejected,
+                    "duration_seconds": float(totals.sum()),
+                })
+                pipe.expire(week_key, self.WEEK_TTL)
+
+                if len(timed_member_ids):
+                    pipe.sadd(timed_key, *(str(m) for m in timed_member_ids.tolist()))
+                    pipe.expire(timed_key, self.WEEK_TTL)
+                    pipe.hset(spans_key, mapping=_member_spans(video_data))
+                    pipe.expire(spans_key, self.WEEK_TTL)
+
+                video_member_ids = {str(v["member_id"]) for v in video_data}
+                video_member_ids |= {
+                    str(m["id"]) for m in members if m["id"] in live_member_ids
+                }
+                if video_member_ids:
+                    pipe.sadd(video_key, *video_member_ids)
+                    pipe.expire(video_key, self.WEEK_TTL)
+
+                if members:
+                    pipe.hset(member_managers_key, mapping={
+                        str(m["id"]): str(manager["id"]) for m in members
+                    })
+                    pipe.expire(member_managers_key, self.WEEK_TTL)
+
+            pipe.set(self._ready_key(week_start), "1", ex=self.WEEK_TTL)
+            pipe.incr(self.VERSION_KEY)
+            await pipe.execute()
+
+        logger.info(f"Reconciled statistics counters for week {week_start}")
+
+
+def _to_ms(moment: datetime) -> int:
+    return int(moment.timestamp() * 1000)
+
+
+def _covered(spans: list[list[int]]) -> int:
+    return sum(end - start for start, end in spans)
+
+
+def _member_spans(video_data: list[dict]) -> dict[str, str]:
+    """Склеенные интервалы каждой участницы — для hash spans."""
+    member_ids, starts, ends = merge_intervals(*load_sessions(video_data))
+    spans: dict[int, list[list[int]]] = {}
+    for member_id, start, end in zip(member_ids.tolist(), starts.tolist(), ends.tolist()):
+        spans.setdefault(member_id, []).append([start, end])
+    return {str(member_id): json.dumps(value, separators=(",", ":")) for member_id, value in spans.items()}
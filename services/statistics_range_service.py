@@ -0,0 +1,78 @@
+"""Кэш статистики за произвольный период (/stats)."""
+import asyncio
+import logging
+from datetime import datetime
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from services.statistics_service import StatisticsService, WeeklyStats
+from services.statistics_snapshot_service import dump_weekly_stats, load_weekly_stats
+
+logger = logging.getLogger(__name__)
+
+
+class StatisticsRangeService:
+    """Read-through кэш статистики по нормализованному периоду.
+
+    Ключ — даты начала и конца периода, поэтому «month» и
+    «2025-01-01..2025-01-31» попадают в одну запись. Одновременные
+    запросы одного периода ждут друг друга и в Supabase идёт один.
+    """
+
+    REDIS_KEY = "meeting_bot:statistics_range:{start}:{end}"
+
+    def __init__(
+            self,
+            redis: Redis,
+            statistics_service: StatisticsService,
+            ttl: int = 300
+    ):
+        self.redis = redis
+        self.statistics_service = statistics_service
+        self.ttl = ttl
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    def _key(self, start_date: datetime, end_date: datetime) -> str:
+        return self.REDIS_KEY.format(
+            start=start_date.date().isoformat(),
+            end=end_date.date().isoformat()
+        )
+
+    async def get_stats(self, start_date: datetime, end_date: datetime) -> WeeklyStats:
+        """Статистика за период — из кэша или из дневных агрегатов."""
+        key = self._key(start_date, end_date)
+
+        stats = await self._get_cached(key)
+        if stats:
+            return stats
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                # Пока ждали, период мог посчитать другой запрос
+                stats = await self._get_cached(key)
+                if stats:
+                    return stats
+
+                stats = await self.statistics_service.get_range_stats(start_date, end_date)
+                await self._save(key, stats)
+                return stats
+        finally:
+            if not lock.locked():
+                self._locks.pop(key, None)
+
+    async def _get_cached(self, key: str) -> WeeklyStats | None:
+        try:
+            raw = await self.redis.get(key)
+        except RedisError as e:
+            logger.warning(f"Cannot read statistics cache {key}: {e}")
+            return None
+
+        return load_weekly_stats(raw) if raw else None
+
+    async def _save(self, key: str, stats: WeeklyStats) -> None:
+        try:
+            await self.redis.set(key, dump_weekly_stats(stats), ex=self.ttl)
+        except RedisError as e:
+            logger.warning(f"Cannot write statistics cache {key}: {e}")
@@ -1,10 +1,22 @@
 """Сервис статистики."""
+import asyncio
+import logging
+from collections.abc import Awaitable
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from typing import TypeVar
+
+from postgrest.exceptions import APIError
 
 from repositories.statistics_repository import StatisticsRepository
+from services.attendance_analytics import summarize_durations
+from services.statistics_counter_service import ManagerCounters, StatisticsCounterService
 from utils.time import get_tashkent_now
 
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
 
 @dataclass
 class ManagerStats:
@@ -35,28 +47,117 @@ class WeeklyStats:
 class StatisticsService:
     """Сервис для сбора и расчёта статистики."""
 
-    def __init__(self, repository: StatisticsRepository):
+    # PostgREST: функция не найдена в schema cache
+    FUNCTION_NOT_FOUND_CODE = "PGRST202"
+
+    def __init__(
+            self,
+            repository: StatisticsRepository,
+            max_concurrency: int = 5,
+            counter_service: StatisticsCounterService | None = None
+    ):
         self.repository = repository
+        self.counter_service = counter_service
+        # Ограничение одновременных запросов к Supabase
+        self._semaphore = asyncio.Semaphore(max_concurrency)
 
     async def get_weekly_stats(
             self,
             start_date: datetime,
             end_date: datetime
     ) -> WeeklyStats:
-        """Получить статистику за период."""
+        """Получить статистику за период.
+
+        Счётчики Redis — только для текущей недели: прошлую сверка уже не
+        чинит, и из неё строится замороженный snapshot, поэтому закрытые
+        недели всегда считаются по БД.
+        """
+        if self.counter_service and (start_date, end_date) == self.get_current_week_range():
+            stats = await self._get_weekly_stats_from_counters(start_date, end_date)
+            if stats:
+                return stats
+
+        try:
+            rows = await self.repository.get_weekly_aggregates(start_date, end_date)
+        except APIError as e:
+            if e.code != self.FUNCTION_NOT_FOUND_CODE:
+                raise
+            # SQL-функция ещё не задеплоена — считаем по старинке
+            logger.warning("get_weekly_statistics is not deployed, using per-manager queries")
+            return await self._get_weekly_stats_per_manager(start_date, end_date)
+
+        managers_stats = [self._build_manager_stats(row) for row in rows]
+
+        return self.build_weekly_stats(start_date, end_date, managers_stats)
+
+    async def get_range_stats(
+            self,
+            start_date: datetime,
+            end_date: datetime
+    ) -> WeeklyStats:
+        """Статистика за любой период (по дням) из дневных агрегатов.
+
+        Месяц или год — это сумма нескольких сотен строк
+        meeting.statistics_daily_rollups, сырые таблицы не сканируются.
+        """
+        rows = await self.repository.get_rollup_aggregates(start_date.date(), end_date.date())
+
+        managers_stats = [self._build_manager_stats(row) for row in rows]
+
+        return self.build_weekly_stats(start_date, end_date, managers_stats)
+
+    async def _get_weekly_stats_from_counters(
+            self,
+            start_date: datetime,
+            end_date: datetime
+    ) -> WeeklyStats | None:
+        """Статистика недели из счётчиков в Redis (None если неделя не сверена)."""
         managers = await self.repository.get_active_managers()
 
-        managers_stats = []
-        for manager in managers:
-            stats = await self._get_manager_stats(
+        counters = await self.counter_service.get_week_counters(
+            start_date.date(), [m["id"] for m in managers]
+        )
+        if counters is None:
+            return None
+
+        managers_stats = [
+            self._build_manager_stats_from_counters(m["id"], m["name"], counters[m["id"]])
+            for m in managers
+        ]
+
+        return self.build_weekly_stats(start_date, end_date, managers_stats)
+
+    async def _get_weekly_stats_per_manager(
+            self,
+            start_date: datetime,
+            end_date: datetime
+    ) -> WeeklyStats:
+        """Статистика за период отдельными запросами по каждому менеджеру.
+
+        Менеджеры считаются параллельно, число одновременных запросов
+        ограничено семафором.
+        """
+        managers = await self._limited(self.repository.get_active_managers())
+
+        managers_stats = list(await asyncio.gather(*(
+            self._get_manager_stats(
                 manager_id=manager["id"],
                 manager_name=manager["name"],
                 start_date=start_date,
                 end_date=end_date
             )
-            managers_stats.append(stats)
+            for manager in managers
+        )))
 
-        # Итого
+        return self.build_weekly_stats(start_date, end_date, managers_stats)
+
+    @staticmethod
+    def build_weekly_stats(
+            start_date: datetime,
+            end_date: datetime,
+            managers_stats: list[ManagerStats]
+    ) -> WeeklyStats:
+        """Собрать WeeklyStats и посчитать итого."""
         total_members = sum(m.members_count for m in managers_stats)
         total_video = sum(m.video_count for m in managers_stats)
         total_completed = sum(m.completed_count for m in managers_stats)
@@ -77,6 +178,51 @@ class StatisticsService:
             total_rejected=total_rejected,
         )
 
+    @staticmethod
+    def _build_manager_stats(row: dict) -> ManagerStats:
+        """Статистика менеджера из строки meeting.get_weekly_statistics."""
+        members_count = row["members_count"]
+        video_count = row["video_count"]
+
+        video_percent = None
+        if members_count > 0:
+            video_percent = round(video_count / members_count * 100)
+
+        avg_duration_minutes = None
+        if row["timed_members_count"] > 0:
+            avg_duration_minutes = round(
+                row["total_duration_seconds"] / 60 / row["timed_members_count"]
+            )
+
+        return ManagerStats(
+            manager_id=row["manager_id"],
+            manager_name=row["manager_name"],
+            members_count=members_count,
+            video_count=video_count,
+            video_percent=video_percent,
+            avg_duration_minutes=avg_duration_minutes,
+            completed_count=row["completed_count"],
+            rejected_count=row["rejected_count"],
+        )
+
+    @staticmethod
+    def _build_manager_stats_from_counters(
+            manager_id: int,
+            manager_name: str,
+            counters: ManagerCounters
+    ) -> ManagerStats:
+        """Статистика менеджера из счётчиков."""
+        return StatisticsService._build_manager_stats({
+            "manager_id": manager_id,
+            "manager_name": manager_name,
+            "members_count": counters.members,
+            "video_count": counters.video,
+            "timed_members_count": counters.timed_members,
+            "total_duration_seconds": counters.duration_seconds,
+            "completed_count": counters.completed,
+            "rejected_count": counters.rejected,
+        })
+
     async def _get_manager_stats(
             self,
             manager_id: int,
@@ -86,15 +232,23 @@ class StatisticsService:
     ) -> ManagerStats:
         """Статистика по одному менеджеру."""
         # 1. Привела
-        members = await self.repository.get_members_by_manager(
+        members = await self._limited(self.repository.get_members_by_manager(
             manager_id, start_date, end_date
-        )
+        ))
         members_count = len(members)
         member_ids = [m["id"] for m in members]
 
-        # 2. На видео + среднее время
-        video_data = await self.repository.get_video_attendance_by_members(
-            member_ids, start_date, end_date
+        # 2. Видео и анкеты — параллельно
+        video_data, completed_count, rejected_count = await asyncio.gather(
+            self._limited(self.repository.get_video_attendance_by_members(
+                member_ids, start_date, end_date
+            )),
+            self._limited(self.repository.get_applications_count_by_status(
+                manager_id, "completed", start_date, end_date
+            )),
+            self._limited(self.repository.get_applications_count_by_status(
+                manager_id, "rejected", start_date, end_date
+            )),
         )
 
         video_count = len(set(v["member_id"] for v in video_data))
@@ -105,14 +259,6 @@ class StatisticsService:
         if members_count > 0:
             video_percent = round(video_count / members_count * 100)
 
-        # 4. Анкеты
-        completed_count = await self.repository.get_applications_count_by_status(
-            manager_id, "completed", start_date, end_date
-        )
-        rejected_count = await self.repository.get_applications_count_by_status(
-            manager_id, "rejected", start_date, end_date
-        )
-
         return ManagerStats(
             manager_id=manager_id,
             manager_name=manager_name,
@@ -124,42 +270,37 @@ class StatisticsService:
             rejected_count=rejected_count,
         )
 
+    async def _limited(self, aw: Awaitable[T]) -> T:
+        """Выполнить запрос с учётом лимита одновременных запросов."""
+        async with self._semaphore:
+            return await aw
+
     @staticmethod
     def _calculate_avg_duration(video_data: list[dict]) -> int | None:
-        """Рассчитать среднее время на видео."""
-        durations = []
-
-        for v in video_data:
-            if v["left_at"] and v["joined_at"]:
-                joined = datetime.fromisoformat(
-                    v["joined_at"].replace("Z", "+00:00")
-                )
-                left = datetime.fromisoformat(
-                    v["left_at"].replace("Z", "+00:00")
-                )
-                duration = (left - joined).total_seconds() / 60
-                if duration > 0:
-                    durations.append(duration)
-
-        if not durations:
+        """Рассчитать среднее время на видео на одну участницу.
+
+        Переподключения одной участницы склеиваются в одно присутствие.
+        """
+        summary = summarize_durations(video_data)
+        if summary.mean_seconds is None:
             return None
 
-        return round(sum(durations) / len(durations))
+        return round(summary.mean_seconds / 60)
 
     @staticmethod
-    def get_current_week_range() -> tuple[datetime, datetime]:
-        """Диапазон текущей недели (Пн-Вс)."""
-        now = get_tashkent_now()
-        start = now - timedelta(days=now.weekday())
+    def get_week_range(moment: datetime) -> tuple[datetime, datetime]:
+        """Диапазон недели (Пн-Вс), в которую входит moment."""
+        start = moment - timedelta(days=moment.weekday())
         start = start.replace(hour=0, minute=0, second=0, microsecond=0)
         end = start + timedelta(days=6, hours=23, minutes=59, seconds=59)
         return start, end
 
+    @staticmethod
+    def get_current_week_range() -> tuple[datetime, datetime]:
+        """Диапазон текущей недели (Пн-Вс)."""
+        return StatisticsService.get_week_range(get_tashkent_now())
+
     @staticmethod
     def get_previous_week_range() -> tuple[datetime, datetime]:
         """Диапазон прошлой недели (Пн-Вс)."""
-        now = get_tashkent_now()
-        start = now - timedelta(days=now.weekday() + 7)
-        start = start.replace(hour=0, minute=0, second=0, microsecond=0)
-        end = start + timedelta(days=6, hours=23, minutes=59, seconds=59)
-        return start, end
+        return StatisticsService.get_week_range(get_tashkent_now() - timedelta(days=7))
@@ -0,0 +1,99 @@
+"""Снимки статистики за закрытые недели."""
+import json
+import logging
+from dataclasses import astuple
+from datetime import date, datetime
+
+from redis.asyncio import Redis
+
+from services.statistics_service import ManagerStats, StatisticsService, WeeklyStats
+
+logger = logging.getLogger(__name__)
+
+
+def dump_weekly_stats(stats: WeeklyStats) -> str:
+    """Сериализовать WeeklyStats в компактный JSON.
+
+    Менеджеры хранятся кортежами полей ManagerStats, итого не хранятся —
+    они пересчитываются при загрузке.
+    """
+    return json.dumps(
+        {
+            "s": stats.start_date.isoformat(),
+            "e": stats.end_date.isoformat(),
+            "m": [astuple(m) for m in stats.managers],
+        },
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+
+
+def load_weekly_stats(raw: str | bytes) -> WeeklyStats:
+    """Восстановить WeeklyStats из dump_weekly_stats."""
+    data = json.loads(raw)
+
+    return StatisticsService.build_weekly_stats(
+        start_date=datetime.fromisoformat(data["s"]),
+        end_date=datetime.fromisoformat(data["e"]),
+        managers_stats=[ManagerStats(*row) for row in data["m"]],
+    )
+
+
+class StatisticsSnapshotService:
+    """Неизменяемые снимки статистики за закрытые недели в Redis.
+
+    Снимок пишется один раз, когда неделя закрылась, и удаляется только
+    явным пересчётом (scripts/recompute_statistics_snapshot.py).
+    """
+
+    REDIS_KEY = "meeting_bot:statistics_snapshot:{week_start}"
+
+    def __init__(self, redis: Redis):
+        self.redis = redis
+
+    def _key(self, week_start: date) -> str:
+        return self.REDIS_KEY.format(week_start=week_start.isoformat())
+
+    async def get(self, week_start: date) -> WeeklyStats | None:
+        """Получить снимок недели."""
+        raw = await self.redis.get(self._key(week_start))
+        if not raw:
+            return None
+
+        return load_weekly_stats(raw)
+
+    async def save(self, stats: WeeklyStats) -> bool:
+        """Сохранить снимок, если его ещё нет.
+
+        Returns:
+            True если снимок записан
+        """
+        saved = await self.redis.set(
+            self._key(stats.start_date.date()),
+            dump_weekly_stats(stats),
+            nx=True
+        )
+
+        if saved:
+            logger.info(f"Saved statistics snapshot for week {stats.start_date.date()}")
+        return bool(saved)
+
+    async def delete(self, week_start: date) -> None:
+        """Удалить снимок недели."""
+        await self.redis.delete(self._key(week_start))
+        logger.info(f"Deleted statistics snapshot for week {week_start}")
+
+    async def get_or_create(
+            self,
+            service: StatisticsService,
+            start_date: datetime,
+            end_date: datetime
+    ) -> WeeklyStats:
+        """Снимок закрытой недели; при отсутствии — посчитать и сохранить."""
+        stats = await self.get(start_date.date())
+        if stats:
+            return stats
+
+        stats = await service.get_weekly_stats(start_date, end_date)
+        await self.save(stats)
+        return stats
@@ -0,0 +1,264 @@
+"""Живое сообщение о встрече: кто сейчас в звонке."""
+import asyncio
+import logging
+from collections import Counter
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramBadRequest, TelegramRetryAfter
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from models.member import Member
+from repositories.invite_link_repository import InviteLinkRepository
+from repositories.statistics_repository import StatisticsRepository
+from templates import VideoChatDashboardTemplates
+
+logger = logging.getLogger(__name__)
+
+
+class VideoChatDashboard:
+    """Сообщение в ветке команд: сейчас в звонке, пик, по менеджерам.
+
+    Статистика обновляется раз в несколько минут, а во время встречи
+    менеджерам нужно видеть комнату сразу. Состояние ведётся
+    инкрементально по событиям VideoChatReconciler (joined/left) —
+    посещения из БД не перечитываются. Менеджер участницы определяется
+    по её invite-ссылке одним запросом на пачку новых участниц.
+
+    Правки сообщения склеиваются: не чаще одной в min_edit_interval
+    секунд (Telegram ограничивает частоту правок в группе), всё, что
+    пришло за это время, попадает в следующую правку.
+
+    Ключ:
+        {MESSAGE_KEY}  hash: call_id, message_id, peak — чтобы после
+                       рестарта править то же сообщение
+    """
+
+    MESSAGE_KEY = "meeting_bot:video_chat:dashboard"
+    NO_MANAGER = "Без менеджера"
+
+    def __init__(
+            self,
+            bot: Bot,
+            redis: Redis,
+            invite_link_repository: InviteLinkRepository,
+            statistics_repository: StatisticsRepository,
+            chat_id: int,
+            thread_id: int | None = None,
+            min_edit_interval: float = 5
+    ):
+        self.bot = bot
+        self.redis = redis
+        self.invite_link_repository = invite_link_repository
+        self.statistics_repository = statistics_repository
+        self.chat_id = chat_id
+        self.thread_id = thread_id
+        self.min_edit_interval = min_edit_interval
+
+        self._call_id: int | None = None
+        self._message_id: int | None = None
+        self.peak = 0
+        self.ended = False
+
+        # member_id → invite_link_id тех, кто сейчас в звонке
+        self._present: dict[int, int] = {}
+        # Ещё не разнесены по менеджерам (ждут запроса ссылок)
+        self._unresolved: set[int] = set()
+        self._by_manager: Counter[int | None] = Counter()
+        # Кэши на процесс: ссылки одноразовые, менеджеры меняются редко
+        self._link_managers: dict[int, int | None] = {}
+        self._manager_names: dict[int, str] = {}
+
+        self._rendered: tuple | None = None
+        self._dirty = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self.edits = 0
+
+    @property
+    def present(self) -> int:
+        return len(self._present)
+
+    # ============================================
+    # СОБЫТИЯ (из VideoChatReconciler)
+    # ============================================
+
+    async def start_call(self, call_id: int, members: list[Member]) -> None:
+        """Новый звонок (или рестарт посреди звонка)."""
+        if call_id == self._call_id:
+            return
+
+        self._call_id = call_id
+        self._message_id = None
+        self.peak = 0
+        self.ended = False
+        self._present.clear()
+        self._unresolved.clear()
+        self._by_manager.clear()
+        self._rendered = None
+
+        try:
+            stored = {
+                k.decode(): v.decode()
+                for k, v in (await self.redis.hgetall(self.MESSAGE_KEY)).items()
+            }
+        except RedisError as e:
+            # Не страшно: просто будет новое сообщение
+            logger.warning(f"Failed to load video chat dashboard: {e}")
+            stored = {}
+        if stored.get("call_id") == str(call_id):
+            self._message_id = int(stored["message_id"])
+            self.peak = int(stored.get("peak", 0))
+
+        for member in members:
+            self.joined(member)
+
+    def joined(self, member: Member) -> None:
+        if self.ended or member.id in self._present:
+            return
+
+        self._present[member.id] = member.invite_link_id
+        self.peak = max(self.peak, len(self._present))
+
+        if member.invite_link_id in self._link_managers:
+            self._by_manager[self._link_managers[member.invite_link_id]] += 1
+        else:
+            self._unresolved.add(member.id)
+        self._dirty.set()
+
+    def left(self, member_id: int) -> None:
+        link_id = self._present.pop(member_id, None)
+        if link_id is None:
+            return
+
+        if member_id in self._unresolved:
+            self._unresolved.discard(member_id)
+        else:
+            manager_id = self._link_managers[link_id]
+            self._by_manager[manager_id] -= 1
+            if not self._by_manager[manager_id]:
+                del self._by_manager[manager_id]
+        self._dirty.set()
+
+    def end(self) -> None:
+        """Звонок завершён — финальная правка с пиком."""
+        for member_id in list(self._present):
+            self.left(member_id)
+        self.ended = True
+        self._dirty.set()
+
+    # ============================================
+    # СООБЩЕНИЕ
+    # ============================================
+
+    async def _resolve_managers(self) -> None:
+        """Разнести новых участниц по менеджерам одним запросом."""
+        if not self._unresolved:
+            return
+
+        link_ids = sorted({self._present[m] for m in self._unresolved} - self._link_managers.keys())
+        if link_ids:
+            found = await self.invite_link_repository.get_manager_ids(link_ids)
+            for link_id in link_ids:
+                self._link_managers[link_id] = found.get(link_id)
+
+        for member_id in self._unresolved:
+            self._by_manager[self._link_managers[self._present[member_id]]] += 1
+        self._unresolved.clear()
+
+        missing = {m for m in self._by_manager if m is not None} - self._manager_names.keys()
+        if missing:
+            for manager in await self.statistics_repository.get_active_managers():
+                self._manager_names[manager["id"]] = manager["name"]
+
+    def _manager_rows(self) -> list[tuple[str, int]]:
+        rows = [
+            (self.NO_MANAGER if m is None else self._manager_names.get(m, f"#{m}"), count)
+            for m, count in self._by_manager.items()
+        ]
+        return sorted(rows, key=lambda row: (-row[1], row[0]))
+
+    async def refresh(self) -> bool:
+        """Отправить или поправить сообщение, если что-то изменилось.
+
+        Returns:
+            True если сообщение отправлено/поправлено
+        """
+        if self._call_id is None:
+            return False
+
+        await self._resolve_managers()
+        rows = self._manager_rows()
+
+        # Строка «Обновлено» меняется всегда — сравниваем данные
+        rendered = (self.present, self.peak, tuple(rows), self.ended)
+        if rendered == self._rendered:
+            return False
+
+        text = VideoChatDashboardTemplates.format_dashboard(self.present, self.peak, rows, self.ended)
+
+        if self._message_id:
+            try:
+                await self.bot.edit_message_text(
+                    chat_id=self.chat_id,
+                    message_id=self._message_id,
+                    text=text,
+                )
+            except TelegramBadRequest as e:
+                if "is not modified" not in e.message:
+                    # Удалено, нет прав и т.д. — создаём новое
+                    logger.warning(f"Cannot edit video chat dashboard: {e.message}, creating new")
+                    self._message_id = None
+
+        if not self._message_id:
+            message = await self.bot.send_message(
+                chat_id=self.chat_id,
+                message_thread_id=self.thread_id,
+                text=text,
+            )
+            self._message_id = message.message_id
+
+        await self.redis.hset(self.MESSAGE_KEY, mapping={
+            "call_id": str(self._call_id),
+            "message_id": str(self._message_id),
+            "peak": str(self.peak),
+        })
+        self._rendered = rendered
+        self.edits += 1
+        return True
+
+    # ============================================
+    # ФОНОВЫЕ ПРАВКИ
+    # ============================================
+
+    async def _run(self) -> None:
+        while True:
+            await self._dirty.wait()
+            self._dirty.clear()
+            try:
+                await self.refresh()
+            except TelegramRetryAfter as e:
+                # Правка не прошла — повторим после паузы от Telegram
+                self._dirty.set()
+                await asyncio.sleep(e.retry_after)
+                continue
+            except Exception as e:
+                logger.warning(f"Video chat dashboard refresh failed: {e}")
+            # События за паузу склеиваются в одну следующую правку
+            await asyncio.sleep(self.min_edit_interval)
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        # Последнее состояние — без ожидания паузы
+        if self._dirty.is_set():
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.warning(f"Video chat dashboard refresh failed: {e}")
@@ -0,0 +1,107 @@
+"""Обработка событий Video Chat в consumer'е."""
+import logging
+
+from services.live_sessions import LiveSessionStore
+from services.meeting_timeline_service import MeetingTimelineService
+from services.member_lookup_service import MemberLookupService
+from services.statistics_counter_service import StatisticsCounterService
+from services.video_chat_event_queue import (
+    CALL,
+    ENDED,
+    PARTICIPANTS,
+    SNAPSHOT,
+    VideoChatEvent,
+)
+from services.video_chat_reconciler import VideoChatReconciler
+
+logger = logging.getLogger(__name__)
+
+
+class VideoChatEventProcessor:
+    """Telegram ID из событий → участницы → сессии и счётчики.
+
+    Всё, что раньше делал handler в боте: поиск участницы (кэш, при
+    промахе — БД), открытие/закрытие сессии, счётчики статистики.
+    Время событий — время приёма update ботом, а не обработки, поэтому
+    отставание consumer'а не искажает длительность.
+    """
+
+    def __init__(
+            self,
+            member_lookup_service: MemberLookupService,
+            live_sessions: LiveSessionStore,
+            statistics_counter_service: StatisticsCounterService,
+            reconciler: VideoChatReconciler,
+            meeting_timeline_service: MeetingTimelineService | None = None
+    ):
+        self.member_lookup_service = member_lookup_service
+        self.live_sessions = live_sessions
+        self.statistics_counter_service = statistics_counter_service
+        self.reconciler = reconciler
+        self.meeting_timeline_service = meeting_timeline_service
+        self._started_call_id: int | None = None
+
+    async def process(self, event: VideoChatEvent) -> None:
+        if event.kind == PARTICIPANTS:
+            await self._on_participants(event)
+        elif event.kind == SNAPSHOT:
+            await self.reconciler.reconcile(event.call_id, event.present, event.at)
+        elif event.kind == ENDED:
+            await self.reconciler.close_all(event.call_id, event.at)
+            if self.meeting_timeline_service:
+                await self.meeting_timeline_service.mark_ended(event.at.date())
+        elif event.kind == CALL:
+            # Звонок запланирован — к началу встречи участницы уже в памяти
+            await self.member_lookup_service.warm_up_for_call(event.call_id)
+        else:
+            logger.warning(f"Unknown video chat event: {event.kind}")
+
+    async def _on_participants(self, event: VideoChatEvent) -> None:
+        await self.reconciler.start_call(event.call_id)
+        await self._mark_meeting_started(event)
+
+        for telegram_id in event.joined:
+            member = await self.member_lookup_service.get(telegram_id)
+            if not member:
+                # Не наша участница (возможно админ) — игнорируем
+                logger.debug("Unknown user %s, skipping", telegram_id)
+                continue
+
+            await self.live_sessions.open(member_id=member.id, joined_at=event.at)
+            self.reconciler.mark_joined(member, event.at)
+            await self.statistics_counter_service.record_video_joined(
+                member_id=member.id,
+                member_joined_at=member.joined_at,
+                at=event.at
+            )
+            logger.debug("Member %s joined video chat", member.id)
+
+        for telegram_id in event.left:
+            member = await self.member_lookup_service.get(telegram_id)
+            if not member:
+                logger.debug("Unknown user %s, skipping", telegram_id)
+                continue
+
+            session = await self.live_sessions.close(member_id=member.id, left_at=event.at)
+            self.reconciler.mark_left(member.id, event.at)
+            if session:
+                await self.statistics_counter_service.record_video_left(
+                    member_id=member.id,
+                    member_joined_at=member.joined_at,
+                    video_joined_at=session.joined_at,
+                    at=event.at
+                )
+            logger.debug("Member %s left video chat", member.id)
+
+    async def _mark_meeting_started(self, event: VideoChatEvent) -> None:
+        """Встреча идёт: сбросить timeline её дня.
+
+        День — по первому PARTICIPANTS звонка, а не по CALL: CALL
+        приходит, когда звонок запланирован (в четверг), а встреча — в
+        пятницу.
+        """
+        if not self.meeting_timeline_service or self._started_call_id == event.call_id:
+            return
+
+        await self.meeting_timeline_service.mark_started(event.at.date())
+        self._started_call_id = event.call_id
@@ -0,0 +1,225 @@
+"""Очередь событий Video Chat между ботом и consumer'ом."""
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError, ResponseError
+
+logger = logging.getLogger(__name__)
+
+# Виды событий
+CALL = "c"          # звонок создан/изменился
+PARTICIPANTS = "p"  # join/left из UpdateGroupCallParticipants
+SNAPSHOT = "s"      # список участниц звонка (phone.GetGroupParticipants)
+ENDED = "e"         # звонок завершён (GroupCallDiscarded)
+
+
+@dataclass(slots=True)
+class VideoChatEvent:
+    """Событие звонка в компактном виде — только Telegram ID и время."""
+    kind: str
+    call_id: int
+    at: datetime
+    joined: list[int] = field(default_factory=list)
+    left: list[int] = field(default_factory=list)
+    present: list[int] = field(default_factory=list)
+
+    def to_fields(self) -> dict[str, str | int]:
+        fields: dict[str, str | int] = {"k": self.kind, "c": self.call_id, "at": self.at.isoformat()}
+        for name, ids in (("j", self.joined), ("l", self.left), ("ids", self.present)):
+            if ids:
+                fields[name] = ",".join(map(str, ids))
+        return fields
+
+    @classmethod
+    def from_fields(cls, fields: dict[str, str]) -> "VideoChatEvent":
+        def ids(name: str) -> list[int]:
+            value = fields.get(name)
+            return [int(i) for i in value.split(",")] if value else []
+
+        return cls(
+            kind=fields["k"],
+            call_id=int(fields["c"]),
+            at=datetime.fromisoformat(fields["at"]),
+            joined=ids("j"),
+            left=ids("l"),
+            present=ids("ids"),
+        )
+
+
+class VideoChatEventQueue:
+    """Redis Stream: бот только кладёт события, consumer их обрабатывает.
+
+    Бот не ходит в БД на каждый update — XADD и всё, поэтому приём
+    updates не зависит от скорости Supabase. Consumer (один,
+    workers/video_chat_consumer.py) читает stream по порядку через
+    consumer group и подтверждает событие только после обработки;
+    после рестарта неподтверждённые события читаются заново.
+
+    Событие, которое не обработалось за MAX_ATTEMPTS попыток (или не
+    разбирается), уходит в DEAD_LETTER_KEY — иначе оно навсегда
+    остановило бы все следующие.
+    """
+
+    STREAM_KEY = "meeting_bot:video_chat:events"
+    DEAD_LETTER_KEY = "meeting_bot:video_chat:events:dead"
+    GROUP = "video_chat_consumer"
+    MAX_LEN = 100000
+    RECONNECT_DELAY = 5  # секунд
+    RETRY_DELAY = 1  # секунд между повторами упавшего события
+    MAX_ATTEMPTS = 5
+
+    def __init__(
+            self,
+            redis: Redis,
+            consumer: str = "consumer",
+            read_count: int = 100,
+            block_ms: int = 1000
+    ):
+        self.redis = redis
+        self.consumer = consumer
+        self.read_count = read_count
+        self.block_ms = block_ms
+
+    # ============================================
+    # БОТ
+    # ============================================
+
+    async def publish(self, event: VideoChatEvent) -> None:
+        await self.redis.xadd(
+            self.STREAM_KEY,
+            event.to_fields(),
+            maxlen=self.MAX_LEN,
+            approximate=True
+        )
+
+    # ============================================
+    # CONSUMER
+    # ============================================
+
+    async def ensure_group(self) -> None:
+        try:
+            await self.redis.xgroup_create(self.STREAM_KEY, self.GROUP, id="0", mkstream=True)
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def read(self, last_id: str = ">") -> list[tuple[str, VideoChatEvent]]:
+        """Прочитать события.
+
+        Args:
+            last_id: ">" — новые; иначе — свои неподтверждённые после last_id
+        """
+        response = await self.redis.xreadgroup(
+            self.GROUP,
+            self.consumer,
+            {self.STREAM_KEY: last_id},
+            count=self.read_count,
+            block=self.block_ms if last_id == ">" else None
+        )
+        if not response:
+            return []
+
+        _, entries = response[0]
+        events: list[tuple[str, VideoChatEvent]] = []
+        broken: list[str] = []
+        for entry_id, raw_fields in entries:
+            entry_id = _decode(entry_id)
+            fields = {_decode(key): _decode(value) for key, value in raw_fields.items()}
+            try:
+                events.append((entry_id, VideoChatEvent.from_fields(fields)))
+            except (KeyError, ValueError) as e:
+                logger.error(f"Malformed video chat event {entry_id} {fields}: {e}")
+                await self.dead_letter(entry_id, fields, e)
+                broken.append(entry_id)
+
+        if broken:
+            await self.ack(broken)
+            # Пустой ответ при replay значит «pending закончились» — читаем дальше
+            if not events and last_id != ">":
+                return await self.read(broken[-1])
+        return events
+
+    async def dead_letter(self, entry_id: str, fields: dict[str, str | int], error: Exception) -> None:
+        try:
+            await self.redis.xadd(
+                self.DEAD_LETTER_KEY,
+                {**fields, "id": entry_id, "error": str(error)[:500]},
+                maxlen=self.MAX_LEN,
+                approximate=True
+            )
+        except RedisError as e:
+            logger.warning(f"Failed to dead-letter video chat event {entry_id}: {e}")
+
+    async def ack(self, event_ids: list[str]) -> None:
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.xack(self.STREAM_KEY, self.GROUP, *event_ids)
+            pipe.xdel(self.STREAM_KEY, *event_ids)
+            await pipe.execute()
+
+    async def consume(self, handler: Callable[[VideoChatEvent], Awaitable[None]]) -> None:
+        """Обрабатывать события по порядку (бесконечно).
+
+        Упавшее событие повторяется до MAX_ATTEMPTS раз: следующие
+        ждут, иначе join и left одной участницы могут переставиться.
+        """
+        while True:
+            try:
+                await self.ensure_group()
+                break
+            except RedisError as e:
+                logger.warning(f"Video chat event queue is not available: {e}")
+                await asyncio.sleep(self.RECONNECT_DELAY)
+
+        # Сначала — то, что прочитали, но не подтвердили до рестарта
+        last_id = "0"
+        while True:
+            try:
+                entries = await self.read(last_id)
+            except RedisError as e:
+                logger.warning(f"Video chat event queue read failed: {e}")
+                await asyncio.sleep(self.RECONNECT_DELAY)
+                continue
+
+            if last_id != ">":
+                if not entries:
+                    last_id = ">"
+                    continue
+                logger.info(f"Replaying {len(entries)} video chat events")
+                last_id = entries[-1][0]
+
+            for event_id, event in entries:
+                await self._handle(handler, event_id, event)
+
+            if entries:
+                try:
+                    await self.ack([event_id for event_id, _ in entries])
+                except RedisError as e:
+                    # Повторная обработка после рестарта безопасна
+                    logger.warning(f"Failed to ack video chat events: {e}")
+
+    async def _handle(
+            self,
+            handler: Callable[[VideoChatEvent], Awaitable[None]],
+            event_id: str,
+            event: VideoChatEvent
+    ) -> None:
+        for attempt in range(1, self.MAX_ATTEMPTS + 1):
+            try:
+                await handler(event)
+                return
+            except Exception as e:
+                if attempt == self.MAX_ATTEMPTS:
+                    # Подтверждается вместе с пачкой — дальше идут следующие
+                    logger.error(f"Video chat event {event_id} {event} dropped after {attempt} attempts: {e}")
+                    await self.dead_letter(event_id, event.to_fields(), e)
+                    return
+                logger.warning(f"Video chat event failed (attempt {attempt}): {e}")
+                await asyncio.sleep(self.RETRY_DELAY)
+
+
+def _decode(value: bytes | str) -> str:
+    return value.decode() if isinstance(value, bytes) else value
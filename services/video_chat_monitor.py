@@ -0,0 +1,127 @@
+"""Наблюдение за звонком в боте: события для consumer'а."""
+import asyncio
+import logging
+
+from pyrogram import Client
+from pyrogram.raw.functions.phone import GetGroupParticipants
+from pyrogram.raw.types import InputGroupCall, PeerUser
+
+from services.active_video_chat import ActiveVideoChatTracker
+from services.video_chat_event_queue import (
+    CALL,
+    ENDED,
+    SNAPSHOT,
+    VideoChatEvent,
+    VideoChatEventQueue,
+)
+from utils.time import get_tashkent_now
+
+logger = logging.getLogger(__name__)
+
+
+class VideoChatMonitor:
+    """Жизненный цикл звонка и снимки участниц — в VideoChatEventQueue.
+
+    Бот только наблюдает через userbot и кладёт события в очередь,
+    сверку и запись делает consumer (VideoChatReconciler):
+        announce_call — звонок появился (прогрев кэша участниц)
+        announce_end  — звонок завершён (закрыть все сессии)
+        раз в interval секунд, пока звонок идёт, — список участниц
+    """
+
+    PAGE_SIZE = 500
+
+    def __init__(
+            self,
+            client: Client,
+            active_video_chat: ActiveVideoChatTracker,
+            event_queue: VideoChatEventQueue,
+            interval: float = 60
+    ):
+        self.client = client
+        self.active_video_chat = active_video_chat
+        self.event_queue = event_queue
+        self.interval = interval
+
+        self._announced_call_id: int | None = None
+        self._ended_call_id: int | None = None
+        self._task: asyncio.Task | None = None
+
+    async def announce_call(self, call_id: int) -> None:
+        """UpdateGroupCall приходит на каждое изменение — шлём один раз."""
+        if call_id == self._announced_call_id:
+            return
+
+        await self.event_queue.publish(VideoChatEvent(kind=CALL, call_id=call_id, at=get_tashkent_now()))
+        self._announced_call_id = call_id
+
+    async def announce_end(self, call_id: int) -> None:
+        if not self.active_video_chat.is_active(call_id) or call_id == self._ended_call_id:
+            return
+
+        await self.event_queue.publish(VideoChatEvent(kind=ENDED, call_id=call_id, at=get_tashkent_now()))
+        self._ended_call_id = call_id
+
+    async def snapshot(self) -> bool:
+        """Отправить список участниц, если звонок идёт.
+
+        Returns:
+            True если снимок отправлен
+        """
+        video_chat = self.active_video_chat.current
+        if not video_chat or video_chat.call_id == self._ended_call_id:
+            return False
+
+        taken_at = get_tashkent_now()
+        if video_chat.scheduled_for > taken_at:
+            return False
+
+        telegram_ids = await self._fetch_participants(video_chat.call_id, video_chat.access_hash)
+        await self.event_queue.publish(VideoChatEvent(
+            kind=SNAPSHOT,
+            call_id=video_chat.call_id,
+            at=taken_at,
+            present=sorted(telegram_ids),
+        ))
+        return True
+
+    async def _fetch_participants(self, call_id: int, access_hash: int) -> set[int]:
+        """Telegram ID всех участниц звонка (постранично)."""
+        call = InputGroupCall(id=call_id, access_hash=access_hash)
+        telegram_ids: set[int] = set()
+        offset = ""
+
+        while True:
+            result = await self.client.invoke(
+                GetGroupParticipants(call=call, ids=[], sources=[], offset=offset, limit=self.PAGE_SIZE)
+            )
+            for participant in result.participants:
+                if isinstance(participant.peer, PeerUser) and not participant.left:
+                    telegram_ids.add(participant.peer.user_id)
+
+            if not result.next_offset or not result.participants:
+                return telegram_ids
+            offset = result.next_offset
+
+    # ============================================
+    # ФОНОВЫЕ СНИМКИ
+    # ============================================
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.snapshot()
+            except Exception as e:
+                logger.warning(f"Video chat snapshot failed: {e}")
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
@@ -0,0 +1,189 @@
+"""Сверка участниц Video Chat со снимком Telegram."""
+import logging
+from datetime import datetime
+
+from models.member import Member
+from repositories.member_repository import MemberRepository
+from services.live_sessions import LiveSessionStore
+from services.member_lookup_service import MemberLookupService
+from services.statistics_counter_service import StatisticsCounterService
+from services.video_chat_dashboard import VideoChatDashboard
+
+logger = logging.getLogger(__name__)
+
+
+class VideoChatReconciler:
+    """Досинтезирует join/left, которые Telegram не доставил.
+
+    UpdateGroupCallParticipants доставляется без гарантий: пропущенный
+    «left» растягивает сессию до конца звонка, пропущенный «join» —
+    теряет её. Пока звонок идёт, VideoChatMonitor в боте присылает
+    список участниц звонка (phone.GetGroupParticipants), и он
+    сравнивается с открытыми сессиями:
+        есть в звонке, нет в открытых — синтетический join
+        есть в открытых, нет в звонке — синтетический left
+    Когда звонок завершён (GroupCallDiscarded), все открытые сессии
+    закрываются одной пачкой.
+
+    Работает в consumer'е событий. Открытые сессии хранятся в памяти,
+    обработчик событий обновляет их через mark_joined/mark_left. После
+    рестарта они восстанавливаются из LiveSessionStore. Каждое
+    изменение открытых сессий передаётся в VideoChatDashboard.
+    """
+
+    def __init__(
+            self,
+            member_repository: MemberRepository,
+            member_lookup_service: MemberLookupService,
+            live_sessions: LiveSessionStore,
+            statistics_counter_service: StatisticsCounterService,
+            dashboard: VideoChatDashboard | None = None
+    ):
+        self.member_repository = member_repository
+        self.member_lookup_service = member_lookup_service
+        self.live_sessions = live_sessions
+        self.statistics_counter_service = statistics_counter_service
+        self.dashboard = dashboard
+
+        # member_id → Member, чей вход записан, а выход — нет
+        self.open_sessions: dict[int, Member] = {}
+        # member_id → время последнего события из updates
+        self._last_event_at: dict[int, datetime] = {}
+        self._call_id: int | None = None
+        self._ended_call_id: int | None = None
+
+        self.synthesized_joins = 0
+        self.synthesized_leaves = 0
+
+    # ============================================
+    # СОБЫТИЯ ИЗ UPDATES
+    # ============================================
+
+    async def start_call(self, call_id: int) -> None:
+        """Переключиться на звонок (после рестарта — восстановить сессии)."""
+        if self._call_id == call_id:
+            return
+
+        member_ids = await self.live_sessions.get_member_ids()
+        members = await self.member_repository.get_by_ids(sorted(member_ids))
+        self.open_sessions = {member.id: member for member in members}
+        self._last_event_at.clear()
+        self._call_id = call_id
+        if self.dashboard:
+            await self.dashboard.start_call(call_id, members)
+
+    def mark_joined(self, member: Member, at: datetime) -> None:
+        self.open_sessions[member.id] = member
+        self._last_event_at[member.id] = at
+        if self.dashboard:
+            self.dashboard.joined(member)
+
+    def mark_left(self, member_id: int, at: datetime) -> None:
+        self.open_sessions.pop(member_id, None)
+        self._last_event_at[member_id] = at
+        if self.dashboard:
+            self.dashboard.left(member_id)
+
+    # ============================================
+    # СВЕРКА
+    # ============================================
+
+    async def reconcile(self, call_id: int, telegram_ids: list[int], taken_at: datetime) -> bool:
+        """Сверить открытые сессии со снимком звонка.
+
+        Args:
+            telegram_ids: кто был в звонке
+            taken_at: когда снимок начали снимать
+
+        Returns:
+            True если сверка была (звонок не завершён)
+        """
+        if call_id == self._ended_call_id:
+            return False
+
+        await self.start_call(call_id)
+
+        present: dict[int, Member] = {}
+        for telegram_id in telegram_ids:
+            member = await self.member_lookup_service.get(telegram_id)
+            if member:
+                present[member.id] = member
+
+        # Пока снимок ехал, updates могли принести свежие события —
+        # они новее снимка
+        def is_fresh(member_id: int) -> bool:
+            last_event_at = self._last_event_at.get(member_id)
+            return last_event_at is not None and last_event_at >= taken_at
+
+        for member_id, member in present.items():
+            if member_id in self.open_sessions or is_fresh(member_id):
+                continue
+            await self.live_sessions.open(member_id, taken_at)
+            await self.statistics_counter_service.record_video_joined(
+                member_id=member_id,
+                member_joined_at=member.joined_at,
+                at=taken_at
+            )
+            self.open_sessions[member_id] = member
+            if self.dashboard:
+                self.dashboard.joined(member)
+            self.synthesized_joins += 1
+
+        for member_id in list(self.open_sessions):
+            if member_id in present or is_fresh(member_id):
+                continue
+            member = self.open_sessions.pop(member_id)
+            session = await self.live_sessions.close(member_id, taken_at)
+            if session:
+                await self.statistics_counter_service.record_video_left(
+                    member_id=member_id,
+                    member_joined_at=member.joined_at,
+                    video_joined_at=session.joined_at,
+                    at=taken_at
+                )
+            if self.dashboard:
+                self.dashboard.left(member_id)
+            self.synthesized_leaves += 1
+
+        logger.debug(
+            "Video chat reconciled: %s present, %s open, %s joins and %s leaves synthesized",
+            len(present), len(self.open_sessions), self.synthesized_joins, self.synthesized_leaves
+        )
+        return True
+
+    async def close_all(self, call_id: int, at: datetime) -> int:
+        """Звонок завершён — закрыть все открытые сессии одной пачкой.
+
+        Returns:
+            Сколько сессий закрыто
+        """
+        if call_id == self._ended_call_id:
+            return 0
+
+        await self.start_call(call_id)
+        self._ended_call_id = call_id
+
+        members = dict(self.open_sessions)
+        self.open_sessions.clear()
+        if self.dashboard:
+            self.dashboard.end()
+
+        # Закрывает и сессии, которых нет в памяти (например, после рестарта)
+        sessions = await self.live_sessions.close_all(at)
+        unknown = [session.member_id for session in sessions if session.member_id not in members]
+        if unknown:
+            members.update({member.id: member for member in await self.member_repository.get_by_ids(unknown)})
+
+        for session in sessions:
+            member = members.get(session.member_id)
+            if member is None:
+                continue
+            await self.statistics_counter_service.record_video_left(
+                member_id=member.id,
+                member_joined_at=member.joined_at,
+                video_joined_at=session.joined_at,
+                at=at
+            )
+
+        logger.info(f"Video chat {call_id} ended, closed {len(sessions)} open sessions")
+        return len(sessions)
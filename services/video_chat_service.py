@@ -16,6 +16,8 @@ class VideoChatService:
 
     REDIS_KEY = "meeting_bot:video_chat"
     REDIS_TTL = 172800  # 48 часов
+    # Бот держит активный звонок в памяти и обновляет его по этому каналу
+    CHANNEL = "meeting_bot:video_chat:updates"
 
     def __init__(self, client: Client, redis: Redis, group_id: int):
         self.client = client
@@ -61,11 +63,13 @@ class VideoChatService:
                 "title": title,
                 "scheduled_for": schedule_date.isoformat()
             }
+            payload = json.dumps(data)
             await self.redis.set(
                 self.REDIS_KEY,
-                json.dumps(data),
+                payload,
                 ex=self.REDIS_TTL
             )
+            await self.redis.publish(self.CHANNEL, payload)
 
             logger.debug(f"Scheduled video chat '{title}' for {schedule_date}")
             logger.debug(f"Group link: {link}")
@@ -1,8 +1,12 @@
 """Шаблоны сообщений для бота. Легко переводить на другие языки."""
 
+from datetime import timedelta
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from datetime import date
+
+    from services.attendance_analytics import MeetingTimeline
     from services.statistics_service import WeeklyStats, ManagerStats
 
 
@@ -477,24 +481,91 @@ class StatisticsTemplates:
         """Форматировать полную статистику."""
         from utils.time import get_tashkent_now
 
-        current = StatisticsTemplates._format_week(current_week, "Эта неделя")
-        previous = StatisticsTemplates._format_week(previous_week, "Прошлая неделя")
+        body = StatisticsTemplates.format_stats_body(current_week, previous_week)
 
         now = get_tashkent_now()
         updated = now.strftime("%d.%m.%Y %H:%M")
 
+        return f"{body}🕐 Обновлено: {updated}"
+
+    @staticmethod
+    def format_stats_body(
+            current_week: "WeeklyStats",
+            previous_week: "WeeklyStats"
+    ) -> str:
+        """Статистика без строки «Обновлено» — меняется только вместе с данными."""
+        current = StatisticsTemplates._format_week(current_week, "Эта неделя")
+        previous = StatisticsTemplates._format_week(previous_week, "Прошлая неделя")
+
         return (
             f"{current}\n"
             f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
             f"{previous}"
-            f"🕐 Обновлено: {updated}"
         )
 
     @staticmethod
-    def _format_week(stats: "WeeklyStats", title: str) -> str:
-        """Форматировать одну неделю."""
-        start = stats.start_date.strftime("%d.%m")
-        end = stats.end_date.strftime("%d.%m")
+    def format_period_stats(stats: "WeeklyStats") -> str:
+        """Статистика за произвольный период (/stats)."""
+        return StatisticsTemplates._format_week(stats, "Статистика", "%d.%m.%Y")
+
+    @staticmethod
+    def period_usage() -> str:
+        return (
+            "Не понял период 🤷‍♀️\n\n"
+            "/stats — эта неделя\n"
+            "/stats month — этот месяц\n"
+            "/stats 2025-01-01..2025-03-31 — любой период"
+        )
+
+    @staticmethod
+    def format_timeline(meeting_date: "date", timeline: "MeetingTimeline", step: int = 5) -> str:
+        """Таймлайн встречи (/timeline): в звонке по step минут, пик, удержание."""
+        from utils.time import TASHKENT_TZ
+
+        title = f"🎥 Встреча {meeting_date.strftime('%d.%m.%Y')}"
+        if not timeline.members_count:
+            return f"{title}\n\nНа видео никого не было"
+
+        peak_at = timeline.peak_at.astimezone(TASHKENT_TZ).strftime("%H:%M")
+        lines = [
+            f"{title}\n",
+            f"👥 Были на видео: {timeline.members_count}",
+            f"📈 Пик: {timeline.peak} в {peak_at}\n",
+            "🕐 В звонке (ушли насовсем):",
+        ]
+
+        started_at = timeline.started_at.astimezone(TASHKENT_TZ)
+        for i in range(0, len(timeline.concurrency), step):
+            moment = started_at + timedelta(seconds=i * timeline.bucket_seconds)
+            present = max(timeline.concurrency[i:i + step])
+            dropped = sum(timeline.drop_offs[i:i + step])
+            suffix = f" (−{dropped})" if dropped else ""
+            lines.append(f"   {moment.strftime('%H:%M')} — {present}{suffix}")
+
+        lines.append("\n⏳ Пробыли на видео:")
+        for minutes in (5, 15, 30, 60):
+            if minutes < len(timeline.retention):
+                stayed = timeline.retention[minutes]
+            else:
+                stayed = 0
+            percent = round(stayed / timeline.members_count * 100)
+            lines.append(f"   ≥ {minutes} мин: {stayed} ({percent}%)")
+
+        return "\n".join(lines)
+
+    @staticmethod
+    def timeline_usage() -> str:
+        return (
+            "Не понял дату 🤷‍♀️\n\n"
+            "/timeline — последняя встреча\n"
+            "/timeline 2025-01-17 — встреча в этот день"
+        )
+
+    @staticmethod
+    def _format_week(stats: "WeeklyStats", title: str, date_format: str = "%d.%m") -> str:
+        """Форматировать одну неделю (или другой период)."""
+        start = stats.start_date.strftime(date_format)
+        end = stats.end_date.strftime(date_format)
 
         lines = [f"📊 {title} ({start} — {end})\n"]
 
@@ -546,3 +617,34 @@ class StatisticsTemplates:
             lines.append("   Анкеты: —")
 
         return "\n".join(lines)
+
+
+class VideoChatDashboardTemplates:
+    """Живое сообщение о встрече в ветке команд."""
+
+    @staticmethod
+    def format_dashboard(
+            present: int,
+            peak: int,
+            managers: list[tuple[str, int]],
+            ended: bool = False
+    ) -> str:
+        """Сколько участниц в звонке, пик и разбивка по менеджерам."""
+        from utils.time import get_tashkent_now
+
+        title = "🏁 Встреча завершена" if ended else "🎥 Встреча идёт"
+        lines = [
+            f"{title}\n",
+            f"👥 Сейчас в звонке: {present}",
+            f"📈 Пик: {peak}\n",
+        ]
+
+        for name, count in managers:
+            lines.append(f"👤 {name}: {count}")
+        if managers:
+            lines.append("")
+
+        updated = get_tashkent_now().strftime("%H:%M:%S")
+        lines.append(f"🕐 Обновлено: {updated}")
+
+        return "\n".join(lines)
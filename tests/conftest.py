@@ -1,4 +1,5 @@
 from pathlib import Path
+from datetime import date
 from typing import Any, AsyncGenerator
 from dotenv import load_dotenv
 
@@ -169,7 +170,8 @@ async def test_member(
         first_name="Анна",
         last_name="Тестова",
         username="anna_test",
-        invite_link_id=test_invite_link.id
+        invite_link_id=test_invite_link.id,
+        cohort_week=date(2025, 1, 13)
     )
 
     yield member
@@ -63,4 +63,17 @@ class TestCommandMessageRepository:
         await command_message_repository.delete_all_messages()
 
         messages = await command_message_repository.get_all_messages()
-        assert messages == []
\ No newline at end of file
+        assert messages == []
+
+    async def test_delete_by_message_ids_keeps_other_messages(
+            self,
+            command_message_repository: CommandMessageRepository
+    ):
+        """Тест: delete_by_message_ids удаляет только переданные сообщения"""
+        await command_message_repository.add_new_message(111)
+        await command_message_repository.add_new_message(222)
+
+        await command_message_repository.delete_by_message_ids([111])
+
+        messages = await command_message_repository.get_all_messages()
+        assert [m.message_id for m in messages] == [222]
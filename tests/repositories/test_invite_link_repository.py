@@ -60,6 +60,15 @@ class TestInviteLinkRepository:
 
         assert result is None
 
+    async def test_get_manager_ids_returns_mapping(
+            self,
+            invite_link_repository: InviteLinkRepository,
+            test_invite_link: InviteLink
+    ):
+        result = await invite_link_repository.get_manager_ids([test_invite_link.id, 999999999])
+
+        assert result == {test_invite_link.id: test_invite_link.manager_id}
+
     async def test_mark_as_used_updates_is_used(
             self,
             invite_link_repository: InviteLinkRepository,
@@ -1,3 +1,5 @@
+from datetime import date
+
 import pytest
 
 from models.invite_link import InviteLink
@@ -29,7 +31,8 @@ class TestMemberRepository:
             first_name="Анна",
             last_name="Тестова",
             username="anna_testova",
-            invite_link_id=test_invite_link.id
+            invite_link_id=test_invite_link.id,
+            cohort_week=date(2025, 1, 13)
         )
 
         assert result.telegram_id == test_telegram_id
@@ -37,6 +40,8 @@ class TestMemberRepository:
         assert result.last_name == "Тестова"
         assert result.username == "anna_testova"
         assert result.invite_link_id == test_invite_link.id
+        assert result.cohort_week == date(2025, 1, 13)
+        assert result.in_group is True
 
         # Cleanup после
         await supabase.schema("meeting").table("members").delete().eq(
@@ -66,14 +71,16 @@ class TestMemberRepository:
             first_name="Айгуль",
             last_name="Каримова",
             username="aigul",
-            invite_link_id=test_invite_link.id
+            invite_link_id=test_invite_link.id,
+            cohort_week=date(2025, 1, 13)
         )
         member2 = await member_repository.create(
             telegram_id=telegram_id_2,
             first_name="Мадина",
             last_name="Ахметова",
             username=None,
-            invite_link_id=test_invite_link.id
+            invite_link_id=test_invite_link.id,
+            cohort_week=date(2025, 1, 13)
         )
 
         # Вызываем метод
@@ -106,3 +113,37 @@ class TestMemberRepository:
         result = await member_repository.get_by_telegram_id(999999999)
 
         assert result is None
+
+    async def test_get_by_ids_returns_members(
+            self,
+            member_repository: MemberRepository,
+            test_member: Member
+    ):
+        result = await member_repository.get_by_ids([test_member.id, 999999999])
+
+        assert [member.id for member in result] == [test_member.id]
+
+    async def test_mark_left_group_excludes_from_in_group(
+            self,
+            member_repository: MemberRepository,
+            test_member: Member
+    ):
+        in_group = await member_repository.get_in_group()
+        assert test_member.id in [member.id for member in in_group]
+
+        await member_repository.mark_left_group([test_member.telegram_id])
+
+        in_group = await member_repository.get_in_group()
+        assert test_member.id not in [member.id for member in in_group]
+
+    async def test_iter_all_pages_by_id(
+            self,
+            member_repository: MemberRepository,
+            test_member: Member
+    ):
+        pages = [page async for page in member_repository.iter_all(page_size=1, prefetch=True)]
+
+        assert all(len(page) == 1 for page in pages)
+        member_ids = [page[0].id for page in pages]
+        assert test_member.id in member_ids
+        assert member_ids == sorted(member_ids)
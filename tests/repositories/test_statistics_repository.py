@@ -146,4 +146,56 @@ class TestStatisticsRepository:
         # Cleanup
         await supabase.schema("meeting").table("applications").delete().eq(
             "id", app.id
-        ).execute()
\ No newline at end of file
+        ).execute()
+    async def test_get_weekly_aggregates_contains_manager_row(
+        self,
+        statistics_repository: StatisticsRepository,
+        application_repository: ApplicationRepository,
+        test_manager: Manager,
+        test_member: Member,
+        supabase
+    ):
+        app = await application_repository.create(
+            manager_id=test_manager.id,
+            member_id=test_member.id,
+            status="completed"
+        )
+
+        start_date = datetime.now() - timedelta(days=1)
+        end_date = datetime.now() + timedelta(days=1)
+
+        result = await statistics_repository.get_weekly_aggregates(
+            start_date=start_date,
+            end_date=end_date
+        )
+
+        rows = {row["manager_id"]: row for row in result}
+        assert test_manager.id in rows
+        assert rows[test_manager.id]["members_count"] >= 1
+        assert rows[test_manager.id]["completed_count"] >= 1
+
+        # Cleanup
+        await supabase.schema("meeting").table("applications").delete().eq(
+            "id", app.id
+        ).execute()
+
+    async def test_get_rollup_aggregates_after_refresh(
+        self,
+        statistics_repository: StatisticsRepository,
+        test_manager: Manager,
+        test_member: Member
+    ):
+        today = datetime.now().date()
+
+        await statistics_repository.refresh_daily_rollups(
+            start_day=today - timedelta(days=1),
+            end_day=today + timedelta(days=1)
+        )
+        result = await statistics_repository.get_rollup_aggregates(
+            start_day=today - timedelta(days=1),
+            end_day=today + timedelta(days=1)
+        )
+
+        rows = {row["manager_id"]: row for row in result}
+        assert test_manager.id in rows
+        assert rows[test_manager.id]["members_count"] >= 1
@@ -59,4 +59,42 @@ class TestVideoChatAttendanceRepository:
             "*"
         ).eq("id", attendance.id).execute()
 
-        assert response.data[0]["left_at"] is not None
\ No newline at end of file
+        assert response.data[0]["left_at"] is not None
+    async def test_insert_sessions_skips_replayed_event(
+            self,
+            repository: VideoChatAttendanceRepository,
+            test_member: Member,
+            supabase: AsyncClient
+    ):
+        now = get_tashkent_now()
+        session = {
+            "member_id": test_member.id,
+            "meeting_date": now.date().isoformat(),
+            "joined_at": now.isoformat(),
+            "left_at": now.isoformat(),
+            "event_id": f"test-{test_member.id}",
+        }
+
+        inserted = await repository.insert_sessions([session])
+        replayed = await repository.insert_sessions([session])
+
+        response = await supabase.schema("meeting").table("video_chat_attendance").select(
+            "*"
+        ).eq("member_id", test_member.id).execute()
+
+        assert (inserted, replayed) == (1, 0)
+        assert len(response.data) == 1
+        assert response.data[0]["left_at"] is not None
+
+    async def test_get_sessions_by_date_returns_meeting_sessions(
+            self,
+            repository: VideoChatAttendanceRepository,
+            test_member: Member
+    ):
+        now = get_tashkent_now()
+        await repository.create(member_id=test_member.id, meeting_date=now.date(), joined_at=now)
+
+        result = await repository.get_sessions_by_date(now.date())
+
+        assert test_member.id in {row["member_id"] for row in result}
+        assert set(result[0]) == {"member_id", "joined_at", "left_at"}
@@ -0,0 +1,18 @@
+"""Smoke-тест replay-харнесса Video Chat."""
+from scripts.benchmarks.video_chat_replay import generate_meeting, replay
+from utils.raw_update_recorder import read_recording
+
+
+class TestVideoChatReplay:
+
+    async def test_replays_generated_meeting(self, tmp_path):
+        path = str(tmp_path / "meeting.jsonl")
+        recorded = generate_meeting(path, members_count=20)
+
+        results = await replay(list(read_recording(path)))
+
+        assert results["updates"] == recorded
+        assert results["members"] == 20
+        assert results["sessions_closed"] > 0
+        # Кэш прогрет на CALL — Supabase на каждую участницу не дёргается
+        assert results["cache_misses"] == 0
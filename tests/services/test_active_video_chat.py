@@ -0,0 +1,72 @@
+"""Тесты для ActiveVideoChatTracker."""
+import json
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from services.active_video_chat import ActiveVideoChat, ActiveVideoChatTracker
+from services.video_chat_service import VideoChatService
+from utils.time import TASHKENT_TZ
+
+
+def make_payload(call_id: int) -> str:
+    return json.dumps({
+        "call_id": call_id,
+        "access_hash": 987654321,
+        "link": "https://t.me/c/123",
+        "title": "Еженедельная встреча",
+        "scheduled_for": datetime(2025, 1, 17, 14, 0, tzinfo=TASHKENT_TZ).isoformat(),
+    })
+
+
+class TestActiveVideoChatTracker:
+
+    @pytest.fixture
+    def mock_redis(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def tracker(self, mock_redis) -> ActiveVideoChatTracker:
+        return ActiveVideoChatTracker(redis=mock_redis)
+
+    def test_no_call_rejects_everything(self, tracker: ActiveVideoChatTracker):
+        assert tracker.is_active(111) is False
+
+    async def test_load_reads_redis_key(
+            self,
+            tracker: ActiveVideoChatTracker,
+            mock_redis: AsyncMock
+    ):
+        mock_redis.get.return_value = make_payload(111).encode()
+
+        await tracker.load()
+
+        mock_redis.get.assert_called_once_with(VideoChatService.REDIS_KEY)
+        assert tracker.current == ActiveVideoChat(
+            call_id=111,
+            access_hash=987654321,
+            scheduled_for=datetime(2025, 1, 17, 14, 0, tzinfo=TASHKENT_TZ),
+        )
+        assert tracker.is_active(111) is True
+        assert tracker.is_active(222) is False
+
+    async def test_load_without_key_clears_call(
+            self,
+            tracker: ActiveVideoChatTracker,
+            mock_redis: AsyncMock
+    ):
+        tracker.handle_update(make_payload(111))
+        mock_redis.get.return_value = None
+
+        await tracker.load()
+
+        assert tracker.current is None
+        assert tracker.is_active(111) is False
+
+    def test_update_switches_to_new_call(self, tracker: ActiveVideoChatTracker):
+        tracker.handle_update(make_payload(111))
+        tracker.handle_update(make_payload(222).encode())
+
+        assert tracker.is_active(111) is False
+        assert tracker.is_active(222) is True
@@ -0,0 +1,113 @@
+"""Тесты для attendance_analytics."""
+import numpy as np
+
+from services.attendance_analytics import (
+    build_timeline,
+    member_totals,
+    merge_intervals,
+    parse_timestamps,
+    summarize_durations,
+)
+
+
+def session(member_id: int, joined: str, left: str | None) -> dict:
+    return {
+        "member_id": member_id,
+        "joined_at": f"2025-01-15T{joined}:00+00:00",
+        "left_at": f"2025-01-15T{left}:00+00:00" if left else None,
+    }
+
+
+class TestParseTimestamps:
+
+    def test_parses_utc_formats_and_offsets(self):
+        result = parse_timestamps([
+            "2025-01-15T10:00:00Z",
+            "2025-01-15T10:00:00+00:00",
+            "2025-01-15T15:00:00+05:00",
+            "2025-01-15T10:00:00.250000+00:00",
+        ])
+
+        base = 1736935200000
+        assert result.tolist() == [base, base, base, base + 250]
+
+
+class TestMergeIntervals:
+
+    def test_merges_overlapping_and_adjacent_per_member(self):
+        member_ids = np.array([2, 1, 1, 1, 2])
+        starts = np.array([0, 50, 0, 10, 30])
+        ends = np.array([10, 60, 10, 20, 40])
+
+        members, merged_starts, merged_ends = merge_intervals(member_ids, starts, ends)
+
+        assert members.tolist() == [1, 1, 2, 2]
+        assert merged_starts.tolist() == [0, 50, 0, 30]
+        assert merged_ends.tolist() == [20, 60, 10, 40]
+
+    def test_contained_interval_does_not_split(self):
+        # Длинная сессия целиком накрывает следующую, за ней идёт смежная
+        members, starts, ends = merge_intervals(
+            np.array([1, 1, 1]), np.array([0, 10, 100]), np.array([100, 20, 120])
+        )
+
+        assert starts.tolist() == [0]
+        assert ends.tolist() == [120]
+
+
+class TestSummarizeDurations:
+
+    def test_empty(self):
+        summary = summarize_durations([session(1, "10:00", None)])
+
+        assert summary.members_count == 0
+        assert summary.mean_seconds is None
+
+    def test_totals_per_member(self):
+        video_data = [
+            session(1, "10:00", "10:10"),
+            session(1, "10:05", "10:30"),
+            session(2, "10:00", "10:10"),
+            session(2, "11:00", "11:10"),
+            session(3, "10:30", "10:00"),  # отрицательная — игнор
+        ]
+
+        member_ids, totals = member_totals(video_data)
+        summary = summarize_durations(video_data, percentiles=(50, 100))
+
+        assert member_ids.tolist() == [1, 2]
+        assert totals.tolist() == [1800.0, 1200.0]
+        assert summary.members_count == 2
+        assert summary.total_seconds == 3000.0
+        assert summary.mean_seconds == 1500.0
+        assert summary.percentiles == {50: 1500.0, 100: 1800.0}
+
+
+class TestBuildTimeline:
+
+    def test_concurrency_peak_and_retention(self):
+        video_data = [
+            session(1, "10:00", "10:05"),
+            session(1, "10:04", "10:10"),  # переподключение — одно присутствие
+            session(2, "10:02", "10:03"),
+            session(3, "10:03", "10:04"),  # вошла, когда 2 вышла — пик не растёт
+            session(3, "10:06", None),  # открытая — не считается
+        ]
+
+        timeline = build_timeline(video_data)
+
+        assert timeline.started_at.isoformat() == "2025-01-15T10:00:00+00:00"
+        assert timeline.members_count == 3
+        assert timeline.peak == 2
+        assert timeline.peak_at.isoformat() == "2025-01-15T10:02:00+00:00"
+        assert timeline.concurrency == [1, 1, 2, 2, 2, 1, 1, 1, 1, 1, 1]
+        # 10, 1 и 1 минута на видео
+        assert timeline.retention == [3, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1]
+        assert timeline.drop_offs == [0, 0, 0, 1, 1, 0, 0, 0, 0, 0, 1]
+
+    def test_empty(self):
+        timeline = build_timeline([session(1, "10:00", None)])
+
+        assert timeline.members_count == 0
+        assert timeline.peak_at is None
+        assert timeline.concurrency == []
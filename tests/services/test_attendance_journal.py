@@ -0,0 +1,91 @@
+"""Тесты для AttendanceJournal."""
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, call
+
+import pytest
+
+from services.attendance_journal import AttendanceJournal
+from services.attendance_write_buffer import AttendanceWriteBuffer
+from utils.time import TASHKENT_TZ
+
+JOINED_AT = datetime(2025, 1, 17, 14, 0, tzinfo=TASHKENT_TZ)
+LEFT_AT = JOINED_AT + timedelta(minutes=30)
+
+
+def make_entry(entry_id: str, member_id: int) -> tuple[bytes, dict]:
+    return entry_id.encode(), {
+        b"member_id": str(member_id).encode(),
+        b"joined_at": JOINED_AT.isoformat().encode(),
+        b"left_at": LEFT_AT.isoformat().encode(),
+    }
+
+
+def stream_response(*entries) -> list:
+    return [[AttendanceJournal.STREAM_KEY.encode(), list(entries)]]
+
+
+class TestAttendanceJournal:
+
+    @pytest.fixture
+    def mock_redis(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def journal(self, mock_redis) -> AttendanceJournal:
+        return AttendanceJournal(redis=mock_redis)
+
+    @pytest.fixture
+    def mock_buffer(self) -> AsyncMock:
+        return AsyncMock(spec=AttendanceWriteBuffer)
+
+    async def test_drain_replays_pending_before_new(
+            self,
+            journal: AttendanceJournal,
+            mock_redis: AsyncMock,
+            mock_buffer: AsyncMock
+    ):
+        mock_redis.xreadgroup.side_effect = [
+            stream_response(make_entry("1-0", 1)),  # не подтверждено до рестарта
+            stream_response(),
+            stream_response(make_entry("2-0", 2)),
+            asyncio.CancelledError,
+        ]
+
+        with pytest.raises(asyncio.CancelledError):
+            await journal.drain(mock_buffer)
+
+        read_ids = [c.args[2][AttendanceJournal.STREAM_KEY] for c in mock_redis.xreadgroup.call_args_list]
+        assert read_ids == ["0", "1-0", ">", ">"]
+        assert mock_buffer.mock_calls == [
+            call.add_session(
+                member_id=member_id,
+                meeting_date=JOINED_AT.date(),
+                joined_at=JOINED_AT,
+                left_at=LEFT_AT,
+                event_id=event_id
+            )
+            for member_id, event_id in ((1, "1-0"), (2, "2-0"))
+        ]
+
+    async def test_drain_survives_redis_errors(
+            self,
+            journal: AttendanceJournal,
+            mock_redis: AsyncMock,
+            mock_buffer: AsyncMock,
+            monkeypatch
+    ):
+        from redis.exceptions import ConnectionError as RedisConnectionError
+
+        monkeypatch.setattr(AttendanceJournal, "RECONNECT_DELAY", 0)
+        mock_redis.xreadgroup.side_effect = [
+            RedisConnectionError("Connection refused"),
+            stream_response(),
+            stream_response(make_entry("1-0", 1)),
+            asyncio.CancelledError,
+        ]
+
+        with pytest.raises(asyncio.CancelledError):
+            await journal.drain(mock_buffer)
+
+        mock_buffer.add_session.assert_called_once()
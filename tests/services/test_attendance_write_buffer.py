@@ -0,0 +1,175 @@
+"""Тесты для AttendanceWriteBuffer."""
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from repositories.video_chat_attendance_repository import VideoChatAttendanceRepository
+from services.attendance_write_buffer import AttendanceWriteBuffer
+from utils.time import TASHKENT_TZ
+
+JOINED_AT = datetime(2025, 1, 17, 14, 0, tzinfo=TASHKENT_TZ)
+LEFT_AT = JOINED_AT + timedelta(minutes=30)
+TODAY = JOINED_AT.date()
+
+
+def sent_batches(repository: AsyncMock) -> list[list[int]]:
+    """member_id сессий каждого вызова insert_sessions."""
+    return [
+        [row["member_id"] for row in c.args[0]]
+        for c in repository.insert_sessions.call_args_list
+    ]
+
+
+class TestAttendanceWriteBuffer:
+
+    @pytest.fixture
+    def mock_repository(self) -> AsyncMock:
+        return AsyncMock(spec=VideoChatAttendanceRepository)
+
+    @pytest.fixture
+    def buffer(self, mock_repository) -> AttendanceWriteBuffer:
+        return AttendanceWriteBuffer(repository=mock_repository, batch_size=3)
+
+    async def add(self, buffer: AttendanceWriteBuffer, member_id: int, event_id: str | None = None):
+        await buffer.add_session(member_id, TODAY, JOINED_AT, LEFT_AT, event_id=event_id)
+
+    async def test_leave_storm_is_one_request_per_batch(
+            self,
+            buffer: AttendanceWriteBuffer,
+            mock_repository: AsyncMock
+    ):
+        for member_id in range(1, 8):
+            await self.add(buffer, member_id)
+
+        await buffer.flush()
+
+        assert sent_batches(mock_repository) == [[1, 2, 3], [4, 5, 6], [7]]
+        assert buffer.pending == 0
+        assert buffer.flushed_sessions == 7
+
+    async def test_session_row(
+            self,
+            buffer: AttendanceWriteBuffer,
+            mock_repository: AsyncMock
+    ):
+        await self.add(buffer, 1, event_id="1-0")
+
+        await buffer.flush()
+
+        assert mock_repository.insert_sessions.call_args.args[0] == [{
+            "member_id": 1,
+            "meeting_date": "2025-01-17",
+            "joined_at": "2025-01-17T14:00:00+05:00",
+            "left_at": "2025-01-17T14:30:00+05:00",
+            "event_id": "1-0",
+        }]
+
+    async def test_failed_batch_is_retried_in_order(
+            self,
+            buffer: AttendanceWriteBuffer,
+            mock_repository: AsyncMock
+    ):
+        mock_repository.insert_sessions.side_effect = [RuntimeError("timeout"), 1, 1]
+        await self.add(buffer, 1)
+        await buffer.flush()
+        await self.add(buffer, 2)
+
+        await buffer.flush()
+
+        assert sent_batches(mock_repository) == [[1], [1], [2]]
+        assert buffer.failed_flushes == 1
+        assert buffer.pending == 0
+
+    async def test_batch_dropped_after_max_attempts(
+            self,
+            buffer: AttendanceWriteBuffer,
+            mock_repository: AsyncMock
+    ):
+        mock_repository.insert_sessions.side_effect = RuntimeError("Supabase is down")
+        await self.add(buffer, 1)
+
+        for _ in range(buffer.max_attempts):
+            await buffer.flush()
+
+        assert buffer.dropped_sessions == 1
+        assert buffer.pending == 0
+
+    async def test_written_batch_is_confirmed(self, mock_repository: AsyncMock):
+        on_flushed = AsyncMock()
+        buffer = AttendanceWriteBuffer(repository=mock_repository, on_flushed=on_flushed)
+        await self.add(buffer, 1, event_id="1-0")
+        await self.add(buffer, 2, event_id="2-0")
+
+        await buffer.flush()
+
+        on_flushed.assert_called_once_with(["1-0", "2-0"])
+
+    async def test_failed_batch_is_not_confirmed(self, mock_repository: AsyncMock):
+        mock_repository.insert_sessions.side_effect = RuntimeError("Supabase is down")
+        on_flushed = AsyncMock()
+        buffer = AttendanceWriteBuffer(
+            repository=mock_repository,
+            max_attempts=None,
+            on_flushed=on_flushed
+        )
+        await self.add(buffer, 1, event_id="1-0")
+
+        for _ in range(5):
+            await buffer.flush()
+
+        on_flushed.assert_not_called()
+        assert buffer.pending == 1
+        assert buffer.dropped_sessions == 0
+
+    async def test_backpressure_waits_for_flush(self, mock_repository: AsyncMock):
+        buffer = AttendanceWriteBuffer(
+            repository=mock_repository,
+            flush_interval=60,
+            batch_size=10,
+            max_pending=2
+        )
+        buffer.start()
+
+        for member_id in range(1, 4):
+            await self.add(buffer, member_id)
+        await buffer.stop()
+
+        assert buffer.backpressure_waits >= 1
+        assert buffer.max_pending_seen == 2
+        assert buffer.flushed_sessions == 3
+
+    async def test_failed_batch_backs_off_under_backpressure(self, mock_repository: AsyncMock):
+        mock_repository.insert_sessions.side_effect = RuntimeError("Supabase is down")
+        buffer = AttendanceWriteBuffer(
+            repository=mock_repository,
+            flush_interval=0.05,
+            batch_size=1,
+            max_pending=1,
+            max_attempts=None
+        )
+        buffer.start()
+
+        await self.add(buffer, 1)
+        blocked = asyncio.create_task(self.add(buffer, 2))  # ждёт backpressure
+        await asyncio.sleep(0.3)
+
+        # Пауза 0.05, 0.1, 0.15 с — а не запрос на каждый проход цикла
+        assert mock_repository.insert_sessions.call_count <= 4
+        assert not blocked.done()
+
+        blocked.cancel()
+        buffer._task.cancel()
+
+    async def test_stop_flushes_leftovers(
+            self,
+            buffer: AttendanceWriteBuffer,
+            mock_repository: AsyncMock
+    ):
+        buffer.start()
+        await self.add(buffer, 1)
+
+        await buffer.stop()
+
+        assert sent_batches(mock_repository) == [[1]]
@@ -0,0 +1,94 @@
+"""Тесты для CleanupCheckpoint."""
+from datetime import date, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.cleanup_checkpoint import CleanupCheckpoint
+from utils.time import TASHKENT_TZ
+
+WEEK = date(2025, 1, 20)
+JOB_KEY = "meeting_bot:cleanup:2025-01-20:job"
+PROCESSED_KEY = "meeting_bot:cleanup:2025-01-20:processed"
+
+
+class TestCleanupCheckpoint:
+
+    @pytest.fixture
+    def mock_redis(self) -> MagicMock:
+        redis = MagicMock()
+        redis.hsetnx = AsyncMock(return_value=1)
+        redis.expire = AsyncMock()
+        redis.exists = AsyncMock(return_value=0)
+        redis.smembers = AsyncMock(return_value=set())
+        redis.delete = AsyncMock()
+        redis.set = AsyncMock(return_value=True)
+        redis.register_script = MagicMock(side_effect=lambda script: AsyncMock())
+
+        pipe = MagicMock()
+        pipe.execute = AsyncMock()
+        redis.pipeline.return_value.__aenter__ = AsyncMock(return_value=pipe)
+        redis.pipeline.return_value.__aexit__ = AsyncMock(return_value=False)
+        redis.pipe = pipe
+        return redis
+
+    @pytest.fixture
+    def checkpoint(self, mock_redis) -> CleanupCheckpoint:
+        return CleanupCheckpoint(mock_redis, WEEK)
+
+    async def test_begin_new_job(self, checkpoint: CleanupCheckpoint, mock_redis: MagicMock):
+        assert await checkpoint.begin("2025-01-19T23:59:00") is False
+        mock_redis.hsetnx.assert_awaited_once_with(
+            JOB_KEY, "started_at", "2025-01-19T23:59:00"
+        )
+
+    async def test_begin_resumes_existing_job(self, checkpoint: CleanupCheckpoint, mock_redis: MagicMock):
+        mock_redis.hsetnx.return_value = 0
+
+        assert await checkpoint.begin("2025-01-20T00:05:00") is True
+
+    def test_resume_after_midnight_keeps_week(self):
+        started = datetime(2025, 1, 19, 23, 59, tzinfo=TASHKENT_TZ)  # воскресенье
+        resumed = datetime(2025, 1, 20, 0, 5, tzinfo=TASHKENT_TZ)
+
+        assert CleanupCheckpoint.week_of(started) == CleanupCheckpoint.week_of(resumed) == WEEK
+
+    def test_next_sunday_starts_new_week(self):
+        next_run = datetime(2025, 1, 26, 23, 59, tzinfo=TASHKENT_TZ)
+
+        assert CleanupCheckpoint.week_of(next_run) == date(2025, 1, 27)
+
+    async def test_processed_roundtrip(self, checkpoint: CleanupCheckpoint, mock_redis: MagicMock):
+        await checkpoint.mark_processed([1, 2])
+        mock_redis.pipe.sadd.assert_called_once_with(PROCESSED_KEY, "1", "2")
+
+        mock_redis.smembers.return_value = {b"1", b"2"}
+        assert await checkpoint.get_processed() == {1, 2}
+
+    async def test_mark_processed_empty_is_noop(
+            self,
+            checkpoint: CleanupCheckpoint,
+            mock_redis: MagicMock
+    ):
+        await checkpoint.mark_processed([])
+
+        mock_redis.pipeline.assert_not_called()
+
+    async def test_finish_deletes_keys(self, checkpoint: CleanupCheckpoint, mock_redis: MagicMock):
+        await checkpoint.finish()
+
+        mock_redis.delete.assert_awaited_once_with(JOB_KEY, PROCESSED_KEY)
+
+    async def test_lock_acquired_and_released(self, checkpoint: CleanupCheckpoint):
+        async with checkpoint.lock() as locked:
+            assert locked is True
+
+        checkpoint._release.assert_awaited_once()
+
+    async def test_lock_busy(self, checkpoint: CleanupCheckpoint, mock_redis: MagicMock):
+        mock_redis.set.return_value = None
+
+        async with checkpoint.lock(wait=0) as locked:
+            assert locked is False
+
+        checkpoint._release.assert_not_awaited()
@@ -1,13 +1,34 @@
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from aiogram import Bot
-from aiogram.exceptions import TelegramBadRequest
+from aiogram.exceptions import (
+    TelegramBadRequest,
+    TelegramForbiddenError,
+    TelegramNetworkError,
+    TelegramRetryAfter,
+)
 
 from services.command_message_service import CommandMessageService
 from models.command_message import CommandMessage
 
 
+def make_messages(*message_ids: int) -> list[CommandMessage]:
+    return [
+        CommandMessage(id=i, message_id=message_id, bot_type="test", created_at="2025-01-01T00:00:00")
+        for i, message_id in enumerate(message_ids, start=1)
+    ]
+
+
+def pages(*batches: list[CommandMessage]):
+    """iter_messages: async-генератор страниц"""
+    async def iterate(*args, **kwargs):
+        for batch in batches:
+            yield batch
+
+    return MagicMock(side_effect=iterate)
+
+
 class TestCommandMessageService:
 
     @pytest.fixture
@@ -35,32 +56,47 @@ class TestCommandMessageService:
             mock_bot: AsyncMock,
             mock_repository: AsyncMock
     ):
-        """Тест: clear_messages удаляет все сообщения из Telegram"""
+        """Тест: clear_messages удаляет все сообщения одним deleteMessages"""
         # Arrange
-        mock_repository.get_all_messages.return_value = [
-            CommandMessage(id=1, message_id=111, bot_type="test", created_at="2025-01-01T00:00:00"),
-            CommandMessage(id=2, message_id=222, bot_type="test", created_at="2025-01-01T00:00:00"),
-        ]
+        mock_repository.iter_messages = pages(make_messages(111, 222))
 
         # Act
         deleted_count = await service.clear_messages()
 
         # Assert
         assert deleted_count == 2
-        assert mock_bot.delete_message.call_count == 2
-        mock_repository.delete_all_messages.assert_called_once()
+        mock_bot.delete_messages.assert_called_once_with(chat_id=-1001234567890, message_ids=[111, 222])
+        mock_bot.delete_message.assert_not_called()
+        mock_repository.delete_by_message_ids.assert_called_once_with([111, 222])
+
+    async def test_clear_messages_deletes_in_chunks_of_100(
+            self,
+            service: CommandMessageService,
+            mock_bot: AsyncMock,
+            mock_repository: AsyncMock
+    ):
+        """Тест: 500 сообщений — 5 запросов"""
+        mock_repository.iter_messages = pages(make_messages(*range(1, 501)))
+
+        deleted_count = await service.clear_messages()
+
+        assert deleted_count == 500
+        assert mock_bot.delete_messages.call_count == 5
+        assert all(len(c.kwargs["message_ids"]) == 100 for c in mock_bot.delete_messages.call_args_list)
 
     async def test_clear_messages_returns_zero_when_no_messages(
             self,
             service: CommandMessageService,
+            mock_bot: AsyncMock,
             mock_repository: AsyncMock
     ):
         """Тест: clear_messages возвращает 0 если нет сообщений"""
-        mock_repository.get_all_messages.return_value = []
+        mock_repository.iter_messages = pages()
 
         deleted_count = await service.clear_messages()
 
         assert deleted_count == 0
+        mock_bot.delete_messages.assert_not_called()
 
     async def test_clear_messages_handles_telegram_error(
             self,
@@ -68,19 +104,78 @@ class TestCommandMessageService:
             mock_bot: AsyncMock,
             mock_repository: AsyncMock
     ):
-        """Тест: clear_messages обрабатывает ошибку если сообщение не найдено"""
-        mock_repository.get_all_messages.return_value = [
-            CommandMessage(id=1, message_id=111, bot_type="test", created_at="2025-01-01T00:00:00"),
-            CommandMessage(id=2, message_id=222, bot_type="test", created_at="2025-01-01T00:00:00"),
-        ]
-
-        # Первое сообщение удалится, второе вызовет ошибку
+        """Тест: отклонённая пачка удаляется по одному, в БД остаются временные ошибки"""
+        mock_repository.iter_messages = pages(make_messages(111, 222, 333, 444))
+        mock_bot.delete_messages.side_effect = TelegramBadRequest(
+            method="deleteMessages", message="message can't be deleted"
+        )
         mock_bot.delete_message.side_effect = [
             None,
-            TelegramBadRequest(method="deleteMessage", message="message not found")
+            TelegramBadRequest(method="deleteMessage", message="message can't be deleted"),
+            TelegramBadRequest(method="deleteMessage", message="message to delete not found"),
+            TelegramNetworkError(method=MagicMock(), message="timeout"),
         ]
 
         deleted_count = await service.clear_messages()
 
         assert deleted_count == 1  # только одно удалилось
-        mock_repository.delete_all_messages.assert_called_once()  # cleanup всё равно вызван
\ No newline at end of file
+        assert mock_bot.delete_message.call_count == 4
+        # 222 не удалится никогда, 333 в чате уже нет; 444 — повторим в следующий раз
+        mock_repository.delete_by_message_ids.assert_called_once_with([111, 222, 333])
+
+    async def test_clear_messages_keeps_messages_without_permission(
+            self,
+            service: CommandMessageService,
+            mock_bot: AsyncMock,
+            mock_repository: AsyncMock
+    ):
+        """Тест: нет прав — по одному не пробуем, БД не трогаем"""
+        mock_repository.iter_messages = pages(make_messages(111, 222))
+        mock_bot.delete_messages.side_effect = TelegramForbiddenError(method="deleteMessages", message="forbidden")
+
+        deleted_count = await service.clear_messages()
+
+        assert deleted_count == 0
+        mock_bot.delete_message.assert_not_called()
+        mock_repository.delete_by_message_ids.assert_not_called()
+
+    async def test_clear_messages_waits_on_retry_after(
+            self,
+            service: CommandMessageService,
+            mock_bot: AsyncMock,
+            mock_repository: AsyncMock
+    ):
+        """Тест: flood wait — та же пачка повторяется"""
+        mock_repository.iter_messages = pages(make_messages(111))
+        mock_bot.delete_messages.side_effect = [
+            TelegramRetryAfter(method=MagicMock(), message="Flood", retry_after=0),
+            True,
+        ]
+
+        deleted_count = await service.clear_messages()
+
+        assert deleted_count == 1
+        assert mock_bot.delete_messages.call_count == 2
+
+    async def test_one_by_one_waits_on_retry_after(
+            self,
+            service: CommandMessageService,
+            mock_bot: AsyncMock,
+            mock_repository: AsyncMock
+    ):
+        """Тест: flood wait при удалении по одному — сообщение повторяется"""
+        mock_repository.iter_messages = pages(make_messages(111, 222))
+        mock_bot.delete_messages.side_effect = TelegramBadRequest(
+            method=MagicMock(), message="Bad Request: MESSAGE_DELETE_FORBIDDEN"
+        )
+        mock_bot.delete_message.side_effect = [
+            TelegramRetryAfter(method=MagicMock(), message="Flood", retry_after=0),
+            True,
+            True,
+        ]
+
+        deleted_count = await service.clear_messages()
+
+        assert deleted_count == 2
+        assert mock_bot.delete_message.call_count == 3
+        mock_repository.delete_by_message_ids.assert_called_once_with([111, 222])
@@ -0,0 +1,86 @@
+"""Тесты для LiveSessionStore."""
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.attendance_journal import AttendanceJournal
+from services.live_sessions import ClosedSession, LiveSessionStore
+from utils.time import TASHKENT_TZ
+
+NOW = datetime(2025, 1, 17, 14, 0, tzinfo=TASHKENT_TZ)
+
+
+class TestLiveSessionStore:
+
+    @pytest.fixture
+    def scripts(self) -> list[AsyncMock]:
+        return [AsyncMock(), AsyncMock()]
+
+    @pytest.fixture
+    def mock_redis(self, scripts) -> MagicMock:
+        redis = MagicMock()
+        redis.register_script.side_effect = list(scripts)
+        redis.hsetnx = AsyncMock(return_value=1)
+        redis.hkeys = AsyncMock(return_value=[b"1", b"2"])
+        redis.hlen = AsyncMock(return_value=2)
+        return redis
+
+    @pytest.fixture
+    def store(self, mock_redis) -> LiveSessionStore:
+        return LiveSessionStore(redis=mock_redis)
+
+    async def test_open_keeps_first_join(self, store: LiveSessionStore, mock_redis: MagicMock):
+        assert await store.open(1, NOW) is True
+
+        mock_redis.hsetnx.assert_called_once_with(
+            LiveSessionStore.KEY, "1", "2025-01-17T14:00:00+05:00"
+        )
+
+    async def test_close_moves_session_to_journal(
+            self,
+            store: LiveSessionStore,
+            scripts: list[AsyncMock]
+    ):
+        close, _ = scripts
+        close.return_value = [b"1737104400000-0", b"2025-01-17T13:30:00+05:00"]
+
+        session = await store.close(1, NOW)
+
+        assert session == ClosedSession(
+            member_id=1,
+            joined_at=datetime(2025, 1, 17, 13, 30, tzinfo=TASHKENT_TZ),
+            left_at=NOW,
+            event_id="1737104400000-0",
+        )
+        close.assert_called_once_with(
+            keys=[LiveSessionStore.KEY, AttendanceJournal.STREAM_KEY],
+            args=["1", "2025-01-17T14:00:00+05:00", AttendanceJournal.MAX_LEN]
+        )
+
+    async def test_close_without_open_session(
+            self,
+            store: LiveSessionStore,
+            scripts: list[AsyncMock]
+    ):
+        close, _ = scripts
+        close.return_value = None
+
+        assert await store.close(1, NOW) is None
+
+    async def test_close_all_returns_sessions(
+            self,
+            store: LiveSessionStore,
+            scripts: list[AsyncMock]
+    ):
+        _, close_all = scripts
+        close_all.return_value = [b"1", b"2025-01-17T13:30:00+05:00", b"2", b"2025-01-17T13:45:00+05:00"]
+
+        sessions = await store.close_all(NOW)
+
+        assert [(s.member_id, s.joined_at.minute) for s in sessions] == [(1, 30), (2, 45)]
+        assert all(s.left_at == NOW for s in sessions)
+
+    async def test_live_count(self, store: LiveSessionStore):
+        assert await store.get_member_ids() == {1, 2}
+        assert await store.count() == 2
@@ -0,0 +1,149 @@
+"""Тесты для MeetingTimelineService."""
+from datetime import date, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from repositories.video_chat_attendance_repository import VideoChatAttendanceRepository
+from services.live_sessions import LiveSessionStore
+from services.meeting_timeline_service import MeetingTimelineService, dump_timeline, load_timeline
+from utils.time import get_tashkent_now
+
+MEETING_DATE = date(2025, 1, 17)
+VIDEO_DATA = [
+    {"member_id": 1, "joined_at": "2025-01-17T09:00:00+00:00", "left_at": "2025-01-17T09:30:00+00:00"},
+    {"member_id": 2, "joined_at": "2025-01-17T09:10:00+00:00", "left_at": "2025-01-17T09:20:00+00:00"},
+]
+
+
+class TestMeetingTimelineService:
+
+    @pytest.fixture
+    def mock_redis(self) -> AsyncMock:
+        redis = AsyncMock()
+        redis.get.return_value = None
+        redis.xlen.return_value = 0
+        redis.exists.return_value = 1  # звонок завершён
+        return redis
+
+    @pytest.fixture
+    def mock_repository(self) -> AsyncMock:
+        repository = AsyncMock(spec=VideoChatAttendanceRepository)
+        repository.get_sessions_by_date.return_value = VIDEO_DATA
+        return repository
+
+    @pytest.fixture
+    def mock_live_sessions(self) -> AsyncMock:
+        live_sessions = AsyncMock(spec=LiveSessionStore)
+        live_sessions.count.return_value = 0
+        return live_sessions
+
+    @pytest.fixture
+    def service(self, mock_redis, mock_repository, mock_live_sessions) -> MeetingTimelineService:
+        return MeetingTimelineService(
+            redis=mock_redis,
+            repository=mock_repository,
+            live_sessions=mock_live_sessions,
+        )
+
+    async def test_caches_finished_meeting(
+            self,
+            service: MeetingTimelineService,
+            mock_redis: AsyncMock,
+            mock_repository: AsyncMock
+    ):
+        timeline = await service.get(MEETING_DATE)
+
+        assert timeline.peak == 2
+        mock_repository.get_sessions_by_date.assert_called_once_with(MEETING_DATE)
+        key, raw = mock_redis.set.call_args.args
+        assert key == "meeting_bot:meeting_timeline:2025-01-17"
+        assert load_timeline(raw) == timeline
+
+    async def test_returns_cached(
+            self,
+            service: MeetingTimelineService,
+            mock_redis: AsyncMock,
+            mock_repository: AsyncMock
+    ):
+        mock_redis.get.return_value = dump_timeline(await service.get(MEETING_DATE)).encode()
+        mock_repository.reset_mock()
+
+        timeline = await service.get(MEETING_DATE)
+
+        assert timeline.members_count == 2
+        mock_repository.get_sessions_by_date.assert_not_called()
+
+    async def test_does_not_cache_running_meeting(
+            self,
+            service: MeetingTimelineService,
+            mock_redis: AsyncMock,
+            mock_live_sessions: AsyncMock
+    ):
+        mock_live_sessions.count.return_value = 5
+
+        await service.get(get_tashkent_now().date())
+
+        mock_redis.set.assert_not_called()
+
+    async def test_does_not_cache_unwritten_sessions(
+            self,
+            service: MeetingTimelineService,
+            mock_redis: AsyncMock
+    ):
+        mock_redis.xlen.return_value = 3  # журнал ещё не записан в БД
+
+        await service.get(get_tashkent_now().date())
+
+        mock_redis.set.assert_not_called()
+
+    async def test_does_not_cache_empty_timeline(
+            self,
+            service: MeetingTimelineService,
+            mock_redis: AsyncMock,
+            mock_repository: AsyncMock
+    ):
+        mock_repository.get_sessions_by_date.return_value = []
+
+        await service.get(get_tashkent_now().date() - timedelta(days=7))
+
+        mock_redis.set.assert_not_called()
+
+    async def test_does_not_cache_lull_before_call_end(
+            self,
+            service: MeetingTimelineService,
+            mock_redis: AsyncMock
+    ):
+        # Все вышли и журнал записан, но звонок ещё идёт
+        mock_redis.exists.return_value = 0
+
+        await service.get(get_tashkent_now().date())
+
+        mock_redis.exists.assert_called_once_with(
+            f"meeting_bot:meeting_timeline:{get_tashkent_now().date().isoformat()}:ended"
+        )
+        mock_redis.set.assert_not_called()
+
+    async def test_caches_today_after_call_end(
+            self,
+            service: MeetingTimelineService,
+            mock_redis: AsyncMock
+    ):
+        today = get_tashkent_now().date()
+
+        await service.mark_ended(today)
+        await service.get(today)
+
+        assert mock_redis.set.call_args_list[-1].args[0] == f"meeting_bot:meeting_timeline:{today.isoformat()}"
+
+    async def test_new_call_drops_saved_timeline(
+            self,
+            service: MeetingTimelineService,
+            mock_redis: AsyncMock
+    ):
+        await service.mark_started(MEETING_DATE)
+
+        mock_redis.delete.assert_called_once_with(
+            "meeting_bot:meeting_timeline:2025-01-17:ended",
+            "meeting_bot:meeting_timeline:2025-01-17"
+        )
@@ -0,0 +1,148 @@
+"""Тесты для MemberLookupService."""
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from models.member import Member
+from repositories.member_repository import MemberRepository
+from services.member_lookup_service import MemberLookupService
+
+
+def make_member(member_id: int, telegram_id: int) -> Member:
+    return Member(
+        id=member_id,
+        telegram_id=telegram_id,
+        first_name="Айгуль",
+        last_name=None,
+        username=None,
+        invite_link_id=1,
+        joined_at=datetime(2025, 1, 15, 12, 0),
+    )
+
+
+def pages(*batches: list[Member]):
+    """iter_in_group: async-генератор страниц"""
+    async def iterate(*args, **kwargs):
+        for batch in batches:
+            yield batch
+
+    return MagicMock(side_effect=iterate)
+
+
+class TestMemberLookupService:
+
+    @pytest.fixture
+    def mock_repository(self) -> AsyncMock:
+        return AsyncMock(spec=MemberRepository)
+
+    @pytest.fixture
+    def service(self, mock_repository) -> MemberLookupService:
+        return MemberLookupService(repository=mock_repository, max_size=2)
+
+    async def test_second_lookup_is_served_from_cache(
+            self,
+            service: MemberLookupService,
+            mock_repository: AsyncMock
+    ):
+        mock_repository.get_by_telegram_id.return_value = make_member(1, 100)
+
+        first = await service.get(100)
+        second = await service.get(100)
+
+        assert first == second
+        mock_repository.get_by_telegram_id.assert_called_once_with(100)
+        assert (service.hits, service.misses) == (1, 1)
+
+    async def test_caches_non_members(
+            self,
+            service: MemberLookupService,
+            mock_repository: AsyncMock
+    ):
+        mock_repository.get_by_telegram_id.return_value = None
+
+        assert await service.get(999) is None
+        assert await service.get(999) is None
+        mock_repository.get_by_telegram_id.assert_called_once()
+
+    async def test_put_replaces_negative_entry(
+            self,
+            service: MemberLookupService,
+            mock_repository: AsyncMock
+    ):
+        mock_repository.get_by_telegram_id.return_value = None
+        await service.get(100)
+
+        service.put(make_member(1, 100))
+
+        assert (await service.get(100)).id == 1
+
+    async def test_evicts_least_recently_used(
+            self,
+            service: MemberLookupService,
+            mock_repository: AsyncMock
+    ):
+        service.put(make_member(1, 100))
+        service.put(make_member(2, 200))
+        await service.get(100)
+        service.put(make_member(3, 300))  # вытесняет 200
+
+        mock_repository.get_by_telegram_id.return_value = None
+        assert await service.get(200) is None
+        mock_repository.get_by_telegram_id.assert_called_once_with(200)
+
+    async def test_warm_up_once_per_call(
+            self,
+            service: MemberLookupService,
+            mock_repository: AsyncMock
+    ):
+        mock_repository.iter_in_group = pages([make_member(1, 100)])
+
+        assert await service.warm_up_for_call(555) is True
+        assert await service.warm_up_for_call(555) is False
+
+        mock_repository.iter_in_group.assert_called_once()
+        assert (await service.get(100)).id == 1
+        mock_repository.get_by_telegram_id.assert_not_called()
+
+    async def test_failed_warm_up_is_retried(
+            self,
+            service: MemberLookupService,
+            mock_repository: AsyncMock
+    ):
+        mock_repository.iter_in_group = MagicMock(side_effect=ConnectionError("supabase"))
+
+        with pytest.raises(ConnectionError):
+            await service.warm_up_for_call(555)
+
+        mock_repository.iter_in_group = pages([make_member(1, 100)])
+        assert await service.warm_up_for_call(555) is True
+
+    async def test_warm_up_keeps_last_pages_over_max_size(
+            self,
+            service: MemberLookupService,
+            mock_repository: AsyncMock
+    ):
+        mock_repository.iter_in_group = pages(
+            [make_member(1, 100), make_member(2, 200)],
+            [make_member(3, 300)],
+        )
+
+        assert await service.warm_up() == 3
+
+        assert (await service.get(200)).id == 2
+        assert (await service.get(300)).id == 3
+        mock_repository.get_by_telegram_id.assert_not_called()
+
+    async def test_invalidation_message_clears_cache(
+            self,
+            service: MemberLookupService,
+            mock_repository: AsyncMock
+    ):
+        service.put(make_member(1, 100))
+        mock_repository.get_by_telegram_id.return_value = None
+
+        service.handle_invalidation(b"*")
+
+        assert await service.get(100) is None
+        mock_repository.get_by_telegram_id.assert_called_once_with(100)
@@ -0,0 +1,114 @@
+"""Тесты для MemberPurgeService."""
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiogram.exceptions import TelegramBadRequest, TelegramNetworkError, TelegramRetryAfter
+
+from services.member_purge_service import MemberPurgeService
+
+
+class TestMemberPurgeService:
+
+    @pytest.fixture
+    def mock_bot(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def service(self, mock_bot) -> MemberPurgeService:
+        return MemberPurgeService(bot=mock_bot, chat_id=-100, rate=1000, concurrency=4, retry_delay=0)
+
+    def kicked_ids(self, mock_method: AsyncMock) -> list[int]:
+        return sorted(c.kwargs["user_id"] for c in mock_method.call_args_list)
+
+    async def test_bans_and_unbans_everyone(self, service: MemberPurgeService, mock_bot: AsyncMock):
+        result = await service.purge(list(range(1, 21)))
+
+        assert result.kicked == 20
+        assert result.failed == []
+        assert result.requests == 40
+        assert self.kicked_ids(mock_bot.unban_chat_member) == list(range(1, 21))
+
+    async def test_retry_after_is_a_wait_not_a_failure(self, service: MemberPurgeService, mock_bot: AsyncMock):
+        mock_bot.ban_chat_member.side_effect = [
+            TelegramRetryAfter(method=MagicMock(), message="Flood", retry_after=0),
+            None,
+            None,
+        ]
+
+        result = await service.purge([1, 2])
+
+        assert result.kicked == 2
+        assert result.retry_after_waits == 1
+        assert result.retried == 0
+        assert mock_bot.ban_chat_member.call_count == 3
+
+    async def test_failed_unban_is_retried_without_new_ban(
+            self,
+            service: MemberPurgeService,
+            mock_bot: AsyncMock
+    ):
+        mock_bot.unban_chat_member.side_effect = [TelegramNetworkError(method=MagicMock(), message="timeout"), None]
+
+        result = await service.purge([1])
+
+        assert result.kicked == 1
+        assert result.retried == 1
+        assert mock_bot.ban_chat_member.call_count == 1
+        assert mock_bot.unban_chat_member.call_count == 2
+
+    async def test_gives_up_after_max_attempts(self, service: MemberPurgeService, mock_bot: AsyncMock):
+        mock_bot.ban_chat_member.side_effect = TelegramNetworkError(method=MagicMock(), message="timeout")
+
+        result = await service.purge([1])
+
+        assert result.failed == [1]
+        assert result.permanent == []
+        assert mock_bot.ban_chat_member.call_count == service.max_attempts
+
+    async def test_bad_request_is_not_retried(self, service: MemberPurgeService, mock_bot: AsyncMock):
+        mock_bot.ban_chat_member.side_effect = [
+            TelegramBadRequest(method=MagicMock(), message="PARTICIPANT_ID_INVALID"),
+            None,
+        ]
+
+        result = await service.purge([1, 2])
+
+        assert result.kicked == 1
+        assert len(result.failed) == 1
+        assert result.permanent == result.failed
+        assert result.retried == 0
+
+    async def test_reports_processed_in_batches(self, mock_bot: AsyncMock):
+        on_processed = AsyncMock()
+
+        async def ban(chat_id: int, user_id: int) -> None:
+            if user_id == 3:
+                raise TelegramBadRequest(method=MagicMock(), message="admin")
+
+        mock_bot.ban_chat_member.side_effect = ban
+        service = MemberPurgeService(
+            bot=mock_bot,
+            chat_id=-100,
+            rate=1000,
+            concurrency=1,
+            on_processed=on_processed,
+            checkpoint_every=2
+        )
+
+        await service.purge([1, 2, 3, 4, 5])
+
+        batches = [c.args for c in on_processed.call_args_list]
+        assert batches == [([1, 2], [], []), ([4], [3], [3]), ([5], [], [])]
+
+    async def test_checkpoint_error_does_not_stop_purge(self, mock_bot: AsyncMock):
+        service = MemberPurgeService(
+            bot=mock_bot,
+            chat_id=-100,
+            rate=1000,
+            on_processed=AsyncMock(side_effect=ConnectionError("redis down")),
+            checkpoint_every=1
+        )
+
+        result = await service.purge([1, 2, 3])
+
+        assert result.kicked == 3
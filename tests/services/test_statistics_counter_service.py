@@ -0,0 +1,178 @@
+"""Тесты для StatisticsCounterService."""
+from datetime import date, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.attendance_analytics import member_totals
+from services.statistics_counter_service import StatisticsCounterService
+from utils.time import TASHKENT_TZ
+
+
+class TestStatisticsCounterService:
+
+    @pytest.fixture
+    def pipe(self) -> MagicMock:
+        pipe = MagicMock()
+        pipe.execute = AsyncMock()
+        return pipe
+
+    @pytest.fixture
+    def mock_redis(self, pipe) -> MagicMock:
+        redis = MagicMock()
+        redis.hget = AsyncMock()
+        redis.hset = AsyncMock()
+        redis.pipeline.return_value.__aenter__ = AsyncMock(return_value=pipe)
+        redis.pipeline.return_value.__aexit__ = AsyncMock(return_value=False)
+        return redis
+
+    @pytest.fixture
+    def service(self, mock_redis) -> StatisticsCounterService:
+        return StatisticsCounterService(redis=mock_redis)
+
+    async def test_member_joined_increments_week_hash(
+            self,
+            service: StatisticsCounterService,
+            pipe: MagicMock
+    ):
+        await service.record_member_joined(
+            member_id=10,
+            manager_id=1,
+            joined_at=datetime(2025, 1, 15, 12, 0, tzinfo=TASHKENT_TZ)
+        )
+
+        pipe.hincrby.assert_called_once_with("meeting_bot:stats_counters:2025-01-13:1", "members", 1)
+        member_managers_key = "meeting_bot:stats_counters:2025-01-13:member_managers"
+        pipe.hset.assert_called_once_with(member_managers_key, "10", "1")
+        pipe.expire.assert_any_call(member_managers_key, StatisticsCounterService.WEEK_TTL)
+
+    async def test_video_left_adds_member_duration(
+            self,
+            service: StatisticsCounterService,
+            mock_redis: MagicMock,
+            pipe: MagicMock
+    ):
+        joined = datetime(2025, 1, 17, 14, 0, tzinfo=TASHKENT_TZ)
+        left = joined + timedelta(minutes=30)
+        mock_redis.hget.side_effect = [b"1", None]  # менеджер; прошлых сессий нет
+
+        await service.record_video_left(
+            member_id=10,
+            member_joined_at=datetime(2025, 1, 14, 10, 0, tzinfo=TASHKENT_TZ),
+            video_joined_at=joined,
+            at=left
+        )
+
+        assert mock_redis.hget.call_args_list[0].args == (
+            "meeting_bot:stats_counters:2025-01-13:member_managers", "10"
+        )
+        key = "meeting_bot:stats_counters:2025-01-13:1"
+        pipe.hincrbyfloat.assert_called_once_with(key, "duration_seconds", 1800.0)
+        pipe.sadd.assert_called_once_with(f"{key}:timed", "10")
+
+    async def test_live_duration_matches_reconcile_on_overlaps(
+            self,
+            service: StatisticsCounterService,
+            mock_redis: MagicMock,
+            pipe: MagicMock
+    ):
+        start = datetime(2025, 1, 17, 14, 0, tzinfo=TASHKENT_TZ)
+        # Пересечение и переподключение: вместе — 50 + 10 минут, а не 30 + 30 + 10
+        sessions = [
+            (start, start + timedelta(minutes=30)),
+            (start + timedelta(minutes=20), start + timedelta(minutes=50)),
+            (start + timedelta(minutes=60), start + timedelta(minutes=70)),
+        ]
+        spans: dict[str, str] = {}
+        mock_redis.hget.side_effect = lambda key, field: (
+            spans.get(field) if key.endswith(":spans") else b"1"
+        )
+        pipe.hset.side_effect = lambda key, field, value: spans.__setitem__(field, value)
+
+        for joined, left in sessions:
+            await service.record_video_left(
+                member_id=10,
+                member_joined_at=datetime(2025, 1, 14, 10, 0, tzinfo=TASHKENT_TZ),
+                video_joined_at=joined,
+                at=left
+            )
+
+        live = sum(c.args[2] for c in pipe.hincrbyfloat.call_args_list)
+        _, totals = member_totals([
+            {"member_id": 10, "joined_at": joined.isoformat(), "left_at": left.isoformat()}
+            for joined, left in sessions
+        ])
+        assert live == float(totals.sum()) == 3600.0
+
+    async def test_video_skipped_for_member_from_other_week(
+            self,
+            service: StatisticsCounterService,
+            mock_redis: MagicMock,
+            pipe: MagicMock
+    ):
+        await service.record_video_joined(
+            member_id=10,
+            member_joined_at=datetime(2025, 1, 8, 10, 0, tzinfo=TASHKENT_TZ),
+            at=datetime(2025, 1, 17, 14, 0, tzinfo=TASHKENT_TZ)
+        )
+
+        mock_redis.hget.assert_not_called()
+        pipe.sadd.assert_not_called()
+
+    async def test_application_counted_for_manager(
+            self,
+            service: StatisticsCounterService,
+            pipe: MagicMock
+    ):
+        await service.record_application(
+            manager_id=1,
+            status="rejected",
+            created_at=datetime(2025, 1, 15, 12, 0, tzinfo=TASHKENT_TZ)
+        )
+
+        pipe.hincrby.assert_called_once_with("meeting_bot:stats_counters:2025-01-13:1", "rejected", 1)
+
+    async def test_application_without_manager_is_skipped(
+            self,
+            service: StatisticsCounterService,
+            mock_redis: MagicMock
+    ):
+        await service.record_application(
+            manager_id=None,
+            status="rejected",
+            created_at=datetime(2025, 1, 15, 12, 0, tzinfo=TASHKENT_TZ)
+        )
+
+        mock_redis.pipeline.assert_not_called()
+
+    async def test_get_week_counters_none_when_not_reconciled(
+            self,
+            service: StatisticsCounterService,
+            pipe: MagicMock
+    ):
+        pipe.execute.return_value = [0, {}, 0]
+
+        result = await service.get_week_counters(date(2025, 1, 13), [1])
+
+        assert result is None
+
+    async def test_get_week_counters_parses_values(
+            self,
+            service: StatisticsCounterService,
+            pipe: MagicMock
+    ):
+        pipe.execute.return_value = [
+            1,
+            {b"members": b"4", b"completed": b"2", b"duration_seconds": b"600.5"},
+            3,
+            2,
+        ]
+
+        result = await service.get_week_counters(date(2025, 1, 13), [1])
+
+        assert result[1].members == 4
+        assert result[1].video == 3
+        assert result[1].completed == 2
+        assert result[1].rejected == 0
+        assert result[1].duration_seconds == 600.5
+        assert result[1].timed_members == 2
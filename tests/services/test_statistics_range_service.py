@@ -0,0 +1,86 @@
+"""Тесты для StatisticsRangeService."""
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from services.statistics_range_service import StatisticsRangeService
+from services.statistics_service import StatisticsService
+from services.statistics_snapshot_service import dump_weekly_stats
+from utils.time import TASHKENT_TZ
+
+
+@pytest.fixture
+def period() -> tuple[datetime, datetime]:
+    return (
+        datetime(2025, 1, 1, tzinfo=TASHKENT_TZ),
+        datetime(2025, 1, 31, 23, 59, 59, tzinfo=TASHKENT_TZ),
+    )
+
+
+@pytest.fixture
+def range_stats(period):
+    return StatisticsService.build_weekly_stats(*period, [])
+
+
+class TestStatisticsRangeService:
+
+    @pytest.fixture
+    def cache(self) -> dict:
+        return {}
+
+    @pytest.fixture
+    def mock_redis(self, cache) -> AsyncMock:
+        redis = AsyncMock()
+        redis.get.side_effect = lambda key: cache.get(key)
+        redis.set.side_effect = lambda key, value, ex: cache.__setitem__(key, value)
+        return redis
+
+    @pytest.fixture
+    def statistics_service(self, range_stats) -> AsyncMock:
+        service = AsyncMock(spec=StatisticsService)
+
+        async def get_range_stats(start_date, end_date):
+            await asyncio.sleep(0.01)
+            return range_stats
+
+        service.get_range_stats.side_effect = get_range_stats
+        return service
+
+    @pytest.fixture
+    def range_service(self, mock_redis, statistics_service) -> StatisticsRangeService:
+        return StatisticsRangeService(
+            redis=mock_redis,
+            statistics_service=statistics_service,
+            ttl=300
+        )
+
+    async def test_returns_cached_period_without_computing(
+            self,
+            range_service: StatisticsRangeService,
+            statistics_service: AsyncMock,
+            cache: dict,
+            period,
+            range_stats
+    ):
+        cache["meeting_bot:statistics_range:2025-01-01:2025-01-31"] = dump_weekly_stats(range_stats)
+
+        result = await range_service.get_stats(*period)
+
+        assert result == range_stats
+        statistics_service.get_range_stats.assert_not_called()
+
+    async def test_concurrent_requests_compute_once(
+            self,
+            range_service: StatisticsRangeService,
+            statistics_service: AsyncMock,
+            mock_redis: AsyncMock,
+            period,
+            range_stats
+    ):
+        results = await asyncio.gather(*(range_service.get_stats(*period) for _ in range(5)))
+
+        assert results == [range_stats] * 5
+        statistics_service.get_range_stats.assert_called_once()
+        assert mock_redis.set.call_args.kwargs["ex"] == 300
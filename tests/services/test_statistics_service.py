@@ -1,7 +1,13 @@
 """Тесты для StatisticsService."""
-from datetime import datetime
-from unittest.mock import patch
+import asyncio
+from datetime import date, datetime
+from unittest.mock import AsyncMock, patch
 
+import pytest
+from postgrest.exceptions import APIError
+
+from repositories.statistics_repository import StatisticsRepository
+from services.statistics_counter_service import ManagerCounters, StatisticsCounterService
 from services.statistics_service import StatisticsService
 
 
@@ -14,36 +20,47 @@ class TestCalculateAvgDuration:
 
     def test_returns_none_when_no_left_at(self):
         video_data = [
-            {"joined_at": "2025-01-15T10:00:00Z", "left_at": None},
-            {"joined_at": "2025-01-15T11:00:00Z", "left_at": None},
+            {"member_id": 1, "joined_at": "2025-01-15T10:00:00Z", "left_at": None},
+            {"member_id": 2, "joined_at": "2025-01-15T11:00:00Z", "left_at": None},
         ]
         result = StatisticsService._calculate_avg_duration(video_data)
         assert result is None
 
     def test_calculates_correct_average(self):
         video_data = [
-            {"joined_at": "2025-01-15T10:00:00Z", "left_at": "2025-01-15T10:30:00Z"},  # 30 мин
-            {"joined_at": "2025-01-15T11:00:00Z", "left_at": "2025-01-15T11:20:00Z"},  # 20 мин
+            {"member_id": 1, "joined_at": "2025-01-15T10:00:00Z", "left_at": "2025-01-15T10:30:00Z"},  # 30 мин
+            {"member_id": 2, "joined_at": "2025-01-15T11:00:00Z", "left_at": "2025-01-15T11:20:00Z"},  # 20 мин
         ]
         result = StatisticsService._calculate_avg_duration(video_data)
         assert result == 25  # (30 + 20) / 2
 
     def test_ignores_negative_duration(self):
         video_data = [
-            {"joined_at": "2025-01-15T10:30:00Z", "left_at": "2025-01-15T10:00:00Z"},  # -30 мин (игнор)
-            {"joined_at": "2025-01-15T11:00:00Z", "left_at": "2025-01-15T11:20:00Z"},  # 20 мин
+            {"member_id": 1, "joined_at": "2025-01-15T10:30:00Z", "left_at": "2025-01-15T10:00:00Z"},  # -30 мин (игнор)
+            {"member_id": 2, "joined_at": "2025-01-15T11:00:00Z", "left_at": "2025-01-15T11:20:00Z"},  # 20 мин
         ]
         result = StatisticsService._calculate_avg_duration(video_data)
         assert result == 20
 
     def test_ignores_entries_without_left_at(self):
         video_data = [
-            {"joined_at": "2025-01-15T10:00:00Z", "left_at": None},  # игнор
-            {"joined_at": "2025-01-15T11:00:00Z", "left_at": "2025-01-15T11:30:00Z"},  # 30 мин
+            {"member_id": 1, "joined_at": "2025-01-15T10:00:00Z", "left_at": None},  # игнор
+            {"member_id": 2, "joined_at": "2025-01-15T11:00:00Z", "left_at": "2025-01-15T11:30:00Z"},  # 30 мин
         ]
         result = StatisticsService._calculate_avg_duration(video_data)
         assert result == 30
 
+    def test_reconnects_count_as_one_member(self):
+        video_data = [
+            # Участница 1 переподключалась: 10:00-10:10, 10:10-10:30, 10:20-10:40 → 40 мин
+            {"member_id": 1, "joined_at": "2025-01-15T10:00:00Z", "left_at": "2025-01-15T10:10:00Z"},
+            {"member_id": 1, "joined_at": "2025-01-15T10:10:00Z", "left_at": "2025-01-15T10:30:00Z"},
+            {"member_id": 1, "joined_at": "2025-01-15T10:20:00Z", "left_at": "2025-01-15T10:40:00Z"},
+            {"member_id": 2, "joined_at": "2025-01-15T10:00:00Z", "left_at": "2025-01-15T10:20:00Z"},  # 20 мин
+        ]
+        result = StatisticsService._calculate_avg_duration(video_data)
+        assert result == 30  # (40 + 20) / 2
+
 
 class TestGetWeekRange:
     """Тесты для get_current_week_range и get_previous_week_range."""
@@ -81,4 +98,241 @@ class TestGetWeekRange:
         start, end = StatisticsService.get_previous_week_range()
 
         assert start.day == 6  # Прошлый понедельник
-        assert end.day == 12  # Прошлое воскресенье
\ No newline at end of file
+        assert end.day == 12  # Прошлое воскресенье
+
+class TestGetWeeklyStats:
+    """Тесты для get_weekly_stats."""
+
+    @pytest.fixture
+    def mock_repository(self) -> AsyncMock:
+        return AsyncMock(spec=StatisticsRepository)
+
+    @pytest.fixture
+    def service(self, mock_repository) -> StatisticsService:
+        return StatisticsService(repository=mock_repository)
+
+    async def test_builds_stats_from_single_aggregated_query(
+            self,
+            service: StatisticsService,
+            mock_repository: AsyncMock
+    ):
+        mock_repository.get_weekly_aggregates.return_value = [
+            {
+                "manager_id": 1, "manager_name": "Айнура",
+                "members_count": 4, "video_count": 3,
+                "timed_members_count": 2, "total_duration_seconds": 3000.0,
+                "completed_count": 2, "rejected_count": 1,
+            },
+            {
+                "manager_id": 2, "manager_name": "Акмарал",
+                "members_count": 0, "video_count": 0,
+                "timed_members_count": 0, "total_duration_seconds": 0,
+                "completed_count": 0, "rejected_count": 0,
+            },
+        ]
+
+        result = await service.get_weekly_stats(
+            datetime(2025, 1, 13), datetime(2025, 1, 19, 23, 59, 59)
+        )
+
+        mock_repository.get_weekly_aggregates.assert_called_once()
+        mock_repository.get_active_managers.assert_not_called()
+
+        first, second = result.managers
+        assert first.video_percent == 75
+        assert first.avg_duration_minutes == 25  # 3000 сек / 60 / 2 участницы
+        assert second.video_percent is None
+        assert second.avg_duration_minutes is None
+
+        assert result.total_members == 4
+        assert result.total_video == 3
+        assert result.total_video_percent == 75
+        assert result.total_completed == 2
+        assert result.total_rejected == 1
+
+    async def test_falls_back_to_per_manager_queries_when_function_missing(
+            self,
+            service: StatisticsService,
+            mock_repository: AsyncMock
+    ):
+        mock_repository.get_weekly_aggregates.side_effect = APIError(
+            {"code": "PGRST202", "message": "Could not find the function"}
+        )
+        mock_repository.get_active_managers.return_value = [{"id": 1, "name": "Айнура"}]
+        mock_repository.get_members_by_manager.return_value = [{"id": 10}, {"id": 11}]
+        mock_repository.get_video_attendance_by_members.return_value = [
+            {"member_id": 10, "joined_at": "2025-01-17T09:00:00Z", "left_at": "2025-01-17T09:30:00Z"},
+        ]
+        mock_repository.get_applications_count_by_status.return_value = 1
+
+        result = await service.get_weekly_stats(
+            datetime(2025, 1, 13), datetime(2025, 1, 19, 23, 59, 59)
+        )
+
+        assert result.total_members == 2
+        assert result.total_video == 1
+        assert result.managers[0].avg_duration_minutes == 30
+
+    async def test_reraises_other_api_errors(
+            self,
+            service: StatisticsService,
+            mock_repository: AsyncMock
+    ):
+        mock_repository.get_weekly_aggregates.side_effect = APIError(
+            {"code": "42501", "message": "permission denied"}
+        )
+
+        with pytest.raises(APIError):
+            await service.get_weekly_stats(
+                datetime(2025, 1, 13), datetime(2025, 1, 19, 23, 59, 59)
+            )
+
+
+class TestGetRangeStats:
+    """Тесты для get_range_stats."""
+
+    @pytest.fixture
+    def mock_repository(self) -> AsyncMock:
+        return AsyncMock(spec=StatisticsRepository)
+
+    async def test_sums_daily_rollups_for_any_period(self, mock_repository: AsyncMock):
+        mock_repository.get_rollup_aggregates.return_value = [
+            {
+                "manager_id": 1, "manager_name": "Айнура",
+                "members_count": 40, "video_count": 10,
+                "timed_members_count": 8, "total_duration_seconds": 14400.0,
+                "completed_count": 6, "rejected_count": 2,
+            },
+        ]
+        service = StatisticsService(repository=mock_repository)
+
+        result = await service.get_range_stats(
+            datetime(2025, 1, 1), datetime(2025, 3, 31, 23, 59, 59)
+        )
+
+        mock_repository.get_rollup_aggregates.assert_called_once_with(
+            date(2025, 1, 1), date(2025, 3, 31)
+        )
+        mock_repository.get_weekly_aggregates.assert_not_called()
+        assert result.total_members == 40
+        assert result.total_video_percent == 25
+        assert result.managers[0].avg_duration_minutes == 30
+
+
+class TestPerManagerConcurrency:
+    """Тесты для параллельного сбора статистики по менеджерам."""
+
+    async def test_respects_max_concurrency(self):
+        in_flight = 0
+        max_in_flight = 0
+
+        def slow(result):
+            async def request(*args):
+                nonlocal in_flight, max_in_flight
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                return result
+            return request
+
+        repository = AsyncMock(spec=StatisticsRepository)
+        repository.get_active_managers.side_effect = slow(
+            [{"id": i, "name": f"M{i}"} for i in range(6)]
+        )
+        repository.get_members_by_manager.side_effect = slow([{"id": 1}])
+        repository.get_video_attendance_by_members.side_effect = slow([])
+        repository.get_applications_count_by_status.side_effect = slow(1)
+
+        service = StatisticsService(repository=repository, max_concurrency=3)
+        result = await service._get_weekly_stats_per_manager(
+            datetime(2025, 1, 13), datetime(2025, 1, 19, 23, 59, 59)
+        )
+
+        assert len(result.managers) == 6
+        assert result.total_completed == 6
+        assert max_in_flight == 3
+
+
+class TestWeeklyStatsFromCounters:
+    """Тесты для статистики из счётчиков Redis."""
+
+    @pytest.fixture
+    def mock_repository(self) -> AsyncMock:
+        repository = AsyncMock(spec=StatisticsRepository)
+        repository.get_active_managers.return_value = [{"id": 1, "name": "Айнура"}]
+        return repository
+
+    @pytest.fixture
+    def mock_counter_service(self) -> AsyncMock:
+        return AsyncMock(spec=StatisticsCounterService)
+
+    @pytest.fixture
+    def service(self, mock_repository, mock_counter_service) -> StatisticsService:
+        return StatisticsService(
+            repository=mock_repository,
+            counter_service=mock_counter_service
+        )
+
+    async def test_reads_counters_instead_of_tables(
+            self,
+            service: StatisticsService,
+            mock_repository: AsyncMock,
+            mock_counter_service: AsyncMock
+    ):
+        mock_counter_service.get_week_counters.return_value = {
+            1: ManagerCounters(
+                members=10, video=5, duration_seconds=4500, timed_members=3,
+                completed=2, rejected=1
+            ),
+        }
+        start, end = StatisticsService.get_current_week_range()
+
+        result = await service.get_weekly_stats(start, end)
+
+        mock_repository.get_weekly_aggregates.assert_not_called()
+        manager = result.managers[0]
+        assert manager.members_count == 10
+        assert manager.video_percent == 50
+        assert manager.avg_duration_minutes == 25
+        assert result.total_completed == 2
+
+    async def test_uses_database_when_week_not_reconciled(
+            self,
+            service: StatisticsService,
+            mock_repository: AsyncMock,
+            mock_counter_service: AsyncMock
+    ):
+        mock_counter_service.get_week_counters.return_value = None
+        mock_repository.get_weekly_aggregates.return_value = []
+        start, end = StatisticsService.get_current_week_range()
+
+        await service.get_weekly_stats(start, end)
+
+        mock_repository.get_weekly_aggregates.assert_called_once()
+
+    async def test_previous_week_is_read_from_database(
+            self,
+            service: StatisticsService,
+            mock_repository: AsyncMock,
+            mock_counter_service: AsyncMock
+    ):
+        mock_repository.get_weekly_aggregates.return_value = []
+        start, end = StatisticsService.get_previous_week_range()
+
+        await service.get_weekly_stats(start, end)
+
+        mock_counter_service.get_week_counters.assert_not_called()
+        mock_repository.get_weekly_aggregates.assert_called_once_with(start, end)
+
+    async def test_ignores_counters_for_custom_ranges(
+            self,
+            service: StatisticsService,
+            mock_repository: AsyncMock,
+            mock_counter_service: AsyncMock
+    ):
+        mock_repository.get_weekly_aggregates.return_value = []
+
+        await service.get_weekly_stats(datetime(2025, 1, 1), datetime(2025, 1, 31))
+
+        mock_counter_service.get_week_counters.assert_not_called()
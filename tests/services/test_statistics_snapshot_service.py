@@ -0,0 +1,93 @@
+"""Тесты для StatisticsSnapshotService."""
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from services.statistics_service import ManagerStats, StatisticsService
+from services.statistics_snapshot_service import (
+    StatisticsSnapshotService,
+    dump_weekly_stats,
+    load_weekly_stats,
+)
+from utils.time import TASHKENT_TZ
+
+
+@pytest.fixture
+def weekly_stats():
+    return StatisticsService.build_weekly_stats(
+        start_date=datetime(2025, 1, 6, tzinfo=TASHKENT_TZ),
+        end_date=datetime(2025, 1, 12, 23, 59, 59, tzinfo=TASHKENT_TZ),
+        managers_stats=[
+            ManagerStats(
+                manager_id=1,
+                manager_name="Айнура",
+                members_count=12,
+                video_count=8,
+                video_percent=67,
+                avg_duration_minutes=24,
+                completed_count=5,
+                rejected_count=2,
+            ),
+        ],
+    )
+
+
+class TestSerialization:
+
+    def test_round_trip(self, weekly_stats):
+        restored = load_weekly_stats(dump_weekly_stats(weekly_stats))
+
+        assert restored == weekly_stats
+
+    def test_totals_are_not_stored(self, weekly_stats):
+        raw = dump_weekly_stats(weekly_stats)
+
+        assert "total" not in raw
+        assert "Айнура" in raw
+
+
+class TestStatisticsSnapshotService:
+
+    @pytest.fixture
+    def mock_redis(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def snapshot_service(self, mock_redis) -> StatisticsSnapshotService:
+        return StatisticsSnapshotService(redis=mock_redis)
+
+    async def test_get_or_create_returns_snapshot_without_computing(
+            self,
+            snapshot_service: StatisticsSnapshotService,
+            mock_redis: AsyncMock,
+            weekly_stats
+    ):
+        mock_redis.get.return_value = dump_weekly_stats(weekly_stats).encode()
+        service = AsyncMock(spec=StatisticsService)
+
+        result = await snapshot_service.get_or_create(
+            service, weekly_stats.start_date, weekly_stats.end_date
+        )
+
+        assert result == weekly_stats
+        service.get_weekly_stats.assert_not_called()
+        mock_redis.get.assert_called_once_with("meeting_bot:statistics_snapshot:2025-01-06")
+
+    async def test_get_or_create_computes_and_saves_once(
+            self,
+            snapshot_service: StatisticsSnapshotService,
+            mock_redis: AsyncMock,
+            weekly_stats
+    ):
+        mock_redis.get.return_value = None
+        service = AsyncMock(spec=StatisticsService)
+        service.get_weekly_stats.return_value = weekly_stats
+
+        result = await snapshot_service.get_or_create(
+            service, weekly_stats.start_date, weekly_stats.end_date
+        )
+
+        assert result == weekly_stats
+        service.get_weekly_stats.assert_called_once()
+        assert mock_redis.set.call_args.kwargs["nx"] is True
@@ -0,0 +1,156 @@
+"""Тесты для VideoChatDashboard."""
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiogram.exceptions import TelegramBadRequest
+
+from models.member import Member
+from repositories.invite_link_repository import InviteLinkRepository
+from repositories.statistics_repository import StatisticsRepository
+from services.video_chat_dashboard import VideoChatDashboard
+
+CALL_ID = 555
+
+
+def make_member(member_id: int, invite_link_id: int) -> Member:
+    return Member(
+        id=member_id,
+        telegram_id=member_id * 100,
+        first_name="Айгуль",
+        last_name=None,
+        username=None,
+        invite_link_id=invite_link_id,
+        joined_at=datetime(2025, 1, 15, 12, 0),
+    )
+
+
+class TestVideoChatDashboard:
+
+    @pytest.fixture
+    def mock_bot(self) -> AsyncMock:
+        bot = AsyncMock()
+        bot.send_message.return_value = MagicMock(message_id=42)
+        return bot
+
+    @pytest.fixture
+    def mock_redis(self) -> AsyncMock:
+        redis = AsyncMock()
+        redis.hgetall.return_value = {}
+        return redis
+
+    @pytest.fixture
+    def mock_links(self) -> AsyncMock:
+        links = AsyncMock(spec=InviteLinkRepository)
+        # Ссылки 1 и 2 — Айнуры, 3 — Дилноза, 4 — удалена
+        links.get_manager_ids.side_effect = lambda ids: {
+            link_id: manager_id for link_id, manager_id in {1: 10, 2: 10, 3: 20}.items() if link_id in ids
+        }
+        return links
+
+    @pytest.fixture
+    def mock_statistics_repository(self) -> AsyncMock:
+        repository = AsyncMock(spec=StatisticsRepository)
+        repository.get_active_managers.return_value = [
+            {"id": 10, "name": "Айнура"},
+            {"id": 20, "name": "Дилноза"},
+        ]
+        return repository
+
+    @pytest.fixture
+    def dashboard(self, mock_bot, mock_redis, mock_links, mock_statistics_repository) -> VideoChatDashboard:
+        return VideoChatDashboard(
+            bot=mock_bot,
+            redis=mock_redis,
+            invite_link_repository=mock_links,
+            statistics_repository=mock_statistics_repository,
+            chat_id=-100,
+            thread_id=7,
+            min_edit_interval=0,
+        )
+
+    async def test_counts_incrementally_by_manager(
+            self,
+            dashboard: VideoChatDashboard,
+            mock_bot: AsyncMock,
+            mock_links: AsyncMock
+    ):
+        await dashboard.start_call(CALL_ID, [])
+        for member_id, link_id in ((1, 1), (2, 2), (3, 3), (4, 4)):
+            dashboard.joined(make_member(member_id, link_id))
+        dashboard.joined(make_member(1, 1))  # повторный join не считается
+        dashboard.left(3)
+
+        assert await dashboard.refresh() is True
+
+        # Все новые ссылки — одним запросом
+        mock_links.get_manager_ids.assert_called_once_with([1, 2, 4])
+        assert dashboard._manager_rows() == [("Айнура", 2), ("Без менеджера", 1)]
+        assert (dashboard.present, dashboard.peak) == (3, 4)
+        assert mock_bot.send_message.call_args.kwargs["message_thread_id"] == 7
+
+        # Уже известная ссылка — без запроса
+        dashboard.left(1)
+        dashboard.joined(make_member(1, 1))
+        dashboard.left(2)
+        await dashboard.refresh()
+
+        mock_links.get_manager_ids.assert_called_once()
+        assert dashboard._manager_rows() == [("Айнура", 1), ("Без менеджера", 1)]
+        mock_bot.edit_message_text.assert_called_once()
+        assert mock_bot.edit_message_text.call_args.kwargs["message_id"] == 42
+
+    async def test_skips_edit_when_data_unchanged(self, dashboard: VideoChatDashboard, mock_bot: AsyncMock):
+        await dashboard.start_call(CALL_ID, [make_member(1, 1)])
+        await dashboard.refresh()
+        dashboard.left(1)
+        dashboard.joined(make_member(1, 1))
+
+        assert await dashboard.refresh() is False
+        mock_bot.edit_message_text.assert_not_called()
+
+    async def test_continues_message_after_restart(
+            self,
+            dashboard: VideoChatDashboard,
+            mock_redis: AsyncMock,
+            mock_bot: AsyncMock
+    ):
+        mock_redis.hgetall.return_value = {b"call_id": b"555", b"message_id": b"41", b"peak": b"120"}
+
+        await dashboard.start_call(CALL_ID, [make_member(1, 1)])
+        await dashboard.refresh()
+
+        assert dashboard.peak == 120
+        mock_bot.send_message.assert_not_called()
+        assert mock_bot.edit_message_text.call_args.kwargs["message_id"] == 41
+
+    async def test_creates_new_message_when_edit_fails(self, dashboard: VideoChatDashboard, mock_bot: AsyncMock):
+        await dashboard.start_call(CALL_ID, [make_member(1, 1)])
+        await dashboard.refresh()
+        mock_bot.edit_message_text.side_effect = TelegramBadRequest(
+            method=MagicMock(), message="message to edit not found"
+        )
+        dashboard.end()
+
+        await dashboard.refresh()
+
+        assert mock_bot.send_message.call_count == 2
+        assert dashboard.present == 0
+        assert "завершена" in mock_bot.send_message.call_args.kwargs["text"]
+
+    async def test_coalesces_edits(self, dashboard: VideoChatDashboard, mock_bot: AsyncMock):
+        dashboard.min_edit_interval = 0.05
+        await dashboard.start_call(CALL_ID, [])
+        dashboard.start()
+
+        for member_id in range(1, 21):
+            dashboard.joined(make_member(member_id, 1))
+            await asyncio.sleep(0)
+        await asyncio.sleep(0.1)
+        await dashboard.stop()
+
+        # 20 событий — одна отправка и одна правка
+        assert mock_bot.send_message.call_count == 1
+        assert mock_bot.edit_message_text.call_count == 1
+        assert dashboard.present == 20
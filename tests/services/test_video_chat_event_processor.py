@@ -0,0 +1,140 @@
+"""Тесты для VideoChatEventProcessor."""
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from models.member import Member
+from services.live_sessions import ClosedSession, LiveSessionStore
+from services.meeting_timeline_service import MeetingTimelineService
+from services.member_lookup_service import MemberLookupService
+from services.statistics_counter_service import StatisticsCounterService
+from services.video_chat_event_processor import VideoChatEventProcessor
+from services.video_chat_event_queue import (
+    CALL,
+    ENDED,
+    PARTICIPANTS,
+    SNAPSHOT,
+    VideoChatEvent,
+)
+from services.video_chat_reconciler import VideoChatReconciler
+
+CALL_ID = 555
+AT = datetime(2025, 1, 17, 14, 0)
+
+
+def make_member(member_id: int) -> Member:
+    return Member(
+        id=member_id,
+        telegram_id=member_id * 100,
+        first_name="Айгуль",
+        last_name=None,
+        username=None,
+        invite_link_id=1,
+        joined_at=datetime(2025, 1, 15, 12, 0),
+    )
+
+
+class TestVideoChatEventProcessor:
+
+    @pytest.fixture
+    def mock_lookup(self) -> AsyncMock:
+        members = {100: make_member(1), 200: make_member(2)}
+        lookup = AsyncMock(spec=MemberLookupService)
+        lookup.get.side_effect = lambda telegram_id: members.get(telegram_id)
+        return lookup
+
+    @pytest.fixture
+    def mock_live_sessions(self) -> AsyncMock:
+        return AsyncMock(spec=LiveSessionStore)
+
+    @pytest.fixture
+    def mock_counters(self) -> AsyncMock:
+        return AsyncMock(spec=StatisticsCounterService)
+
+    @pytest.fixture
+    def mock_reconciler(self) -> MagicMock:
+        reconciler = MagicMock(spec=VideoChatReconciler)
+        reconciler.start_call = AsyncMock()
+        reconciler.reconcile = AsyncMock()
+        reconciler.close_all = AsyncMock()
+        return reconciler
+
+    @pytest.fixture
+    def processor(self, mock_lookup, mock_live_sessions, mock_counters, mock_reconciler) -> VideoChatEventProcessor:
+        return VideoChatEventProcessor(
+            member_lookup_service=mock_lookup,
+            live_sessions=mock_live_sessions,
+            statistics_counter_service=mock_counters,
+            reconciler=mock_reconciler,
+        )
+
+    async def test_participants_open_and_close_sessions(
+            self,
+            processor: VideoChatEventProcessor,
+            mock_live_sessions: AsyncMock,
+            mock_counters: AsyncMock,
+            mock_reconciler: MagicMock
+    ):
+        video_joined_at = AT - timedelta(minutes=20)
+        mock_live_sessions.close.return_value = ClosedSession(2, video_joined_at, AT)
+
+        # 999 — не наша участница
+        await processor.process(VideoChatEvent(
+            kind=PARTICIPANTS, call_id=CALL_ID, at=AT, joined=[100, 999], left=[200]
+        ))
+
+        mock_reconciler.start_call.assert_called_once_with(CALL_ID)
+        mock_live_sessions.open.assert_called_once_with(member_id=1, joined_at=AT)
+        mock_live_sessions.close.assert_called_once_with(member_id=2, left_at=AT)
+        mock_reconciler.mark_joined.assert_called_once_with(make_member(1), AT)
+        mock_reconciler.mark_left.assert_called_once_with(2, AT)
+        assert mock_counters.record_video_joined.call_args.kwargs["at"] == AT
+        assert mock_counters.record_video_left.call_args.kwargs["member_id"] == 2
+        assert mock_counters.record_video_left.call_args.kwargs["video_joined_at"] == video_joined_at
+
+    async def test_leave_without_open_session_is_not_counted(
+            self,
+            processor: VideoChatEventProcessor,
+            mock_live_sessions: AsyncMock,
+            mock_counters: AsyncMock
+    ):
+        mock_live_sessions.close.return_value = None
+
+        await processor.process(VideoChatEvent(kind=PARTICIPANTS, call_id=CALL_ID, at=AT, left=[200]))
+
+        mock_counters.record_video_left.assert_not_called()
+
+    async def test_routes_call_events(
+            self,
+            processor: VideoChatEventProcessor,
+            mock_lookup: AsyncMock,
+            mock_reconciler: MagicMock
+    ):
+        await processor.process(VideoChatEvent(kind=CALL, call_id=CALL_ID, at=AT))
+        await processor.process(VideoChatEvent(kind=SNAPSHOT, call_id=CALL_ID, at=AT, present=[100]))
+        await processor.process(VideoChatEvent(kind=ENDED, call_id=CALL_ID, at=AT))
+
+        mock_lookup.warm_up_for_call.assert_called_once_with(CALL_ID)
+        mock_reconciler.reconcile.assert_called_once_with(CALL_ID, [100], AT)
+        mock_reconciler.close_all.assert_called_once_with(CALL_ID, AT)
+
+    async def test_call_lifecycle_marks_meeting_timeline(
+            self,
+            processor: VideoChatEventProcessor
+    ):
+        timeline_service = AsyncMock(spec=MeetingTimelineService)
+        processor.meeting_timeline_service = timeline_service
+
+        scheduled_at = AT - timedelta(days=1)  # CALL — в четверг, встреча — в пятницу
+
+        await processor.process(VideoChatEvent(kind=CALL, call_id=CALL_ID, at=scheduled_at))
+        timeline_service.mark_started.assert_not_called()
+
+        joined = VideoChatEvent(kind=PARTICIPANTS, call_id=CALL_ID, at=AT, joined=[100])
+        await processor.process(joined)
+        await processor.process(joined)
+        await processor.process(VideoChatEvent(kind=ENDED, call_id=CALL_ID, at=AT))
+
+        timeline_service.mark_started.assert_called_once_with(AT.date())
+        timeline_service.mark_ended.assert_called_once_with(AT.date())
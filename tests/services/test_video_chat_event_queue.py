@@ -0,0 +1,167 @@
+"""Тесты для VideoChatEventQueue."""
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.video_chat_event_queue import (
+    ENDED,
+    PARTICIPANTS,
+    VideoChatEvent,
+    VideoChatEventQueue,
+)
+from utils.time import TASHKENT_TZ
+
+AT = datetime(2025, 1, 17, 14, 0, tzinfo=TASHKENT_TZ)
+
+
+def make_entry(entry_id: str, event: VideoChatEvent) -> tuple[bytes, dict]:
+    return entry_id.encode(), {
+        key.encode(): str(value).encode() for key, value in event.to_fields().items()
+    }
+
+
+def stream_response(*entries) -> list:
+    return [[VideoChatEventQueue.STREAM_KEY.encode(), list(entries)]]
+
+
+class TestVideoChatEvent:
+
+    def test_fields_round_trip(self):
+        event = VideoChatEvent(kind=PARTICIPANTS, call_id=555, at=AT, joined=[100, 200], left=[300])
+
+        fields = event.to_fields()
+
+        assert fields["j"] == "100,200"
+        assert "ids" not in fields  # пустые списки не пишем
+        assert VideoChatEvent.from_fields({k: str(v) for k, v in fields.items()}) == event
+
+
+class TestVideoChatEventQueue:
+
+    @pytest.fixture
+    def pipe(self) -> MagicMock:
+        pipe = MagicMock()
+        pipe.execute = AsyncMock()
+        return pipe
+
+    @pytest.fixture
+    def mock_redis(self, pipe) -> MagicMock:
+        redis = MagicMock()
+        redis.xadd = AsyncMock()
+        redis.xgroup_create = AsyncMock()
+        redis.xreadgroup = AsyncMock()
+        redis.pipeline.return_value.__aenter__ = AsyncMock(return_value=pipe)
+        redis.pipeline.return_value.__aexit__ = AsyncMock(return_value=False)
+        return redis
+
+    @pytest.fixture
+    def queue(self, mock_redis) -> VideoChatEventQueue:
+        return VideoChatEventQueue(redis=mock_redis)
+
+    async def test_publish(self, queue: VideoChatEventQueue, mock_redis: MagicMock):
+        await queue.publish(VideoChatEvent(kind=ENDED, call_id=555, at=AT))
+
+        mock_redis.xadd.assert_called_once_with(
+            VideoChatEventQueue.STREAM_KEY,
+            {"k": ENDED, "c": 555, "at": AT.isoformat()},
+            maxlen=VideoChatEventQueue.MAX_LEN,
+            approximate=True
+        )
+
+    async def test_consume_replays_pending_before_new(
+            self,
+            queue: VideoChatEventQueue,
+            mock_redis: MagicMock,
+            pipe: MagicMock
+    ):
+        pending = VideoChatEvent(kind=PARTICIPANTS, call_id=555, at=AT, joined=[100])
+        new = VideoChatEvent(kind=PARTICIPANTS, call_id=555, at=AT, left=[100])
+        mock_redis.xreadgroup.side_effect = [
+            stream_response(make_entry("1-0", pending)),  # не подтверждено до рестарта
+            stream_response(),
+            stream_response(make_entry("2-0", new)),
+            asyncio.CancelledError,
+        ]
+        handler = AsyncMock()
+
+        with pytest.raises(asyncio.CancelledError):
+            await queue.consume(handler)
+
+        read_ids = [c.args[2][VideoChatEventQueue.STREAM_KEY] for c in mock_redis.xreadgroup.call_args_list]
+        assert read_ids == ["0", "1-0", ">", ">"]
+        assert [c.args[0] for c in handler.call_args_list] == [pending, new]
+        acked = [c.args[2:] for c in pipe.xack.call_args_list]
+        assert acked == [("1-0",), ("2-0",)]
+
+    async def test_failed_event_is_retried_before_next(
+            self,
+            queue: VideoChatEventQueue,
+            mock_redis: MagicMock,
+            monkeypatch
+    ):
+        monkeypatch.setattr(VideoChatEventQueue, "RETRY_DELAY", 0)
+        first = VideoChatEvent(kind=PARTICIPANTS, call_id=555, at=AT, joined=[100])
+        second = VideoChatEvent(kind=PARTICIPANTS, call_id=555, at=AT, left=[100])
+        mock_redis.xreadgroup.side_effect = [
+            stream_response(),
+            stream_response(make_entry("1-0", first), make_entry("2-0", second)),
+            asyncio.CancelledError,
+        ]
+        handler = AsyncMock(side_effect=[Exception("Supabase is down"), None, None])
+
+        with pytest.raises(asyncio.CancelledError):
+            await queue.consume(handler)
+
+        assert [c.args[0] for c in handler.call_args_list] == [first, first, second]
+
+    async def test_poison_event_is_dead_lettered_and_skipped(
+            self,
+            queue: VideoChatEventQueue,
+            mock_redis: MagicMock,
+            pipe: MagicMock,
+            monkeypatch
+    ):
+        monkeypatch.setattr(VideoChatEventQueue, "RETRY_DELAY", 0)
+        poison = VideoChatEvent(kind=PARTICIPANTS, call_id=555, at=AT, joined=[100])
+        next_event = VideoChatEvent(kind=PARTICIPANTS, call_id=555, at=AT, joined=[200])
+        mock_redis.xreadgroup.side_effect = [
+            stream_response(),
+            stream_response(make_entry("1-0", poison), make_entry("2-0", next_event)),
+            asyncio.CancelledError,
+        ]
+
+        async def handler(event: VideoChatEvent) -> None:
+            if event == poison:
+                raise ValueError("bad member row")
+
+        handler = AsyncMock(side_effect=handler)
+
+        with pytest.raises(asyncio.CancelledError):
+            await queue.consume(handler)
+
+        handled = [c.args[0] for c in handler.call_args_list]
+        assert handled == [poison] * VideoChatEventQueue.MAX_ATTEMPTS + [next_event]
+        dead_key, dead_fields = mock_redis.xadd.call_args.args
+        assert dead_key == VideoChatEventQueue.DEAD_LETTER_KEY
+        assert dead_fields["id"] == "1-0"
+        pipe.xack.assert_called_once_with(VideoChatEventQueue.STREAM_KEY, VideoChatEventQueue.GROUP, "1-0", "2-0")
+
+    async def test_malformed_entry_is_skipped(
+            self,
+            queue: VideoChatEventQueue,
+            mock_redis: MagicMock,
+            pipe: MagicMock
+    ):
+        good = VideoChatEvent(kind=ENDED, call_id=555, at=AT)
+        mock_redis.xreadgroup.return_value = stream_response(
+            (b"1-0", {b"k": b"p", b"c": b"not-a-number", b"at": AT.isoformat().encode()}),
+            make_entry("2-0", good),
+        )
+
+        events = await queue.read()
+
+        assert events == [("2-0", good)]
+        assert mock_redis.xadd.call_args.args[0] == VideoChatEventQueue.DEAD_LETTER_KEY
+        pipe.xack.assert_called_once_with(VideoChatEventQueue.STREAM_KEY, VideoChatEventQueue.GROUP, "1-0")
@@ -0,0 +1,105 @@
+"""Тесты для VideoChatMonitor."""
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pyrogram.raw.types import GroupCallParticipant, PeerUser
+from pyrogram.raw.types.phone import GroupParticipants
+
+from services.active_video_chat import ActiveVideoChat, ActiveVideoChatTracker
+from services.video_chat_event_queue import CALL, ENDED, SNAPSHOT, VideoChatEventQueue
+from services.video_chat_monitor import VideoChatMonitor
+from utils.time import get_tashkent_now
+
+CALL_ID = 555
+
+
+def make_page(telegram_ids: list[int], next_offset: str = "") -> GroupParticipants:
+    return GroupParticipants(
+        count=len(telegram_ids),
+        participants=[
+            GroupCallParticipant(peer=PeerUser(user_id=telegram_id), date=0, source=0)
+            for telegram_id in telegram_ids
+        ],
+        next_offset=next_offset,
+        chats=[],
+        users=[],
+        version=1,
+    )
+
+
+class TestVideoChatMonitor:
+
+    @pytest.fixture
+    def mock_client(self) -> MagicMock:
+        client = MagicMock()
+        client.invoke = AsyncMock()
+        return client
+
+    @pytest.fixture
+    def tracker(self) -> ActiveVideoChatTracker:
+        tracker = ActiveVideoChatTracker(redis=AsyncMock())
+        tracker.set(ActiveVideoChat(
+            call_id=CALL_ID,
+            access_hash=1,
+            scheduled_for=get_tashkent_now() - timedelta(minutes=10),
+        ))
+        return tracker
+
+    @pytest.fixture
+    def mock_queue(self) -> AsyncMock:
+        return AsyncMock(spec=VideoChatEventQueue)
+
+    @pytest.fixture
+    def monitor(self, mock_client, tracker, mock_queue) -> VideoChatMonitor:
+        return VideoChatMonitor(client=mock_client, active_video_chat=tracker, event_queue=mock_queue)
+
+    def published(self, mock_queue: AsyncMock) -> list:
+        return [c.args[0] for c in mock_queue.publish.call_args_list]
+
+    async def test_snapshot_pages_through_participants(
+            self,
+            monitor: VideoChatMonitor,
+            mock_client: MagicMock,
+            mock_queue: AsyncMock
+    ):
+        mock_client.invoke.side_effect = [
+            make_page([300, 100], next_offset="next"),
+            make_page([200]),
+        ]
+
+        assert await monitor.snapshot() is True
+
+        assert mock_client.invoke.call_count == 2
+        assert mock_client.invoke.call_args.args[0].offset == "next"
+        [event] = self.published(mock_queue)
+        assert event.kind == SNAPSHOT
+        assert event.present == [100, 200, 300]
+
+    async def test_snapshot_waits_for_scheduled_call(
+            self,
+            monitor: VideoChatMonitor,
+            tracker: ActiveVideoChatTracker,
+            mock_client: MagicMock,
+            mock_queue: AsyncMock
+    ):
+        tracker.set(ActiveVideoChat(
+            call_id=CALL_ID,
+            access_hash=1,
+            scheduled_for=get_tashkent_now() + timedelta(hours=1),
+        ))
+
+        assert await monitor.snapshot() is False
+        mock_client.invoke.assert_not_called()
+        mock_queue.publish.assert_not_called()
+
+    async def test_announces_call_and_end_once(self, monitor: VideoChatMonitor, mock_queue: AsyncMock):
+        await monitor.announce_call(CALL_ID)
+        await monitor.announce_call(CALL_ID)
+        await monitor.announce_end(777)  # не наш звонок
+        await monitor.announce_end(CALL_ID)
+        await monitor.announce_end(CALL_ID)
+
+        assert [event.kind for event in self.published(mock_queue)] == [CALL, ENDED]
+        # Звонок завершён — снимки больше не нужны
+        assert await monitor.snapshot() is False
@@ -0,0 +1,181 @@
+"""Тесты для VideoChatReconciler."""
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from models.member import Member
+from repositories.member_repository import MemberRepository
+from services.live_sessions import ClosedSession, LiveSessionStore
+from services.member_lookup_service import MemberLookupService
+from services.statistics_counter_service import StatisticsCounterService
+from services.video_chat_dashboard import VideoChatDashboard
+from services.video_chat_reconciler import VideoChatReconciler
+
+CALL_ID = 555
+TAKEN_AT = datetime(2025, 1, 17, 14, 30)
+
+
+def make_member(member_id: int) -> Member:
+    return Member(
+        id=member_id,
+        telegram_id=member_id * 100,
+        first_name="Айгуль",
+        last_name=None,
+        username=None,
+        invite_link_id=1,
+        joined_at=datetime(2025, 1, 15, 12, 0),
+    )
+
+
+def called_member_ids(mock_method: AsyncMock) -> list[int]:
+    return sorted(c.args[0] for c in mock_method.call_args_list)
+
+
+class TestVideoChatReconciler:
+
+    @pytest.fixture
+    def members(self) -> dict[int, Member]:
+        return {member_id * 100: make_member(member_id) for member_id in (1, 2, 3)}
+
+    @pytest.fixture
+    def mock_lookup(self, members) -> AsyncMock:
+        lookup = AsyncMock(spec=MemberLookupService)
+        lookup.get.side_effect = lambda telegram_id: members.get(telegram_id)
+        return lookup
+
+    @pytest.fixture
+    def mock_live_sessions(self) -> AsyncMock:
+        live_sessions = AsyncMock(spec=LiveSessionStore)
+        live_sessions.get_member_ids.return_value = set()
+        return live_sessions
+
+    @pytest.fixture
+    def mock_counters(self) -> AsyncMock:
+        return AsyncMock(spec=StatisticsCounterService)
+
+    @pytest.fixture
+    def mock_member_repository(self) -> AsyncMock:
+        repository = AsyncMock(spec=MemberRepository)
+        repository.get_by_ids.return_value = []
+        return repository
+
+    @pytest.fixture
+    def reconciler(
+            self,
+            mock_member_repository,
+            mock_lookup,
+            mock_live_sessions,
+            mock_counters
+    ) -> VideoChatReconciler:
+        return VideoChatReconciler(
+            member_repository=mock_member_repository,
+            member_lookup_service=mock_lookup,
+            live_sessions=mock_live_sessions,
+            statistics_counter_service=mock_counters,
+        )
+
+    async def test_synthesizes_missing_join_and_leave(
+            self,
+            reconciler: VideoChatReconciler,
+            mock_live_sessions: AsyncMock,
+            mock_counters: AsyncMock
+    ):
+        await reconciler.start_call(CALL_ID)
+        reconciler.mark_joined(make_member(1), TAKEN_AT - timedelta(minutes=5))
+
+        # В звонке 2 (join не дошёл) и чужой 999, а 1 ушла («left» не дошёл)
+        assert await reconciler.reconcile(CALL_ID, [200, 999], TAKEN_AT) is True
+
+        assert called_member_ids(mock_live_sessions.open) == [2]
+        assert called_member_ids(mock_live_sessions.close) == [1]
+        assert mock_live_sessions.close.call_args.args[1] == TAKEN_AT
+        assert set(reconciler.open_sessions) == {2}
+        mock_counters.record_video_left.assert_called_once()
+
+    async def test_skips_members_with_newer_events(
+            self,
+            reconciler: VideoChatReconciler,
+            mock_live_sessions: AsyncMock
+    ):
+        await reconciler.start_call(CALL_ID)
+        # Снимок сняли до того, как событие входа участницы 1 обработано
+        reconciler.mark_joined(make_member(1), TAKEN_AT + timedelta(seconds=1))
+        # ...а выход участницы 2 — после
+        reconciler.mark_left(2, TAKEN_AT + timedelta(seconds=1))
+
+        await reconciler.reconcile(CALL_ID, [200], TAKEN_AT)
+
+        mock_live_sessions.open.assert_not_called()
+        mock_live_sessions.close.assert_not_called()
+
+    async def test_restores_open_sessions_after_restart(
+            self,
+            reconciler: VideoChatReconciler,
+            mock_member_repository: AsyncMock,
+            mock_live_sessions: AsyncMock
+    ):
+        mock_live_sessions.get_member_ids.return_value = {1, 2}
+        mock_member_repository.get_by_ids.return_value = [make_member(1), make_member(2)]
+
+        await reconciler.reconcile(CALL_ID, [100, 200], TAKEN_AT)
+
+        mock_member_repository.get_by_ids.assert_called_once_with([1, 2])
+        mock_live_sessions.open.assert_not_called()
+        mock_live_sessions.close.assert_not_called()
+
+    async def test_start_call_restores_once(
+            self,
+            reconciler: VideoChatReconciler,
+            mock_live_sessions: AsyncMock
+    ):
+        await reconciler.start_call(CALL_ID)
+        await reconciler.start_call(CALL_ID)
+
+        mock_live_sessions.get_member_ids.assert_called_once()
+
+    async def test_close_all_on_discarded_call(
+            self,
+            reconciler: VideoChatReconciler,
+            mock_live_sessions: AsyncMock,
+            mock_counters: AsyncMock,
+            mock_member_repository: AsyncMock
+    ):
+        await reconciler.reconcile(CALL_ID, [100, 200], TAKEN_AT)
+        ended_at = TAKEN_AT + timedelta(hours=1)
+        # Участницы 3 нет в памяти (сессия открыта до рестарта consumer'а)
+        mock_live_sessions.close_all.return_value = [
+            ClosedSession(member_id, TAKEN_AT, ended_at) for member_id in (1, 2, 3)
+        ]
+        mock_member_repository.get_by_ids.return_value = [make_member(3)]
+
+        assert await reconciler.close_all(CALL_ID, ended_at) == 3
+
+        mock_live_sessions.close_all.assert_called_once_with(ended_at)
+        mock_member_repository.get_by_ids.assert_called_with([3])
+        left = mock_counters.record_video_left.call_args_list
+        assert sorted(c.kwargs["member_id"] for c in left) == [1, 2, 3]
+        assert all(c.kwargs["video_joined_at"] == TAKEN_AT for c in left)
+        assert reconciler.open_sessions == {}
+        # Звонок завершён — больше не сверяем и не закрываем повторно
+        assert await reconciler.reconcile(CALL_ID, [100], ended_at) is False
+        assert await reconciler.close_all(CALL_ID, ended_at) == 0
+
+    async def test_forwards_changes_to_dashboard(
+            self,
+            reconciler: VideoChatReconciler,
+            mock_live_sessions: AsyncMock
+    ):
+        dashboard = MagicMock(spec=VideoChatDashboard)
+        dashboard.start_call = AsyncMock()
+        reconciler.dashboard = dashboard
+
+        await reconciler.start_call(CALL_ID)
+        reconciler.mark_joined(make_member(1), TAKEN_AT - timedelta(minutes=5))
+        await reconciler.reconcile(CALL_ID, [200], TAKEN_AT)
+        await reconciler.close_all(CALL_ID, TAKEN_AT)
+
+        dashboard.start_call.assert_called_once_with(CALL_ID, [])
+        assert [c.args[0].id for c in dashboard.joined.call_args_list] == [1, 2]
+        dashboard.left.assert_called_once_with(1)
+        dashboard.end.assert_called_once()
@@ -1,9 +1,10 @@
 """Тесты для StatisticsTemplates."""
-from datetime import datetime
+from datetime import date, datetime, timezone
 from unittest.mock import patch
 
+from services.attendance_analytics import MeetingTimeline
 from services.statistics_service import ManagerStats, WeeklyStats
-from templates import StatisticsTemplates
+from templates import StatisticsTemplates, VideoChatDashboardTemplates
 
 
 class TestFormatManager:
@@ -126,4 +127,60 @@ class TestFormatFullStats:
         assert "Эта неделя (13.01 — 19.01)" in result
         assert "Прошлая неделя (06.01 — 12.01)" in result
         assert "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━" in result
-        assert "🕐 Обновлено: 15.01.2025 14:35" in result
\ No newline at end of file
+        assert "🕐 Обновлено: 15.01.2025 14:35" in result
+
+
+class TestFormatVideoChatDashboard:
+    """Тесты для живого сообщения о встрече."""
+
+    @patch("utils.time.get_tashkent_now")
+    def test_live(self, mock_now):
+        mock_now.return_value = datetime(2025, 1, 17, 14, 12, 5)
+
+        result = VideoChatDashboardTemplates.format_dashboard(
+            present=42, peak=57, managers=[("Айнура", 30), ("Дилноза", 12)]
+        )
+
+        assert "🎥 Встреча идёт" in result
+        assert "👥 Сейчас в звонке: 42" in result
+        assert "📈 Пик: 57" in result
+        assert "👤 Айнура: 30\n👤 Дилноза: 12" in result
+        assert "🕐 Обновлено: 14:12:05" in result
+
+    def test_ended(self):
+        result = VideoChatDashboardTemplates.format_dashboard(present=0, peak=57, managers=[], ended=True)
+
+        assert "🏁 Встреча завершена" in result
+        assert "👤" not in result
+
+
+
+class TestFormatTimeline:
+    """Тесты для /timeline."""
+
+    def test_timeline(self):
+        timeline = MeetingTimeline(
+            started_at=datetime(2025, 1, 17, 9, 0, tzinfo=timezone.utc),
+            bucket_seconds=60,
+            members_count=4,
+            peak=3,
+            peak_at=datetime(2025, 1, 17, 9, 6, tzinfo=timezone.utc),
+            concurrency=[1, 2, 2, 2, 2, 3, 3, 1],
+            retention=[4, 4, 3, 3, 3, 3, 2, 1],
+            drop_offs=[0, 0, 0, 0, 0, 0, 0, 2],
+        )
+
+        result = StatisticsTemplates.format_timeline(date(2025, 1, 17), timeline)
+
+        assert "🎥 Встреча 17.01.2025" in result
+        assert "📈 Пик: 3 в 14:06" in result
+        assert "   14:00 — 2\n   14:05 — 3 (−2)" in result
+        assert "≥ 5 мин: 3 (75%)" in result
+        assert "≥ 60 мин: 0 (0%)" in result
+
+    def test_empty(self):
+        timeline = MeetingTimeline(None, 60, 0, 0, None, [], [], [])
+
+        result = StatisticsTemplates.format_timeline(date(2025, 1, 17), timeline)
+
+        assert "На видео никого не было" in result
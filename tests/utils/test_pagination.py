@@ -0,0 +1,78 @@
+"""Тесты для iter_keyset_pages."""
+from types import SimpleNamespace
+
+import pytest
+
+from utils.pagination import iter_keyset_pages
+
+
+class FakeQuery:
+    """Builder PostgREST поверх списка строк, с лимитом max-rows."""
+
+    def __init__(self, rows: list[dict], requests: list, max_rows: int = 1000):
+        self.rows = rows
+        self.requests = requests
+        self.max_rows = max_rows
+        self.after = None
+        self.limit_value = None
+
+    def gt(self, key: str, value):
+        self.after = value
+        return self
+
+    def order(self, key: str):
+        return self
+
+    def limit(self, value: int):
+        self.limit_value = value
+        return self
+
+    async def execute(self):
+        self.requests.append(self.after)
+        rows = [row for row in self.rows if self.after is None or row["id"] > self.after]
+        return SimpleNamespace(data=rows[:min(self.limit_value, self.max_rows)])
+
+
+class TestIterKeysetPages:
+
+    @pytest.fixture
+    def rows(self) -> list[dict]:
+        return [{"id": i} for i in range(1, 26)]
+
+    @pytest.mark.parametrize("prefetch", [False, True])
+    async def test_reads_all_pages(self, rows: list[dict], prefetch: bool):
+        requests = []
+
+        pages = [
+            [row["id"] for row in page]
+            async for page in iter_keyset_pages(lambda: FakeQuery(rows, requests), page_size=10, prefetch=prefetch)
+        ]
+
+        assert pages == [list(range(1, 11)), list(range(11, 21)), list(range(21, 26))]
+        assert requests == [None, 10, 20]
+
+    async def test_exact_multiple_ends_with_empty_page(self, rows: list[dict]):
+        requests = []
+
+        pages = [page async for page in iter_keyset_pages(lambda: FakeQuery(rows[:20], requests), page_size=10)]
+
+        assert len(pages) == 2
+        assert requests == [None, 10, 20]
+
+    async def test_empty_table(self):
+        requests = []
+
+        pages = [page async for page in iter_keyset_pages(lambda: FakeQuery([], requests), page_size=10)]
+
+        assert pages == []
+        assert requests == [None]
+
+    async def test_stopping_early_cancels_prefetch(self, rows: list[dict]):
+        requests = []
+        pages = iter_keyset_pages(lambda: FakeQuery(rows, requests), page_size=10, prefetch=True)
+
+        async for page in pages:
+            break
+        await pages.aclose()
+
+        assert [row["id"] for row in page] == list(range(1, 11))
@@ -0,0 +1,28 @@
+"""Тесты для TokenBucket."""
+import asyncio
+import time
+
+from utils.rate_limit import TokenBucket
+
+
+class TestTokenBucket:
+
+    async def test_burst_then_rate(self):
+        bucket = TokenBucket(rate=100, capacity=5)
+
+        started = time.monotonic()
+        for _ in range(15):
+            await bucket.acquire()
+        elapsed = time.monotonic() - started
+
+        # 5 сразу, ещё 10 — по 10 мс
+        assert 0.08 <= elapsed < 0.5
+
+    async def test_pause_blocks_everyone(self):
+        bucket = TokenBucket(rate=1000)
+        bucket.pause(0.1)
+
+        started = time.monotonic()
+        await asyncio.gather(bucket.acquire(), bucket.acquire())
+
+        assert time.monotonic() - started >= 0.1
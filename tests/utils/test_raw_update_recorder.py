@@ -0,0 +1,44 @@
+"""Тесты для RawUpdateRecorder."""
+from pyrogram.raw.types import (
+    GroupCallParticipant,
+    InputGroupCall,
+    PeerUser,
+    UpdateGroupCallParticipants,
+)
+
+from utils.raw_update_recorder import RawUpdateRecorder, read_recording
+
+
+def make_update(user_id: int) -> UpdateGroupCallParticipants:
+    return UpdateGroupCallParticipants(
+        call=InputGroupCall(id=555, access_hash=777),
+        participants=[GroupCallParticipant(peer=PeerUser(user_id=user_id), date=0, source=0, just_joined=True)],
+        version=1,
+    )
+
+
+class TestRawUpdateRecorder:
+
+    async def test_round_trip(self, tmp_path):
+        path = str(tmp_path / "meeting.jsonl")
+        recorder = RawUpdateRecorder(path)
+
+        await recorder.record(make_update(100), at=1.5)
+        recorder.write(make_update(200), at=2.5)
+        recorder.close()
+
+        recording = list(read_recording(path))
+
+        assert [at for at, _ in recording] == [1.5, 2.5]
+        assert [u.participants[0].peer.user_id for _, u in recording] == [100, 200]
+        assert recording[0][1].participants[0].just_joined is True
+        assert recording[0][1].call.access_hash == 777
+
+    async def test_appends_to_existing_recording(self, tmp_path):
+        path = str(tmp_path / "meeting.jsonl")
+        for user_id in (100, 200):
+            recorder = RawUpdateRecorder(path)
+            recorder.write(make_update(user_id), at=1.0)
+            recorder.close()
+
+        assert len(list(read_recording(path))) == 2
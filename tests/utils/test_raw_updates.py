@@ -0,0 +1,57 @@
+"""Тесты для RawUpdateDispatcher."""
+from unittest.mock import AsyncMock
+
+from pyrogram.raw.types import (
+    UpdateGroupCall,
+    UpdateGroupCallParticipants,
+    UpdateUserStatus,
+)
+
+from utils.raw_updates import RawUpdateDispatcher
+
+
+def make_update(update_type: type):
+    # Поля TL-объекта обработчикам в этих тестах не нужны
+    return update_type.__new__(update_type)
+
+
+class TestRawUpdateDispatcher:
+
+    async def test_routes_by_exact_type(self):
+        dispatcher = RawUpdateDispatcher()
+        on_call = AsyncMock()
+        on_participants = AsyncMock()
+        dispatcher.route(UpdateGroupCall, on_call)
+        dispatcher.route(UpdateGroupCallParticipants, on_participants)
+
+        update = make_update(UpdateGroupCallParticipants)
+        await dispatcher.dispatch(None, update, {}, {})
+
+        on_participants.assert_called_once_with(update)
+        on_call.assert_not_called()
+
+    async def test_drops_and_counts_unknown_types(self):
+        dispatcher = RawUpdateDispatcher()
+        handler = AsyncMock()
+        dispatcher.route(UpdateGroupCall, handler)
+
+        for _ in range(3):
+            await dispatcher.dispatch(None, make_update(UpdateUserStatus), {}, {})
+        await dispatcher.dispatch(None, make_update(UpdateGroupCall), {}, {})
+
+        handler.assert_called_once()
+        assert dispatcher.stats() == {
+            "routed": {"UpdateGroupCall": 1},
+            "dropped": {"UpdateUserStatus": 3},
+        }
+
+    async def test_failing_handler_does_not_stop_next(self):
+        dispatcher = RawUpdateDispatcher()
+        failing = AsyncMock(side_effect=RuntimeError("Supabase is down"))
+        next_handler = AsyncMock()
+        dispatcher.route(UpdateGroupCall, failing)
+        dispatcher.route(UpdateGroupCall, next_handler)
+
+        await dispatcher.dispatch(None, make_update(UpdateGroupCall), {}, {})
+
+        next_handler.assert_called_once()
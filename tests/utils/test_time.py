@@ -0,0 +1,43 @@
+"""Тесты для parse_period и parse_meeting_date."""
+from datetime import date, datetime
+
+from utils.time import TASHKENT_TZ, parse_meeting_date, parse_period
+
+NOW = datetime(2025, 2, 12, 15, 30, tzinfo=TASHKENT_TZ)  # среда
+
+
+class TestParsePeriod:
+
+    def test_default_is_current_week(self):
+        start, end = parse_period(None, NOW)
+
+        assert start == datetime(2025, 2, 10, tzinfo=TASHKENT_TZ)
+        assert end == datetime(2025, 2, 16, 23, 59, 59, tzinfo=TASHKENT_TZ)
+
+    def test_month(self):
+        start, end = parse_period("month", NOW)
+
+        assert start == datetime(2025, 2, 1, tzinfo=TASHKENT_TZ)
+        assert end == datetime(2025, 2, 28, 23, 59, 59, tzinfo=TASHKENT_TZ)
+
+    def test_explicit_range(self):
+        start, end = parse_period(" 2025-01-01..2025-03-31 ", NOW)
+
+        assert start.date().isoformat() == "2025-01-01"
+        assert end.date().isoformat() == "2025-03-31"
+
+    def test_invalid(self):
+        assert parse_period("yesterday", NOW) is None
+        assert parse_period("2025-03-31..2025-01-01", NOW) is None
+        assert parse_period("2025-13-01..2025-12-31", NOW) is None
+
+
+class TestParseMeetingDate:
+
+    def test_default_is_last_friday(self):
+        assert parse_meeting_date(None, NOW) == date(2025, 2, 7)
+        assert parse_meeting_date("", datetime(2025, 2, 14, 15, 0, tzinfo=TASHKENT_TZ)) == date(2025, 2, 14)
+
+    def test_explicit_and_invalid(self):
+        assert parse_meeting_date(" 2025-01-17 ", NOW) == date(2025, 1, 17)
+        assert parse_meeting_date("friday", NOW) is None
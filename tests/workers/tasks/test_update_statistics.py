@@ -0,0 +1,98 @@
+"""Тесты для задачи update_statistics."""
+import hashlib
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from services.statistics_service import StatisticsService
+from templates import StatisticsTemplates
+from workers.tasks.update_statistics import STATISTICS_MESSAGE_KEY, update_statistics
+
+
+def make_stats():
+    return StatisticsService.build_weekly_stats(
+        datetime(2025, 1, 13), datetime(2025, 1, 19, 23, 59, 59), []
+    )
+
+
+class TestUpdateStatistics:
+
+    @pytest.fixture
+    def context(self) -> MagicMock:
+        context = MagicMock()
+        context.state.redis = AsyncMock()
+        context.state.bot = AsyncMock()
+        return context
+
+    @pytest.fixture
+    def week(self) -> str:
+        return StatisticsService.get_current_week_range()[0].date().isoformat()
+
+    def set_redis_state(self, context, message_id, refresh: dict):
+        async def get(key):
+            return message_id if key == STATISTICS_MESSAGE_KEY else None
+
+        context.state.redis.get.side_effect = get
+        context.state.redis.hgetall.return_value = {
+            k.encode(): v.encode() for k, v in refresh.items()
+        }
+
+    @patch("workers.tasks.update_statistics.StatisticsCounterService.get_version", return_value=7)
+    @patch("workers.tasks.update_statistics.StatisticsService.get_weekly_stats")
+    async def test_skips_when_version_unchanged(self, mock_stats, _version, context, week):
+        self.set_redis_state(context, b"100", {"version": "7", "week": week})
+
+        result = await update_statistics(context)
+
+        assert result is False
+        mock_stats.assert_not_called()
+        context.state.bot.edit_message_text.assert_not_called()
+
+    @patch("workers.tasks.update_statistics.StatisticsCounterService.get_version", return_value=8)
+    @patch("workers.tasks.update_statistics.StatisticsService.get_weekly_stats")
+    async def test_debounces_recent_refresh(self, mock_stats, _version, context, week):
+        self.set_redis_state(context, b"100", {
+            "version": "7", "week": week, "refreshed_at": str(datetime.now().timestamp()),
+        })
+
+        result = await update_statistics(context)
+
+        assert result is False
+        mock_stats.assert_not_called()
+
+    @patch("workers.tasks.update_statistics.StatisticsCounterService.get_version", return_value=8)
+    @patch("workers.tasks.update_statistics.StatisticsSnapshotService.get_or_create")
+    @patch("workers.tasks.update_statistics.StatisticsService.get_weekly_stats")
+    async def test_identical_text_never_reaches_bot_api(
+            self, mock_stats, mock_snapshot, _version, context, week
+    ):
+        stats = make_stats()
+        mock_stats.return_value = stats
+        mock_snapshot.return_value = stats
+        body = StatisticsTemplates.format_stats_body(stats, stats)
+        self.set_redis_state(context, b"100", {
+            "version": "7", "week": week, "text_hash": hashlib.sha1(body.encode()).hexdigest(),
+        })
+
+        result = await update_statistics(context)
+
+        assert result is True
+        context.state.bot.edit_message_text.assert_not_called()
+        assert context.state.redis.hset.call_args.kwargs["mapping"]["version"] == "8"
+
+    @patch("workers.tasks.update_statistics.StatisticsCounterService.get_version", return_value=8)
+    @patch("workers.tasks.update_statistics.StatisticsSnapshotService.get_or_create")
+    @patch("workers.tasks.update_statistics.StatisticsService.get_weekly_stats")
+    async def test_edits_message_when_text_changed(
+            self, mock_stats, mock_snapshot, _version, context, week
+    ):
+        mock_stats.return_value = make_stats()
+        mock_snapshot.return_value = make_stats()
+        self.set_redis_state(context, b"100", {"version": "7", "week": week, "text_hash": "old"})
+
+        result = await update_statistics(context)
+
+        assert result is True
+        context.state.bot.edit_message_text.assert_called_once()
+        assert context.state.bot.edit_message_text.call_args.kwargs["message_id"] == 100
@@ -0,0 +1,55 @@
+"""Постраничное чтение таблиц Supabase."""
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from typing import Any
+
+# PostgREST в Supabase отдаёт не больше max-rows (по умолчанию 1000)
+# строк на запрос: страница больше — обрезается молча
+DEFAULT_PAGE_SIZE = 1000
+
+
+async def iter_keyset_pages(
+        make_query: Callable[[], Any],
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+        key: str = "id"
+) -> AsyncIterator[list[dict]]:
+    """Страницы строк по возрастанию key: WHERE key > последний ORDER BY key LIMIT page_size.
+
+    В отличие от .range() (OFFSET) строки не пропускаются, если
+    прочитанные уже изменились или удалены, и каждая страница — индекс
+    по key, а не перебор offset строк. Конец — страница короче
+    page_size, поэтому page_size не должен превышать max-rows сервера.
+
+    Args:
+        make_query: новый select-запрос с фильтрами (builder изменяемый)
+        page_size: строк на странице
+        prefetch: запросить следующую страницу, пока обрабатывается текущая
+        key: уникальная возрастающая колонка (должна быть в select)
+    """
+    async def fetch(after: Any) -> list[dict]:
+        query = make_query()
+        if after is not None:
+            query = query.gt(key, after)
+        response = await query.order(key).limit(page_size).execute()
+        return response.data
+
+    pending: asyncio.Task | None = None
+    rows = await fetch(None)
+    try:
+        while rows:
+            is_last = len(rows) < page_size
+            if prefetch and not is_last:
+                pending = asyncio.create_task(fetch(rows[-1][key]))
+
+            yield rows
+            if is_last:
+                return
+
+            if pending:
+                rows, pending = await pending, None
+            else:
+                rows = await fetch(rows[-1][key])
+    finally:
+        if pending:
+            pending.cancel()
@@ -0,0 +1,56 @@
+"""Запись raw updates pyrogram в файл — для воспроизведения встречи."""
+import base64
+import json
+import logging
+import time
+from collections.abc import Iterator
+from io import BytesIO
+from typing import Any
+
+from pyrogram.raw.core import TLObject
+
+logger = logging.getLogger(__name__)
+
+
+class RawUpdateRecorder:
+    """Пишет updates в JSONL: {"at": unix time приёма, "tl": base64}.
+
+    Update сохраняется в бинарном виде MTProto (TLObject.write) —
+    компактно и без потерь: при воспроизведении это тот же объект,
+    что пришёл от Telegram. Регистрируется в RawUpdateDispatcher
+    первым маршрутом нужного типа, до настоящего handler'а.
+    """
+
+    FLUSH_EVERY = 100  # строк
+
+    def __init__(self, path: str):
+        self.path = path
+        self.recorded = 0
+        self._file = open(path, "a", encoding="utf-8")
+
+    async def record(self, update: Any, at: float | None = None) -> None:
+        self.write(update, at)
+
+    def write(self, update: Any, at: float | None = None) -> None:
+        line = {
+            "at": time.time() if at is None else at,
+            "tl": base64.b64encode(update.write()).decode(),
+        }
+        self._file.write(json.dumps(line, separators=(",", ":")) + "\n")
+        self.recorded += 1
+        if self.recorded % self.FLUSH_EVERY == 0:
+            self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+        logger.info(f"Recorded {self.recorded} raw updates to {self.path}")
+
+
+def read_recording(path: str) -> Iterator[tuple[float, Any]]:
+    """Updates из записи: (unix time приёма, TL-объект)."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            yield entry["at"], TLObject.read(BytesIO(base64.b64decode(entry["tl"])))
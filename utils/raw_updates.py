@@ -0,0 +1,54 @@
+"""Маршрутизация raw updates pyrogram по типу TL-объекта."""
+import logging
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+RawUpdateHandler = Callable[[Any], Awaitable[None]]
+
+
+class RawUpdateDispatcher:
+    """Один on_raw_update на весь userbot, маршруты — по точному типу.
+
+    Userbot получает все MTProto updates аккаунта (сообщения, статусы,
+    typing...), а нужны два-три типа. Ненужные отбрасываются одним
+    поиском в dict: без корутин обработчиков, без форматирования строк,
+    только +1 в счётчике отброшенных типов.
+    """
+
+    def __init__(self):
+        self._routes: dict[type, list[RawUpdateHandler]] = {}
+        self.dropped: Counter[type] = Counter()
+        self.routed: Counter[type] = Counter()
+
+    def route(self, update_type: type, handler: RawUpdateHandler) -> None:
+        """Отправлять updates типа update_type в handler (в порядке регистрации)."""
+        self._routes.setdefault(update_type, []).append(handler)
+
+    async def dispatch(self, client, update, users, chats) -> None:
+        """Callback для userbot.on_raw_update()."""
+        update_type = type(update)
+        handlers = self._routes.get(update_type)
+        if handlers is None:
+            self.dropped[update_type] += 1
+            return
+
+        self.routed[update_type] += 1
+        for handler in handlers:
+            try:
+                await handler(update)
+            except Exception:
+                # Ошибка прогрева кэша не должна терять join/left участниц
+                logger.exception("Raw update handler failed for %s", update_type.__name__)
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Счётчики по именам типов — для логов и отладки."""
+        return {
+            "routed": {t.__name__: count for t, count in self.routed.items()},
+            "dropped": {t.__name__: count for t, count in self.dropped.most_common()},
+        }
+
+    def log_stats(self) -> None:
+        logger.info("Raw updates: %s", self.stats())
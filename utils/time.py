@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from zoneinfo import ZoneInfo
 
 TASHKENT_TZ = ZoneInfo("Asia/Tashkent")  # UTC+5
@@ -13,4 +13,57 @@ KYIV_TZ = ZoneInfo("Europe/Kyiv")  # UTC+2
 
 def get_kyiv_now() -> datetime:
     """Текущее время в Киеве."""
-    return datetime.now(KYIV_TZ)
\ No newline at end of file
+    return datetime.now(KYIV_TZ)
+
+def get_week_start(moment: datetime) -> date:
+    """Понедельник недели (по Ташкенту), в которую входит moment."""
+    local = moment.astimezone(TASHKENT_TZ)
+    return local.date() - timedelta(days=local.weekday())
+
+
+def parse_period(text: str | None, now: datetime) -> tuple[datetime, datetime] | None:
+    """Период для статистики: week | month | YYYY-MM-DD..YYYY-MM-DD.
+
+    Границы нормализуются до целых дней (00:00:00 — 23:59:59),
+    пустой текст — текущая неделя.
+
+    Returns:
+        (start, end) или None если формат не распознан
+    """
+    text = (text or "week").strip().lower()
+
+    if text == "week":
+        start = now.date() - timedelta(days=now.weekday())
+        end = start + timedelta(days=6)
+    elif text == "month":
+        start = now.date().replace(day=1)
+        end = (start + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+    else:
+        try:
+            first, last = text.split("..")
+            start, end = date.fromisoformat(first.strip()), date.fromisoformat(last.strip())
+        except ValueError:
+            return None
+        if end < start:
+            return None
+
+    return (
+        datetime.combine(start, datetime.min.time(), tzinfo=now.tzinfo),
+        datetime.combine(end, datetime.max.time(), tzinfo=now.tzinfo).replace(microsecond=0),
+    )
+
+
+def parse_meeting_date(text: str | None, now: datetime) -> date | None:
+    """Дата встречи: YYYY-MM-DD, пустой текст — последняя пятница (включая сегодня).
+
+    Returns:
+        дата или None если формат не распознан
+    """
+    if not text or not text.strip():
+        today = now.date()
+        return today - timedelta(days=(today.weekday() - 4) % 7)
+
+    try:
+        return date.fromisoformat(text.strip())
+    except ValueError:
+        return None
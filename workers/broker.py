@@ -10,6 +10,8 @@ from taskiq_redis import ListQueueBroker
 from supabase import acreate_client
 
 from config import get_settings
+from services.cleanup_checkpoint import CleanupCheckpoint
+from utils.time import get_tashkent_now
 
 handler = colorlog.StreamHandler()
 handler.setFormatter(colorlog.ColoredFormatter(
@@ -68,6 +70,13 @@ async def startup(state: TaskiqState):
     state.bot = Bot(token=settings.bot_token)
     logger.info("Bot connected")
 
+    # Очистка группы прервана рестартом — cron повторит её только через неделю
+    checkpoint = CleanupCheckpoint(state.redis, CleanupCheckpoint.week_of(get_tashkent_now()))
+    if await checkpoint.is_unfinished():
+        from workers.tasks.cleanup_group import cleanup_group
+        await cleanup_group.kiq(resume=True)
+        logger.warning("Unfinished group cleanup found, resume scheduled")
+
 
 @broker.on_event(TaskiqEvents.WORKER_SHUTDOWN)
 async def shutdown(state: TaskiqState):
@@ -6,4 +6,6 @@ from workers.tasks.update_meeting_announcement import (  # noqa: F401
 )
 from workers.tasks.cleanup_group import cleanup_group  # noqa: F401
 from workers.tasks.send_application_button import send_application_button  # noqa: F401
-from workers.tasks.update_statistics import update_statistics # noqa: F401
\ No newline at end of file
+from workers.tasks.update_statistics import update_statistics # noqa: F401
+from workers.tasks.reconcile_statistics import reconcile_statistics  # noqa: F401
+from workers.tasks.refresh_statistics_rollups import refresh_statistics_rollups  # noqa: F401
@@ -7,7 +7,11 @@ from taskiq import Context, TaskiqDepends
 from workers.broker import broker
 from repositories.member_repository import MemberRepository
 from repositories.invite_link_repository import InviteLinkRepository
+from services.member_lookup_service import MemberLookupService
+from services.member_purge_service import MemberPurgeService
+from services.cleanup_checkpoint import CleanupCheckpoint
 from config import get_settings
+from utils.time import get_tashkent_now
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -20,33 +24,84 @@ APPLICATION_MESSAGE_REDIS_KEY = "meeting_bot:application_message"
         "cron_offset": "Asia/Tashkent"
     }]
 )
-async def cleanup_group(context: Context = TaskiqDepends()) -> dict:
-    """Удалить всех участниц из группы и очистить неиспользованные ссылки."""
+async def cleanup_group(resume: bool = False, context: Context = TaskiqDepends()) -> dict:
+    """Удалить всех участниц из группы и очистить неиспользованные ссылки.
 
+    Прогресс сохраняется в CleanupCheckpoint: прерванная очистка
+    продолжается при старте worker'а (resume=True) с того места, где
+    остановилась.
+    """
+
+    week = CleanupCheckpoint.week_of(get_tashkent_now())
+    checkpoint = CleanupCheckpoint(context.state.redis, week)
+
+    # Упавший worker отпускает lock через LOCK_TTL — при resume его дожидаемся
+    wait = CleanupCheckpoint.LOCK_TTL + 10 if resume else 0
+    async with checkpoint.lock(wait=wait) as locked:
+        if not locked:
+            logger.warning("Cleanup is already running, skipping")
+            return {"skipped": True}
+
+        if resume and not await checkpoint.is_unfinished():
+            logger.info("Cleanup was already finished, nothing to resume")
+            return {"skipped": True}
+
+        result = await _cleanup(context, checkpoint)
+        await checkpoint.finish()
+
+    return result
+
+
+async def _cleanup(context: Context, checkpoint: CleanupCheckpoint) -> dict:
     result = {
         "members_kicked": 0,
+        "members_failed": 0,
         "links_deleted": 0,
         "application_message_deleted": False
     }
 
-    # 1. Kick участниц из группы
+    # 1. Kick участниц, которые сейчас в группе (текущая когорта)
+    resumed = await checkpoint.begin(get_tashkent_now().isoformat())
+    processed = await checkpoint.get_processed() if resumed else set()
+
     member_repository = MemberRepository(supabase=context.state.supabase)
-    members = await member_repository.get_all()
 
-    for member in members:
-        try:
-            await context.state.bot.ban_chat_member(
-                chat_id=settings.meeting_group_id,
-                user_id=member.telegram_id
-            )
-            await context.state.bot.unban_chat_member(
-                chat_id=settings.meeting_group_id,
-                user_id=member.telegram_id
-            )
-            result["members_kicked"] += 1
-            logger.debug(f"Kicked {member.first_name} ({member.telegram_id})")
-        except Exception as e:
-            logger.error(f"Failed to kick {member.telegram_id}: {e}")
+    async def on_processed(kicked: list[int], failed: list[int], permanent: list[int]) -> None:
+        # Сначала БД: без in_group = false кикнутая попадёт в следующую очистку.
+        # Постоянные ошибки (уже не в группе, админ) тоже снимаем — иначе
+        # их пытались бы кикнуть каждое воскресенье
+        await member_repository.mark_left_group(kicked + permanent)
+        await checkpoint.mark_processed(kicked + failed)
+
+    purge_service = MemberPurgeService(
+        bot=context.state.bot,
+        chat_id=settings.meeting_group_id,
+        rate=settings.purge_rate_per_second,
+        concurrency=settings.purge_concurrency,
+        on_processed=on_processed
+    )
+
+    # Страница за страницей: в памяти одна страница участниц, а не вся когорта
+    skipped = 0
+    async for members in member_repository.iter_in_group(prefetch=True):
+        telegram_ids = [
+            member.telegram_id for member in members
+            if member.telegram_id not in processed
+        ]
+        skipped += len(members) - len(telegram_ids)
+
+        purge = await purge_service.purge(telegram_ids)
+        result["members_kicked"] += purge.kicked
+        result["members_failed"] += len(purge.failed)
+
+    if resumed:
+        logger.info(f"Resumed cleanup: {skipped} members were already processed")
+
+    # Кэш участниц в боте больше не актуален
+    try:
+        await MemberLookupService.publish_invalidation(context.state.redis)
+    except Exception as e:
+        logger.error(f"Failed to invalidate member lookup cache: {e}")
 
     # 2. Удалить неиспользованные ссылки из БД
     invite_link_repository = InviteLinkRepository(supabase=context.state.supabase)
@@ -69,6 +124,7 @@ async def cleanup_group(context: Context = TaskiqDepends()) -> dict:
 
     logger.debug(
         f"Cleanup completed: {result['members_kicked']} kicked, "
+        f"{result['members_failed']} failed, "
         f"{result['links_deleted']} unused links deleted"
     )
 
@@ -0,0 +1,33 @@
+"""Задача сверки счётчиков статистики с БД."""
+import logging
+
+from taskiq import Context, TaskiqDepends
+
+from workers.broker import broker
+from repositories.statistics_repository import StatisticsRepository
+from services.statistics_counter_service import StatisticsCounterService
+from services.statistics_service import StatisticsService
+
+logger = logging.getLogger(__name__)
+
+
+@broker.task(
+    schedule=[{
+        "cron": "*/30 * * * *",  # Каждые 30 минут
+        "cron_offset": "Asia/Tashkent"
+    }]
+)
+async def reconcile_statistics(context: Context = TaskiqDepends()) -> bool:
+    """Пересобрать счётчики текущей недели из БД."""
+    try:
+        repository = StatisticsRepository(supabase=context.state.supabase)
+        counter_service = StatisticsCounterService(redis=context.state.redis)
+
+        start, end = StatisticsService.get_current_week_range()
+        await counter_service.reconcile(repository, start, end)
+
+        return True
+
+    except Exception as e:
+        logger.error(f"Failed to reconcile statistics counters: {e}")
+        return False
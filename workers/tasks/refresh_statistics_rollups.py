@@ -0,0 +1,39 @@
+"""Задача обновления дневных агрегатов статистики."""
+import logging
+from datetime import timedelta
+
+from taskiq import Context, TaskiqDepends
+
+from workers.broker import broker
+from repositories.statistics_repository import StatisticsRepository
+from utils.time import get_tashkent_now, get_week_start
+
+logger = logging.getLogger(__name__)
+
+
+@broker.task(
+    schedule=[{
+        "cron": "*/10 * * * *",  # Каждые 10 минут
+        "cron_offset": "Asia/Tashkent"
+    }]
+)
+async def refresh_statistics_rollups(context: Context = TaskiqDepends()) -> bool:
+    """Пересчитать дневные агрегаты прошлой и текущей недели.
+
+    Видео участницы засчитывается в неделю её прихода, поэтому
+    раньше прошлой недели данные уже не меняются.
+    """
+    try:
+        repository = StatisticsRepository(supabase=context.state.supabase)
+
+        today = get_tashkent_now()
+        start_day = get_week_start(today) - timedelta(days=7)
+
+        rows = await repository.refresh_daily_rollups(start_day, today.date())
+        logger.debug(f"Statistics rollups refreshed: {start_day}..{today.date()}, rows={rows}")
+
+        return True
+
+    except Exception as e:
+        logger.error(f"Failed to refresh statistics rollups: {e}")
+        return False
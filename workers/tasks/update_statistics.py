@@ -1,12 +1,16 @@
 """Задача обновления статистики."""
+import hashlib
 import logging
+import time
 
 from taskiq import Context, TaskiqDepends
 from aiogram.exceptions import TelegramBadRequest
 
 from workers.broker import broker
 from repositories.statistics_repository import StatisticsRepository
+from services.statistics_counter_service import StatisticsCounterService
 from services.statistics_service import StatisticsService
+from services.statistics_snapshot_service import StatisticsSnapshotService
 from templates import StatisticsTemplates
 from config import get_settings
 
@@ -14,35 +18,72 @@ logger = logging.getLogger(__name__)
 settings = get_settings()
 
 STATISTICS_MESSAGE_KEY = "meeting:statistics_message_id"
+# Что уже показано в сообщении: version, week, text_hash, refreshed_at
+STATISTICS_REFRESH_KEY = "meeting:statistics_refresh"
 
 
 @broker.task(
     schedule=[{
-        "cron": "*/5 * * * *",  # Каждые 5 минут
-        "cron_offset": "Asia/Tashkent"
+        "interval": 10,  # Дешёвая проверка версии каждые 10 секунд
     }]
 )
 async def update_statistics(context: Context = TaskiqDepends()) -> bool:
-    """Обновить сообщение со статистикой."""
+    """Обновить сообщение со статистикой, если данные изменились."""
     try:
         # Инициализация
+        redis = context.state.redis
         repository = StatisticsRepository(supabase=context.state.supabase)
-        service = StatisticsService(repository=repository)
+        counter_service = StatisticsCounterService(redis=redis)
+        service = StatisticsService(
+            repository=repository,
+            max_concurrency=settings.statistics_max_concurrency,
+            counter_service=counter_service
+        )
+        snapshot_service = StatisticsSnapshotService(redis=redis)
 
-        # Получаем статистику
         current_start, current_end = service.get_current_week_range()
+        week = current_start.date().isoformat()
+
+        # Изменилось ли что-нибудь с прошлого обновления?
+        version = await counter_service.get_version()
+        message_id = await redis.get(STATISTICS_MESSAGE_KEY)
+        refresh = {
+            k.decode(): v.decode()
+            for k, v in (await redis.hgetall(STATISTICS_REFRESH_KEY)).items()
+        }
+
+        if (
+            message_id
+            and refresh.get("version") == str(version)
+            and refresh.get("week") == week
+        ):
+            return False
+
+        # Debounce: не чаще одного обновления в N секунд
+        refreshed_at = float(refresh.get("refreshed_at", 0))
+        if message_id and time.time() - refreshed_at < settings.statistics_refresh_debounce_seconds:
+            logger.debug("Statistics changed, refresh debounced")
+            return False
+
+        # Получаем статистику
         previous_start, previous_end = service.get_previous_week_range()
 
         current_stats = await service.get_weekly_stats(current_start, current_end)
-        previous_stats = await service.get_weekly_stats(previous_start, previous_end)
+        # Прошлая неделя закрыта — берём снимок, считаем только один раз
+        previous_stats = await snapshot_service.get_or_create(
+            service, previous_start, previous_end
+        )
 
-        # Форматируем текст
-        text = StatisticsTemplates.format_full_stats(current_stats, previous_stats)
+        # Одинаковый текст в Bot API не отправляем
+        body = StatisticsTemplates.format_stats_body(current_stats, previous_stats)
+        text_hash = hashlib.sha1(body.encode()).hexdigest()
 
-        # Проверяем есть ли сообщение в Redis
-        message_id = await context.state.redis.get(STATISTICS_MESSAGE_KEY)
+        if message_id and refresh.get("text_hash") == text_hash:
+            logger.debug(f"Statistics not changed, message_id={int(message_id)}")
+        elif message_id:
+            # Форматируем текст
+            text = StatisticsTemplates.format_full_stats(current_stats, previous_stats)
 
-        if message_id:
             # Редактируем существующее
             try:
                 await context.state.bot.edit_message_text(
@@ -50,10 +91,10 @@ async def update_statistics(context: Context = TaskiqDepends()) -> bool:
                     message_id=int(message_id),
                     text=text,
                 )
-                logger.debug(f"Statistics updated, message_id={message_id}")
+                logger.debug(f"Statistics updated, message_id={int(message_id)}")
             except TelegramBadRequest as e:
                 if "is not modified" in e.message:
-                    logger.debug(f"Statistics not changed, message_id={message_id}")
+                    logger.debug(f"Statistics not changed, message_id={int(message_id)}")
                 else:
                     # Любая другая BadRequest (удалено, нет прав и т.д.) — создаём новое
                     logger.warning(f"Cannot edit message: {e.message}, creating new")
@@ -63,8 +104,16 @@ async def update_statistics(context: Context = TaskiqDepends()) -> bool:
                 raise
         else:
             # Создаём новое
+            text = StatisticsTemplates.format_full_stats(current_stats, previous_stats)
             await _create_new_message(context, text)
 
+        await redis.hset(STATISTICS_REFRESH_KEY, mapping={
+            "version": str(version),
+            "week": week,
+            "text_hash": text_hash,
+            "refreshed_at": str(time.time()),
+        })
+
         return True
 
     except Exception as e:
@@ -80,4 +129,4 @@ async def _create_new_message(context: Context, text: str) -> None:
     )
 
     await context.state.redis.set(STATISTICS_MESSAGE_KEY, str(message.message_id))
-    logger.debug(f"Statistics created, message_id={message.message_id}")
\ No newline at end of file
+    logger.debug(f"Statistics created, message_id={message.message_id}")
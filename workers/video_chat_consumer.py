@@ -0,0 +1,175 @@
+"""Consumer событий Video Chat.
+
+Запуск: python -m workers.video_chat_consumer
+
+Один процесс: события одной участницы (join, left, сверка)
+обрабатываются строго по порядку. Taskiq worker для этого не подходит —
+задачи там выполняются параллельно, и left может обогнать join.
+"""
+import asyncio
+import logging
+import signal
+import colorlog
+
+from aiogram import Bot
+from redis.asyncio import from_url as redis_from_url
+from supabase import acreate_client, AsyncClient
+
+from config import get_settings
+from repositories.invite_link_repository import InviteLinkRepository
+from repositories.member_repository import MemberRepository
+from repositories.statistics_repository import StatisticsRepository
+from repositories.video_chat_attendance_repository import VideoChatAttendanceRepository
+from services.attendance_journal import AttendanceJournal
+from services.attendance_write_buffer import AttendanceWriteBuffer
+from services.live_sessions import LiveSessionStore
+from services.meeting_timeline_service import MeetingTimelineService
+from services.member_lookup_service import MemberLookupService
+from services.redis_listener import RedisChannelListener
+from services.statistics_counter_service import StatisticsCounterService
+from services.video_chat_dashboard import VideoChatDashboard
+from services.video_chat_event_processor import VideoChatEventProcessor
+from services.video_chat_event_queue import VideoChatEventQueue
+from services.video_chat_reconciler import VideoChatReconciler
+
+handler = colorlog.StreamHandler()
+handler.setFormatter(colorlog.ColoredFormatter(
+    "%(log_color)s%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    log_colors={
+        "DEBUG": "green",
+        "INFO": "cyan",
+        "WARNING": "yellow",
+        "ERROR": "red",
+        "CRITICAL": "red,bg_white",
+    }
+))
+
+logging.basicConfig(
+    level=logging.DEBUG,
+    handlers=[handler],
+    force=True
+)
+logging.getLogger("httpx").setLevel(logging.WARNING)
+logging.getLogger("httpcore").setLevel(logging.WARNING)
+logging.getLogger("hpack").setLevel(logging.WARNING)
+logger = logging.getLogger(__name__)
+
+
+async def main():
+    settings = get_settings()
+    logger.info("Starting video chat consumer...")
+
+    supabase: AsyncClient = await acreate_client(
+        settings.supabase_url,
+        settings.supabase_key
+    )
+    redis = redis_from_url(settings.redis_url)
+    bot = Bot(token=settings.bot_token)
+
+    # 1. Создаём repository
+    member_repository = MemberRepository(
+        supabase=supabase
+    )
+    video_chat_attendance_repository = VideoChatAttendanceRepository(
+        supabase=supabase
+    )
+    invite_link_repository = InviteLinkRepository(
+        supabase=supabase
+    )
+    statistics_repository = StatisticsRepository(
+        supabase=supabase
+    )
+
+    # 2. Создаём service
+    member_lookup_service = MemberLookupService(
+        repository=member_repository
+    )
+    statistics_counter_service = StatisticsCounterService(
+        redis=redis
+    )
+    # Сессии Video Chat: открытые в Redis hash → завершённые
+    # в журнал (Redis Stream) → пачки в Supabase
+    live_sessions = LiveSessionStore(
+        redis=redis
+    )
+    attendance_journal = AttendanceJournal(
+        redis=redis,
+        read_count=settings.attendance_batch_size
+    )
+    attendance_write_buffer = AttendanceWriteBuffer(
+        repository=video_chat_attendance_repository,
+        flush_interval=settings.attendance_flush_interval_seconds,
+        batch_size=settings.attendance_batch_size,
+        max_attempts=None,  # из журнала ничего не теряем, ждём Supabase
+        on_flushed=attendance_journal.ack
+    )
+    # Живое сообщение о встрече в ветке команд
+    video_chat_dashboard = VideoChatDashboard(
+        bot=bot,
+        redis=redis,
+        invite_link_repository=invite_link_repository,
+        statistics_repository=statistics_repository,
+        chat_id=settings.commands_group_id,
+        thread_id=settings.commands_thread_id,
+        min_edit_interval=settings.video_chat_dashboard_edit_interval_seconds
+    )
+    video_chat_reconciler = VideoChatReconciler(
+        member_repository=member_repository,
+        member_lookup_service=member_lookup_service,
+        live_sessions=live_sessions,
+        statistics_counter_service=statistics_counter_service,
+        dashboard=video_chat_dashboard
+    )
+    # Конец звонка разрешает сохранить таймлайн встречи
+    meeting_timeline_service = MeetingTimelineService(
+        redis=redis,
+        repository=video_chat_attendance_repository,
+        live_sessions=live_sessions
+    )
+    video_chat_event_processor = VideoChatEventProcessor(
+        member_lookup_service=member_lookup_service,
+        live_sessions=live_sessions,
+        statistics_counter_service=statistics_counter_service,
+        reconciler=video_chat_reconciler,
+        meeting_timeline_service=meeting_timeline_service
+    )
+    video_chat_event_queue = VideoChatEventQueue(
+        redis=redis
+    )
+
+    # Бот (on_member_joined) и worker (cleanup_group) просят сбросить кэш
+    redis_listener = RedisChannelListener(redis=redis)
+    redis_listener.subscribe(
+        MemberLookupService.INVALIDATE_CHANNEL,
+        member_lookup_service.handle_invalidation
+    )
+
+    # 3. Запускаем
+    redis_listener.start()
+    attendance_write_buffer.start()
+    attendance_journal.start(attendance_write_buffer)
+    video_chat_dashboard.start()
+    consume_task = asyncio.create_task(
+        video_chat_event_queue.consume(video_chat_event_processor.process)
+    )
+    # docker stop присылает SIGTERM — завершаемся через finally
+    asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, consume_task.cancel)
+
+    logger.info("Video chat consumer is running. Press Ctrl+C to stop.")
+    try:
+        await consume_task
+    except asyncio.CancelledError:
+        pass
+    finally:
+        logger.info("Shutting down...")
+        await redis_listener.stop()
+        await video_chat_dashboard.stop()
+        await attendance_journal.stop()
+        await attendance_write_buffer.stop()
+        await bot.session.close()
+        await redis.close()
+        await supabase.auth.sign_out()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())